@@ -0,0 +1,56 @@
+"""JSON and artifact file helpers shared by the CLI and server modules."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+
+JSON_SNAPSHOT_CACHE_MAXSIZE = 512
+
+# Artifact sink; the default writes to disk, tests can collect into memory instead.
+TextWriter = Callable[[Path, str], None]
+
+
+def orjson_module() -> Any | None:
+    try:
+        import orjson  # type: ignore
+    except ImportError:
+        return None
+    return orjson
+
+
+def load_json(path: Path) -> dict[str, Any]:
+    orjson = orjson_module()
+    if orjson is not None:
+        payload = path.read_bytes()
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            # Let the stdlib decoder handle what orjson rejects (NaN, huge ints) or report the error.
+            return json.loads(payload.decode("utf-8"))
+    with path.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+@lru_cache(maxsize=JSON_SNAPSHOT_CACHE_MAXSIZE)
+def _load_json_snapshot(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    return load_json(Path(path))
+
+
+def load_json_memoized(path: Path) -> dict[str, Any]:
+    # Parsed once per (path, mtime, size); the result is shared, so callers must not mutate it.
+    stat = path.stat()
+    return _load_json_snapshot(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def json_text(payload: dict[str, Any]) -> str:
+    return json.dumps(payload, indent=2, ensure_ascii=False) + "\n"
+
+
+def write_text(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write(content)
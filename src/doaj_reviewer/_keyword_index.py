@@ -0,0 +1,128 @@
+"""Single-pass literal keyword sweep used by the basic rule evaluators."""
+
+from __future__ import annotations
+
+from typing import Any
+
+# (keyword, hint tag) pairs. Keywords are lowercase literals matched on word
+# boundaries, mirroring the ``\bkeyword\b`` regexes they replace. Groups that
+# are counted per keyword use one tag per keyword (variants share a tag).
+KEYWORD_HINTS: tuple[tuple[str, str], ...] = (
+    ("open access", "oa_positive"),
+    ("freely available", "oa_positive"),
+    ("free access", "oa_positive"),
+    ("without charge", "oa_positive"),
+    ("read", "oa_reuse_read"),
+    ("download", "oa_reuse_download"),
+    ("copy", "oa_reuse_copy"),
+    ("distribute", "oa_reuse_distribute"),
+    ("distribution", "oa_reuse_distribute"),
+    ("reuse", "oa_reuse_reuse"),
+    ("reproduce", "oa_reuse_reproduce"),
+    ("link to", "oa_reuse_link_to"),
+    ("text and data mining", "oa_reuse_tdm"),
+    ("creative commons", "oa_license"),
+    ("cc by", "oa_license"),
+    ("cc by-sa", "oa_license"),
+    ("cc by-nd", "oa_license"),
+    ("cc by-nc", "oa_license"),
+    ("cc by-nc-sa", "oa_license"),
+    ("cc by-nc-nd", "oa_license"),
+    ("cc0", "oa_license"),
+    ("public domain", "oa_license"),
+    ("subscription required", "oa_negative"),
+    ("paywall", "oa_negative"),
+    ("embargo period", "oa_negative"),
+    ("members only", "oa_negative"),
+    ("purchase", "oa_negative"),
+    ("access limited to subscribers", "oa_negative"),
+    ("no open access", "oa_negative"),
+    ("all rights reserved", "lic_ard"),
+    ("peer review", "pr_positive"),
+    ("peer-reviewed", "pr_positive"),
+    ("double blind", "pr_positive"),
+    ("double anonymous", "pr_positive"),
+    ("single blind", "pr_positive"),
+    ("anonymous peer review", "pr_positive"),
+    ("open peer review", "pr_positive"),
+    ("external reviewer", "pr_positive"),
+    ("blind peer review", "pr_positive"),
+    ("review process", "pr_process_review_process"),
+    ("reviewed by", "pr_process_reviewed_by"),
+    ("editorial decision", "pr_process_editorial_decision"),
+    ("revision", "pr_process_revision"),
+    ("manuscript", "pr_process_manuscript"),
+    ("acceptance", "pr_process_acceptance"),
+    ("not peer reviewed", "pr_fail"),
+    ("no peer review", "pr_fail"),
+    ("editorial review", "pr_editorial"),
+    ("creative commons", "lic_cc_creative_commons"),
+    ("cc", "lic_cc_cc"),
+    ("cc0", "lic_cc_cc0"),
+    ("public domain", "lic_cc_public_domain"),
+    ("publisher's own license", "lic_publisher"),
+    ("publishers own license", "lic_publisher"),
+    ("journal license", "lic_publisher"),
+    ("license terms", "lic_publisher"),
+    ("licensing policy", "lic_publisher"),
+    ("no license", "lic_negative"),
+    ("without license", "lic_negative"),
+)
+
+
+def _keyword_tags(pairs: tuple[tuple[str, str], ...]) -> dict[str, frozenset[str]]:
+    tags: dict[str, set[str]] = {}
+    for keyword, tag in pairs:
+        tags.setdefault(keyword, set()).add(tag)
+    return {keyword: frozenset(values) for keyword, values in tags.items()}
+
+
+def _build_automaton(tags: dict[str, frozenset[str]]) -> Any | None:
+    try:
+        import ahocorasick  # type: ignore
+    except ImportError:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, keyword_tags in tags.items():
+        automaton.add_word(keyword, (len(keyword), keyword_tags))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_TAGS = _keyword_tags(KEYWORD_HINTS)
+_AUTOMATON = _build_automaton(_KEYWORD_TAGS)
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _on_word_boundaries(text: str, start: int, end: int) -> bool:
+    if start > 0 and _is_word_char(text[start - 1]):
+        return False
+    if end < len(text) and _is_word_char(text[end]):
+        return False
+    return True
+
+
+def scan(text: str) -> set[str]:
+    hints: set[str] = set()
+    if _AUTOMATON is not None:
+        for last_index, (length, keyword_tags) in _AUTOMATON.iter(text):
+            if keyword_tags <= hints:
+                continue
+            end = last_index + 1
+            if _on_word_boundaries(text, end - length, end):
+                hints |= keyword_tags
+        return hints
+
+    for keyword, keyword_tags in _KEYWORD_TAGS.items():
+        if keyword_tags <= hints:
+            continue
+        start = text.find(keyword)
+        while start != -1:
+            if _on_word_boundaries(text, start, start + len(keyword)):
+                hints |= keyword_tags
+                break
+            start = text.find(keyword, start + 1)
+    return hints
@@ -0,0 +1,18 @@
+"""Process-pool dispatch shared by the golden and UAT runners."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Sequence
+
+
+def map_in_processes(
+    func: Callable[..., Any],
+    items: Sequence[Any],
+    *shared: Any,
+    max_workers: int,
+) -> list[Any]:
+    # func(item, *shared) per item, results in input order; func must be module-level and arguments picklable.
+    with ProcessPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+        return list(executor.map(func, items, *(repeat(value) for value in shared)))
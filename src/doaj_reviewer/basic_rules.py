@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+import os
 import re
-from typing import Any
+from typing import Any, Callable, Iterator
+
+from ._keyword_index import scan as scan_keywords
 
 INSTITUTION_KEYWORDS = (
     "university",
@@ -56,6 +61,72 @@ PEER_REVIEW_TYPE_PATTERNS = {
 }
 
 
+REGEX_ENGINE_ENV = "DOAJ_REVIEWER_REGEX_ENGINE"
+
+
+def _re2_module() -> Any | None:
+    # Opt-in only: RE2's \b is ASCII-only, so results can differ from `re` around non-ASCII letters.
+    if os.environ.get(REGEX_ENGINE_ENV, "").strip().lower() != "re2":
+        return None
+    try:
+        import re2  # type: ignore
+    except ImportError:
+        return None
+    return re2
+
+
+_RE2 = _re2_module()
+
+
+def _compile_signal(pattern: str) -> re.Pattern[str]:
+    if _RE2 is not None:
+        try:
+            return _RE2.compile(pattern, _RE2.IGNORECASE)
+        except Exception:
+            pass
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _compile_patterns(patterns: list[str]) -> tuple[re.Pattern[str], ...]:
+    return tuple(_compile_signal(pattern) for pattern in patterns)
+
+
+def _compile_any(patterns: list[str]) -> tuple[re.Pattern[str], ...]:
+    # Groups that are only tested with _contains_any become one alternation, so a
+    # single scan answers whether any pattern matches. Counted groups stay separate.
+    if all(pattern.startswith(r"\b") for pattern in patterns):
+        combined = r"\b(?:" + "|".join(f"(?:{pattern[2:]})" for pattern in patterns) + ")"
+    else:
+        combined = "|".join(f"(?:{pattern})" for pattern in patterns)
+    return (_compile_signal(combined),)
+
+
+_LICENSE_CLAIM_RES = [
+    (label, re.compile(pattern + r"(?:\s*(?:license)?\s*(?:version)?\s*(\d(?:\.\d+)?))?", re.IGNORECASE))
+    for label, pattern in LICENSE_CLAIM_ORDERED_PATTERNS
+]
+_PEER_REVIEW_TYPE_RES = [
+    (review_type, re.compile(pattern, re.IGNORECASE)) for review_type, pattern in PEER_REVIEW_TYPE_PATTERNS.items()
+]
+_CREATIVE_COMMONS_SIGNALS = _compile_any([r"\bcreative commons\b"])
+_LICENSE_WORD_SIGNALS = _compile_any([r"\blicen[sc]e\b"])
+_JOURNAL_LICENSE_WORDING_SIGNALS = _compile_any(
+    [r"\bjournal licen[sc]e\b", r"\blicen[sc]e terms\b", r"\blicensing policy\b"]
+)
+_SPACE_RE = re.compile(r"\s+")
+_NON_ALNUM_SPACE_RE = re.compile(r"[^a-z0-9 ]")
+_PUBLISHER_NAME_RES = _compile_patterns(
+    [
+        r"\bpublished by\s*[:\-]?\s*([^\n\.]{4,100})",
+        r"\bpublisher\s*[:\-]?\s*([^\n\.]{4,100})",
+    ]
+)
+_ISSN_RE = re.compile(r"\b\d{4}-\d{3}[0-9Xx]\b")
+_ISSN_NON_DIGIT_RE = re.compile(r"[^0-9Xx]")
+_ELECTRONIC_ISSN_RE = re.compile(r"\b(e[-\s]?issn|online|electronic)\b")
+_PRINT_ISSN_RE = re.compile(r"\b(p[-\s]?issn|print)\b")
+
+
 def _get_policy_urls(submission: dict[str, Any], rule_hint: str) -> list[str]:
     source_urls = submission.get("source_urls", {})
     if not isinstance(source_urls, dict):
@@ -66,23 +137,46 @@ def _get_policy_urls(submission: dict[str, Any], rule_hint: str) -> list[str]:
     return [str(url) for url in urls if isinstance(url, str) and url]
 
 
-def _get_policy_pages(submission: dict[str, Any], rule_hint: str) -> list[dict[str, str]]:
+_POLICY_PAGE_INDEX: ContextVar[tuple[int, dict[str, list[dict[str, str]]]] | None] = ContextVar(
+    "_POLICY_PAGE_INDEX", default=None
+)
+
+
+def _group_policy_pages(submission: dict[str, Any]) -> dict[str, list[dict[str, str]]]:
     pages = submission.get("policy_pages", [])
+    grouped: dict[str, list[dict[str, str]]] = {}
     if not isinstance(pages, list):
-        return []
-    out: list[dict[str, str]] = []
+        return grouped
     for page in pages:
         if not isinstance(page, dict):
             continue
-        if str(page.get("rule_hint", "")) != rule_hint:
-            continue
         url = str(page.get("url", ""))
-        text = str(page.get("text", ""))
-        title = str(page.get("title", ""))
         if not url:
             continue
-        out.append({"url": url, "text": text, "title": title})
-    return out
+        grouped.setdefault(str(page.get("rule_hint", "")), []).append(
+            {"url": url, "text": str(page.get("text", "")), "title": str(page.get("title", ""))}
+        )
+    return grouped
+
+
+@contextmanager
+def policy_page_index(submission: dict[str, Any]) -> Iterator[None]:
+    # Group policy pages by rule hint once while several evaluators run on the
+    # same (unchanged) submission.
+    token = _POLICY_PAGE_INDEX.set((id(submission), _group_policy_pages(submission)))
+    try:
+        yield
+    finally:
+        _POLICY_PAGE_INDEX.reset(token)
+
+
+def _get_policy_pages(submission: dict[str, Any], rule_hint: str) -> list[dict[str, str]]:
+    indexed = _POLICY_PAGE_INDEX.get()
+    if indexed is not None and indexed[0] == id(submission):
+        grouped = indexed[1]
+    else:
+        grouped = _group_policy_pages(submission)
+    return list(grouped.get(rule_hint, ()))
 
 
 def _text_blob(pages: list[dict[str, str]]) -> str:
@@ -94,29 +188,29 @@ def _text_blob(pages: list[dict[str, str]]) -> str:
     return "\n".join(chunks).lower()
 
 
-def _contains_any(text: str, patterns: list[str]) -> bool:
+def _contains_any(text: str, patterns: tuple[re.Pattern[str], ...]) -> bool:
     for pattern in patterns:
-        if re.search(pattern, text, flags=re.IGNORECASE):
+        if pattern.search(text):
             return True
     return False
 
 
-def _count_any(text: str, patterns: list[str]) -> int:
+def _count_any(text: str, patterns: tuple[re.Pattern[str], ...]) -> int:
     count = 0
     for pattern in patterns:
-        if re.search(pattern, text, flags=re.IGNORECASE):
+        if pattern.search(text):
             count += 1
     return count
 
 
+def _count_hints(hints: set[str], tags: tuple[str, ...]) -> int:
+    return sum(1 for tag in tags if tag in hints)
+
+
 def _extract_license_claims(text: str) -> list[str]:
     claims: list[str] = []
-    for label, pattern in LICENSE_CLAIM_ORDERED_PATTERNS:
-        match = re.search(
-            pattern + r"(?:\s*(?:license)?\s*(?:version)?\s*(\d(?:\.\d+)?))?",
-            text,
-            flags=re.IGNORECASE,
-        )
+    for label, pattern in _LICENSE_CLAIM_RES:
+        match = pattern.search(text)
         if not match:
             continue
         claim = label
@@ -126,12 +220,9 @@ def _extract_license_claims(text: str) -> list[str]:
         if claim not in claims:
             claims.append(claim)
 
-    has_creative_commons = _contains_any(text, [r"\bcreative commons\b"])
-    has_license_word = _contains_any(text, [r"\blicen[sc]e\b"])
-    has_journal_license_wording = _contains_any(
-        text,
-        [r"\bjournal licen[sc]e\b", r"\blicen[sc]e terms\b", r"\blicensing policy\b"],
-    )
+    has_creative_commons = _contains_any(text, _CREATIVE_COMMONS_SIGNALS)
+    has_license_word = _contains_any(text, _LICENSE_WORD_SIGNALS)
+    has_journal_license_wording = _contains_any(text, _JOURNAL_LICENSE_WORDING_SIGNALS)
 
     if has_creative_commons and not any(claim.startswith("CC") for claim in claims):
         claims.append("Creative Commons (type not specified)")
@@ -191,17 +282,13 @@ def _missing_policy_result(rule_id: str, rule_hint: str, submission: dict[str, A
 
 
 def _clean_text_value(value: str) -> str:
-    return re.sub(r"\s+", " ", value or "").strip(" -,:;|()[]")
+    return _SPACE_RE.sub(" ", value or "").strip(" -,:;|()[]")
 
 
 def _extract_publisher_name_candidates(text: str) -> list[str]:
     candidates: list[str] = []
-    patterns = [
-        r"\bpublished by\s*[:\-]?\s*([^\n\.]{4,100})",
-        r"\bpublisher\s*[:\-]?\s*([^\n\.]{4,100})",
-    ]
-    for pattern in patterns:
-        for match in re.finditer(pattern, text, flags=re.IGNORECASE):
+    for pattern in _PUBLISHER_NAME_RES:
+        for match in pattern.finditer(text):
             name = _clean_text_value(match.group(1))
             if len(name) < 4:
                 continue
@@ -218,8 +305,8 @@ def _publisher_signatures(submission: dict[str, Any]) -> set[str]:
     for page in pages:
         blob = f"{page.get('title', '')}\n{page.get('text', '')}"
         for name in _extract_publisher_name_candidates(blob):
-            normalized = re.sub(r"[^a-z0-9 ]", " ", name.lower())
-            normalized = re.sub(r"\s+", " ", normalized).strip()
+            normalized = _NON_ALNUM_SPACE_RE.sub(" ", name.lower())
+            normalized = _SPACE_RE.sub(" ", normalized).strip()
             for token in normalized.split():
                 if len(token) >= 4:
                     signatures.add(token)
@@ -232,7 +319,7 @@ def _is_same_as_publisher(affiliation: str, publisher_signatures: set[str]) -> b
         return None
     if not any(keyword in value for keyword in INSTITUTION_KEYWORDS):
         return None
-    words = {token for token in re.sub(r"[^a-z0-9 ]", " ", value).split() if len(token) >= 4}
+    words = {token for token in _NON_ALNUM_SPACE_RE.sub(" ", value).split() if len(token) >= 4}
     if not words:
         return None
     if not publisher_signatures:
@@ -243,22 +330,25 @@ def _is_same_as_publisher(affiliation: str, publisher_signatures: set[str]) -> b
 def _count_group_affiliation_composition(
     people: list[dict[str, Any]], publisher_signatures: set[str]
 ) -> tuple[int, int, int]:
-    same = 0
-    outside = 0
-    unknown = 0
-    for item in people:
-        affiliation = _clean_text_value(str(item.get("affiliation", "")))
-        if not affiliation:
-            unknown += 1
-            continue
-        same_flag = _is_same_as_publisher(affiliation, publisher_signatures)
-        if same_flag is True:
-            same += 1
-        elif same_flag is False:
-            outside += 1
-        else:
-            unknown += 1
-    return same, outside, unknown
+    affiliations = [_clean_text_value(str(item.get("affiliation", ""))) for item in people]
+    # Boards often repeat the same institution; classify each distinct value once.
+    flags = {value: _is_same_as_publisher(value, publisher_signatures) for value in set(affiliations)}
+    column = [flags[value] for value in affiliations]
+    same = column.count(True)
+    outside = column.count(False)
+    return same, outside, len(column) - same - outside
+
+
+_OA_REUSE_HINTS = (
+    "oa_reuse_read",
+    "oa_reuse_download",
+    "oa_reuse_copy",
+    "oa_reuse_distribute",
+    "oa_reuse_reuse",
+    "oa_reuse_reproduce",
+    "oa_reuse_link_to",
+    "oa_reuse_tdm",
+)
 
 
 def evaluate_open_access_statement(submission: dict[str, Any]) -> dict[str, Any]:
@@ -273,48 +363,12 @@ def evaluate_open_access_statement(submission: dict[str, Any]) -> dict[str, Any]
     text = _text_blob(pages)
     evidence_urls = [page["url"] for page in pages]
 
-    open_access_signals = [
-        r"\bopen access\b",
-        r"\bfreely available\b",
-        r"\bfree access\b",
-        r"\bwithout charge\b",
-    ]
-    reuse_signals = [
-        r"\bread\b",
-        r"\bdownload\b",
-        r"\bcopy\b",
-        r"\bdistribut(e|ion)\b",
-        r"\breuse\b",
-        r"\breproduce\b",
-        r"\blink to\b",
-        r"\btext and data mining\b",
-    ]
-    license_signals = [
-        r"\bcreative commons\b",
-        r"\bcc by\b",
-        r"\bcc by-sa\b",
-        r"\bcc by-nd\b",
-        r"\bcc by-nc\b",
-        r"\bcc by-nc-sa\b",
-        r"\bcc by-nc-nd\b",
-        r"\bcc0\b",
-        r"\bpublic domain\b",
-    ]
-    hard_negative_signals = [
-        r"\bsubscription required\b",
-        r"\bpaywall\b",
-        r"\bembargo period\b",
-        r"\bmembers only\b",
-        r"\bpurchase\b",
-        r"\baccess limited to subscribers\b",
-        r"\bno open access\b",
-    ]
-
-    has_oa = _contains_any(text, open_access_signals)
-    reuse_count = _count_any(text, reuse_signals)
-    has_license = _contains_any(text, license_signals)
-    has_negative = _contains_any(text, hard_negative_signals)
-    all_rights_reserved = _contains_any(text, [r"\ball rights reserved\b"])
+    hints = scan_keywords(text)
+    has_oa = "oa_positive" in hints
+    reuse_count = _count_hints(hints, _OA_REUSE_HINTS)
+    has_license = "oa_license" in hints
+    has_negative = "oa_negative" in hints
+    all_rights_reserved = "lic_ard" in hints
 
     if has_negative and not (has_oa and (has_license or reuse_count >= 3)):
         return {
@@ -344,6 +398,26 @@ def evaluate_open_access_statement(submission: dict[str, Any]) -> dict[str, Any]
     }
 
 
+_PEER_REVIEW_PROCESS_HINTS = (
+    "pr_process_review_process",
+    "pr_process_reviewed_by",
+    "pr_process_editorial_decision",
+    "pr_process_revision",
+    "pr_process_manuscript",
+    "pr_process_acceptance",
+)
+
+_PEER_REVIEW_MIN_TWO_REVIEWER_SIGNALS = _compile_any(
+    [
+        r"\bat least\s+2\s+(independent\s+)?reviewers?\b",
+        r"\bminimum\s+of\s+2\s+(independent\s+)?reviewers?\b",
+        r"\btwo\s+(\w+\s+){0,2}reviewers?\b",
+        r"\b2\s+(\w+\s+){0,2}reviewers?\b",
+        r"\breviewed\s+by\s+at\s+least\s+two\b",
+    ]
+)
+
+
 def evaluate_peer_review_policy(submission: dict[str, Any]) -> dict[str, Any]:
     rule_id = "doaj.peer_review_policy.v1"
     rule_hint = "peer_review_policy"
@@ -356,39 +430,8 @@ def evaluate_peer_review_policy(submission: dict[str, Any]) -> dict[str, Any]:
     text = _text_blob(pages)
     evidence_urls = [page["url"] for page in pages]
 
-    peer_review_signals = [
-        r"\bpeer review\b",
-        r"\bpeer-reviewed\b",
-        r"\bdouble blind\b",
-        r"\bdouble anonymous\b",
-        r"\bsingle blind\b",
-        r"\banonymous peer review\b",
-        r"\bopen peer review\b",
-        r"\bexternal reviewer\b",
-        r"\bblind peer review\b",
-    ]
-    process_signals = [
-        r"\breview process\b",
-        r"\breviewed by\b",
-        r"\beditorial decision\b",
-        r"\brevision\b",
-        r"\bmanuscript\b",
-        r"\bacceptance\b",
-    ]
-    min_two_reviewer_signals = [
-        r"\bat least\s+2\s+(independent\s+)?reviewers?\b",
-        r"\bminimum\s+of\s+2\s+(independent\s+)?reviewers?\b",
-        r"\btwo\s+(\w+\s+){0,2}reviewers?\b",
-        r"\b2\s+(\w+\s+){0,2}reviewers?\b",
-        r"\breviewed\s+by\s+at\s+least\s+two\b",
-    ]
-    fail_signals = [
-        r"\bnot peer reviewed\b",
-        r"\bno peer review\b",
-    ]
-    editorial_only_signal = r"\beditorial review only\b|\beditorial review\b"
-
-    if _contains_any(text, fail_signals):
+    hints = scan_keywords(text)
+    if "pr_fail" in hints:
         return {
             "rule_id": rule_id,
             "result": "fail",
@@ -397,14 +440,14 @@ def evaluate_peer_review_policy(submission: dict[str, Any]) -> dict[str, Any]:
             "evidence_urls": evidence_urls,
         }
 
-    has_peer_review = _contains_any(text, peer_review_signals)
-    process_count = _count_any(text, process_signals)
-    editorial_only = _contains_any(text, [editorial_only_signal])
-    has_min_two = _contains_any(text, min_two_reviewer_signals)
+    has_peer_review = "pr_positive" in hints
+    process_count = _count_hints(hints, _PEER_REVIEW_PROCESS_HINTS)
+    editorial_only = "pr_editorial" in hints
+    has_min_two = _contains_any(text, _PEER_REVIEW_MIN_TWO_REVIEWER_SIGNALS)
     detected_types = [
         review_type
-        for review_type, pattern in PEER_REVIEW_TYPE_PATTERNS.items()
-        if re.search(pattern, text, flags=re.IGNORECASE)
+        for review_type, pattern in _PEER_REVIEW_TYPE_RES
+        if pattern.search(text)
     ]
     types_text = ", ".join(detected_types[:4]) if detected_types else "not specified"
 
@@ -445,6 +488,14 @@ def evaluate_peer_review_policy(submission: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+_LICENSE_CC_HINTS = (
+    "lic_cc_creative_commons",
+    "lic_cc_cc",
+    "lic_cc_cc0",
+    "lic_cc_public_domain",
+)
+
+
 def evaluate_license_terms(submission: dict[str, Any]) -> dict[str, Any]:
     rule_id = "doaj.license_terms.v1"
     rule_hint = "license_terms"
@@ -457,28 +508,12 @@ def evaluate_license_terms(submission: dict[str, Any]) -> dict[str, Any]:
     text = _text_blob(pages)
     evidence_urls = [page["url"] for page in pages]
 
-    cc_signals = [
-        r"\bcreative commons\b",
-        r"\bcc\b",
-        r"\bcc0\b",
-        r"\bpublic domain\b",
-    ]
-    publisher_license_signals = [
-        r"\bpublisher'?s own license\b",
-        r"\bjournal license\b",
-        r"\blicense terms\b",
-        r"\blicensing policy\b",
-    ]
-    negative_signals = [
-        r"\bno license\b",
-        r"\bwithout license\b",
-    ]
-
-    cc_count = _count_any(text, cc_signals)
-    has_license_word = _contains_any(text, [r"\blicen[sc]e\b"])
-    has_publisher_license = _contains_any(text, publisher_license_signals)
-    has_negative = _contains_any(text, negative_signals)
-    all_rights_reserved = _contains_any(text, [r"\ball rights reserved\b"])
+    hints = scan_keywords(text)
+    cc_count = _count_hints(hints, _LICENSE_CC_HINTS)
+    has_license_word = _contains_any(text, _LICENSE_WORD_SIGNALS)
+    has_publisher_license = "lic_publisher" in hints
+    has_negative = "lic_negative" in hints
+    all_rights_reserved = "lic_ard" in hints
     detected_claims = _extract_license_claims(text)
     detected_text = ", ".join(detected_claims)
 
@@ -486,7 +521,7 @@ def evaluate_license_terms(submission: dict[str, Any]) -> dict[str, Any]:
         restrictive_claims: list[str] = []
         if all_rights_reserved:
             restrictive_claims.append("All rights reserved")
-        if _contains_any(text, [r"\bno license\b", r"\bwithout license\b"]):
+        if has_negative:
             restrictive_claims.append("No/without license")
         restriction_note = f" Journal-declared restrictive statement(s): {', '.join(restrictive_claims)}." if restrictive_claims else ""
         return {
@@ -535,6 +570,27 @@ def evaluate_license_terms(submission: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+_COPYRIGHT_RETAIN_SIGNALS = _compile_any(
+    [
+        r"\bauthors?\s+retain(s)?\s+(the\s+)?copyright\b",
+        r"\bcopyright\s+remains?\s+with\s+the\s+authors?\b",
+        r"\bauthors?\s+hold\s+copyright\b",
+        r"\bauthors?\s+retain(s)?\s+publishing\s+rights?\b",
+        r"\bnon-?exclusive\s+license\s+to\s+publish\b",
+    ]
+)
+
+_COPYRIGHT_TRANSFER_SIGNALS = _compile_any(
+    [
+        r"\bauthors?\s+transfer(s|red)?\s+copyright\b",
+        r"\bcopyright\s+is\s+transferred\s+to\s+the\s+publisher\b",
+        r"\bauthors?\s+assign(s|ed)?\s+exclusive\s+rights?\b",
+        r"\bpublisher\s+owns?\s+copyright\b",
+        r"\bcopyright\s+belongs?\s+to\s+the\s+publisher\b",
+    ]
+)
+
+
 def evaluate_copyright_author_rights(submission: dict[str, Any]) -> dict[str, Any]:
     rule_id = "doaj.copyright_author_rights.v1"
     rule_hint = "copyright_author_rights"
@@ -552,23 +608,8 @@ def evaluate_copyright_author_rights(submission: dict[str, Any]) -> dict[str, An
     text = _text_blob(pages)
     evidence_urls = [page["url"] for page in pages]
 
-    retain_signals = [
-        r"\bauthors?\s+retain(s)?\s+(the\s+)?copyright\b",
-        r"\bcopyright\s+remains?\s+with\s+the\s+authors?\b",
-        r"\bauthors?\s+hold\s+copyright\b",
-        r"\bauthors?\s+retain(s)?\s+publishing\s+rights?\b",
-        r"\bnon-?exclusive\s+license\s+to\s+publish\b",
-    ]
-    transfer_signals = [
-        r"\bauthors?\s+transfer(s|red)?\s+copyright\b",
-        r"\bcopyright\s+is\s+transferred\s+to\s+the\s+publisher\b",
-        r"\bauthors?\s+assign(s|ed)?\s+exclusive\s+rights?\b",
-        r"\bpublisher\s+owns?\s+copyright\b",
-        r"\bcopyright\s+belongs?\s+to\s+the\s+publisher\b",
-    ]
-
-    has_retain = _contains_any(text, retain_signals)
-    has_transfer = _contains_any(text, transfer_signals)
+    has_retain = _contains_any(text, _COPYRIGHT_RETAIN_SIGNALS)
+    has_transfer = _contains_any(text, _COPYRIGHT_TRANSFER_SIGNALS)
 
     if has_retain and not has_transfer:
         return {
@@ -606,32 +647,17 @@ def evaluate_copyright_author_rights(submission: dict[str, Any]) -> dict[str, An
     }
 
 
-def evaluate_publication_fees_disclosure(submission: dict[str, Any]) -> dict[str, Any]:
-    rule_id = "doaj.publication_fees_disclosure.v1"
-    rule_hint = "publication_fees_disclosure"
-    pages = _get_policy_pages(submission, rule_hint)
-    if not pages:
-        # Fallback pages often used for fee statements.
-        pages = _get_policy_pages(submission, "open_access_statement") + _get_policy_pages(submission, "license_terms")
-    if not pages:
-        missing = _missing_policy_result(rule_id, rule_hint, submission)
-        missing["evidence_urls"] = (
-            _get_policy_urls(submission, rule_hint)
-            or _get_policy_urls(submission, "open_access_statement")
-            or _get_policy_urls(submission, "license_terms")
-        )
-        return missing
-
-    text = _text_blob(pages)
-    evidence_urls = [page["url"] for page in pages]
-
-    no_fee_signals = [
+_FEES_NO_FEE_SIGNALS = _compile_any(
+    [
         r"\bno\s+(article\s+processing\s+charge|apc|publication\s+fee|submission\s+fee|page\s+charge)s?\b",
         r"\bfree\s+of\s+charge\b",
         r"\bdoes\s+not\s+charge\b",
         r"\bwithout\s+fees?\b",
     ]
-    fee_signals = [
+)
+
+_FEES_FEE_SIGNALS = _compile_any(
+    [
         r"\barticle\s+processing\s+charge(s)?\b",
         r"\bapc(s)?\b",
         r"\bpublication\s+fee(s)?\b",
@@ -640,27 +666,56 @@ def evaluate_publication_fees_disclosure(submission: dict[str, Any]) -> dict[str
         r"\beditorial\s+processing\s+charge(s)?\b",
         r"\blanguage\s+editing\s+fee(s)?\b",
     ]
-    fee_obligation_signals = [
+)
+
+_FEES_FEE_OBLIGATION_SIGNALS = _compile_any(
+    [
         r"\bauthors?\s+(must|are\s+required\s+to)\s+pay\b",
         r"\bfee(s)?\s+(is|are)\s+charged\b",
         r"\bwe\s+charge\b",
         r"\bcharges?\s+apply\b",
     ]
-    amount_signal = r"(\bUSD\b|\bEUR\b|\bIDR\b|\bGBP\b|\$\s?\d|\b\d{2,}\s?(usd|eur|idr|gbp)\b)"
-    ambiguous_signals = [
+)
+
+_FEES_AMBIGUOUS_SIGNALS = _compile_any(
+    [
         r"\bcontact\s+(the\s+)?editor\s+for\s+fee\b",
         r"\bfee\s+information\s+available\s+on\s+request\b",
         r"\bfees?\s+may\s+apply\b",
         r"\bto\s+be\s+determined\b",
     ]
+)
+
+_FEES_EXPLICIT_NO_FEE_SIGNALS = _compile_any([r"\bno\s+apc\b", r"\bno\s+publication\s+fee\b"])
+_FEES_AMOUNT_SIGNALS = _compile_any([r"(\bUSD\b|\bEUR\b|\bIDR\b|\bGBP\b|\$\s?\d|\b\d{2,}\s?(usd|eur|idr|gbp)\b)"])
 
-    has_no_fee = _contains_any(text, no_fee_signals)
-    has_fee_terms = _contains_any(text, fee_signals)
-    has_fee_obligation = _contains_any(text, fee_obligation_signals)
-    has_amount = _contains_any(text, [amount_signal])
-    has_ambiguous = _contains_any(text, ambiguous_signals)
 
-    if has_no_fee and has_fee_terms and not _contains_any(text, [r"\bno\s+apc\b", r"\bno\s+publication\s+fee\b"]):
+def evaluate_publication_fees_disclosure(submission: dict[str, Any]) -> dict[str, Any]:
+    rule_id = "doaj.publication_fees_disclosure.v1"
+    rule_hint = "publication_fees_disclosure"
+    pages = _get_policy_pages(submission, rule_hint)
+    if not pages:
+        # Fallback pages often used for fee statements.
+        pages = _get_policy_pages(submission, "open_access_statement") + _get_policy_pages(submission, "license_terms")
+    if not pages:
+        missing = _missing_policy_result(rule_id, rule_hint, submission)
+        missing["evidence_urls"] = (
+            _get_policy_urls(submission, rule_hint)
+            or _get_policy_urls(submission, "open_access_statement")
+            or _get_policy_urls(submission, "license_terms")
+        )
+        return missing
+
+    text = _text_blob(pages)
+    evidence_urls = [page["url"] for page in pages]
+
+    has_no_fee = _contains_any(text, _FEES_NO_FEE_SIGNALS)
+    has_fee_terms = _contains_any(text, _FEES_FEE_SIGNALS)
+    has_fee_obligation = _contains_any(text, _FEES_FEE_OBLIGATION_SIGNALS)
+    has_amount = _contains_any(text, _FEES_AMOUNT_SIGNALS)
+    has_ambiguous = _contains_any(text, _FEES_AMBIGUOUS_SIGNALS)
+
+    if has_no_fee and has_fee_terms and not _contains_any(text, _FEES_EXPLICIT_NO_FEE_SIGNALS):
         return {
             "rule_id": rule_id,
             "result": "need_human_review",
@@ -706,31 +761,8 @@ def evaluate_publication_fees_disclosure(submission: dict[str, Any]) -> dict[str
     }
 
 
-def evaluate_publisher_identity(submission: dict[str, Any]) -> dict[str, Any]:
-    rule_id = "doaj.publisher_identity.v1"
-    rule_hint = "publisher_identity"
-    pages = _get_policy_pages(submission, rule_hint)
-    if not pages:
-        # Fallback pages that often include publisher details.
-        pages = (
-            _get_policy_pages(submission, "open_access_statement")
-            + _get_policy_pages(submission, "peer_review_policy")
-            + _get_policy_pages(submission, "license_terms")
-        )
-    if not pages:
-        missing = _missing_policy_result(rule_id, rule_hint, submission)
-        missing["evidence_urls"] = (
-            _get_policy_urls(submission, rule_hint)
-            or _get_policy_urls(submission, "open_access_statement")
-            or _get_policy_urls(submission, "peer_review_policy")
-            or _get_policy_urls(submission, "license_terms")
-        )
-        return missing
-
-    text = _text_blob(pages)
-    evidence_urls = [page["url"] for page in pages]
-
-    name_signals = [
+_PUBLISHER_NAME_SIGNALS = _compile_any(
+    [
         r"\bpublisher\b",
         r"\bpublished by\b",
         r"\bjournal publisher\b",
@@ -739,7 +771,10 @@ def evaluate_publisher_identity(submission: dict[str, Any]) -> dict[str, Any]:
         r"\bsociety\b",
         r"\binstitute\b",
     ]
-    contact_signals = [
+)
+
+_PUBLISHER_CONTACT_SIGNALS = _compile_any(
+    [
         r"\bcontact\b",
         r"\be-?mail\b",
         r"@[a-z0-9\.\-]+\.[a-z]{2,}",
@@ -747,7 +782,10 @@ def evaluate_publisher_identity(submission: dict[str, Any]) -> dict[str, Any]:
         r"\btel\b",
         r"\bwhatsapp\b",
     ]
-    address_signals = [
+)
+
+_PUBLISHER_ADDRESS_SIGNALS = _compile_any(
+    [
         r"\baddress\b",
         r"\bstreet\b",
         r"\broad\b",
@@ -757,16 +795,45 @@ def evaluate_publisher_identity(submission: dict[str, Any]) -> dict[str, Any]:
         r"\bzip\b",
         r"\bpostal code\b",
     ]
-    negative_signals = [
+)
+
+_PUBLISHER_NEGATIVE_SIGNALS = _compile_any(
+    [
         r"\bpublisher information not available\b",
         r"\bpublisher not disclosed\b",
         r"\banonymous publisher\b",
     ]
+)
+
+
+def evaluate_publisher_identity(submission: dict[str, Any]) -> dict[str, Any]:
+    rule_id = "doaj.publisher_identity.v1"
+    rule_hint = "publisher_identity"
+    pages = _get_policy_pages(submission, rule_hint)
+    if not pages:
+        # Fallback pages that often include publisher details.
+        pages = (
+            _get_policy_pages(submission, "open_access_statement")
+            + _get_policy_pages(submission, "peer_review_policy")
+            + _get_policy_pages(submission, "license_terms")
+        )
+    if not pages:
+        missing = _missing_policy_result(rule_id, rule_hint, submission)
+        missing["evidence_urls"] = (
+            _get_policy_urls(submission, rule_hint)
+            or _get_policy_urls(submission, "open_access_statement")
+            or _get_policy_urls(submission, "peer_review_policy")
+            or _get_policy_urls(submission, "license_terms")
+        )
+        return missing
+
+    text = _text_blob(pages)
+    evidence_urls = [page["url"] for page in pages]
 
-    has_name = _contains_any(text, name_signals)
-    has_contact = _contains_any(text, contact_signals)
-    has_address = _contains_any(text, address_signals)
-    has_negative = _contains_any(text, negative_signals)
+    has_name = _contains_any(text, _PUBLISHER_NAME_SIGNALS)
+    has_contact = _contains_any(text, _PUBLISHER_CONTACT_SIGNALS)
+    has_address = _contains_any(text, _PUBLISHER_ADDRESS_SIGNALS)
+    has_negative = _contains_any(text, _PUBLISHER_NEGATIVE_SIGNALS)
 
     if has_negative and not (has_name and (has_contact or has_address)):
         return {
@@ -796,38 +863,35 @@ def evaluate_publisher_identity(submission: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+_ISSN_WEIGHTS = (8, 7, 6, 5, 4, 3, 2)
+
+
 def _issn_check_digit_valid(issn: str) -> bool:
-    candidate = re.sub(r"[^0-9Xx]", "", issn or "")
-    if len(candidate) != 8:
+    candidate = _ISSN_NON_DIGIT_RE.sub("", issn or "").upper()
+    if len(candidate) != 8 or not candidate[:7].isdigit():
         return False
-    total = 0
-    for idx, char in enumerate(candidate[:7]):
-        if not char.isdigit():
-            return False
-        weight = 8 - idx
-        total += int(char) * weight
-    check_val = (11 - (total % 11)) % 11
-    expected = "X" if check_val == 10 else str(check_val)
-    actual = candidate[7].upper()
-    return actual == expected
+    check = 10 if candidate[7] == "X" else int(candidate[7])
+    # Weighted sum including the check digit (weight 1) is a multiple of 11 for valid ISSNs.
+    total = sum(weight * int(char) for weight, char in zip(_ISSN_WEIGHTS, candidate))
+    return (total + check) % 11 == 0
 
 
 def _extract_issns(text: str) -> list[str]:
-    return sorted(set(match.upper() for match in re.findall(r"\b\d{4}-\d{3}[0-9Xx]\b", text)))
+    return sorted(set(match.upper() for match in _ISSN_RE.findall(text)))
 
 
 def _extract_issn_mentions(text: str) -> list[dict[str, str]]:
     out: list[dict[str, str]] = []
-    for match in re.finditer(r"\b\d{4}-\d{3}[0-9Xx]\b", text):
+    for match in _ISSN_RE.finditer(text):
         issn = match.group(0).upper()
         start = max(0, match.start() - 45)
         end = min(len(text), match.end() + 45)
         context = text[start:end]
         low = context.lower()
         category = "unknown"
-        if re.search(r"\b(e[-\s]?issn|online|electronic)\b", low):
+        if _ELECTRONIC_ISSN_RE.search(low):
             category = "electronic"
-        elif re.search(r"\b(p[-\s]?issn|print)\b", low):
+        elif _PRINT_ISSN_RE.search(low):
             category = "print"
         out.append({"issn": issn, "category": category})
     return out
@@ -919,25 +983,17 @@ def evaluate_issn_consistency(submission: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def evaluate_aims_scope(submission: dict[str, Any]) -> dict[str, Any]:
-    rule_id = "doaj.aims_scope.v1"
-    rule_hint = "aims_scope"
-    pages = _get_policy_pages(submission, rule_hint)
-    if not pages:
-        missing = _missing_policy_result(rule_id, rule_hint, submission)
-        missing["evidence_urls"] = _get_policy_urls(submission, rule_hint)
-        return missing
-
-    text = _text_blob(pages)
-    evidence_urls = [page["url"] for page in pages]
-
-    heading_signals = [
+_AIMS_SCOPE_HEADING_SIGNALS = _compile_any(
+    [
         r"\baims?\s*&\s*scope\b",
         r"\baims?\s+and\s+scope\b",
         r"\bjournal\s+scope\b",
         r"\bfocus\s+and\s+scope\b",
     ]
-    scope_signals = [
+)
+
+_AIMS_SCOPE_SCOPE_SIGNALS = _compile_patterns(
+    [
         r"\bthe\s+journal\s+publishes\b",
         r"\btopics?\s+include\b",
         r"\bsubject\s+areas?\b",
@@ -945,17 +1001,37 @@ def evaluate_aims_scope(submission: dict[str, Any]) -> dict[str, Any]:
         r"\bfields?\s+of\b",
         r"\bcovers?\b",
     ]
-    negative_signals = [
+)
+
+_AIMS_SCOPE_NEGATIVE_SIGNALS = _compile_any(
+    [
         r"\baims?\s+and\s+scope\s+not\s+available\b",
         r"\bno\s+aims?\s+and\s+scope\b",
         r"\bscope\s+not\s+defined\b",
     ]
+)
+
+_AIMS_SCOPE_AIM_OR_FOCUS_SIGNALS = _compile_any([r"\baims?\b", r"\bfocus\b"])
+_AIMS_SCOPE_SCOPE_WORD_SIGNALS = _compile_any([r"\bscope\b"])
 
-    has_heading = _contains_any(text, heading_signals)
-    scope_count = _count_any(text, scope_signals)
-    has_negative = _contains_any(text, negative_signals)
-    has_aim_or_focus = _contains_any(text, [r"\baims?\b", r"\bfocus\b"])
-    has_scope_word = _contains_any(text, [r"\bscope\b"])
+
+def evaluate_aims_scope(submission: dict[str, Any]) -> dict[str, Any]:
+    rule_id = "doaj.aims_scope.v1"
+    rule_hint = "aims_scope"
+    pages = _get_policy_pages(submission, rule_hint)
+    if not pages:
+        missing = _missing_policy_result(rule_id, rule_hint, submission)
+        missing["evidence_urls"] = _get_policy_urls(submission, rule_hint)
+        return missing
+
+    text = _text_blob(pages)
+    evidence_urls = [page["url"] for page in pages]
+
+    has_heading = _contains_any(text, _AIMS_SCOPE_HEADING_SIGNALS)
+    scope_count = _count_any(text, _AIMS_SCOPE_SCOPE_SIGNALS)
+    has_negative = _contains_any(text, _AIMS_SCOPE_NEGATIVE_SIGNALS)
+    has_aim_or_focus = _contains_any(text, _AIMS_SCOPE_AIM_OR_FOCUS_SIGNALS)
+    has_scope_word = _contains_any(text, _AIMS_SCOPE_SCOPE_WORD_SIGNALS)
 
     if has_negative and not (has_heading or scope_count >= 2):
         return {
@@ -1002,6 +1078,27 @@ def evaluate_aims_scope(submission: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+_EDITORIAL_BOARD_AFFILIATION_SIGNALS = _compile_any(
+    [
+        r"\buniversity\b",
+        r"\binstitute\b",
+        r"\bdepartment\b",
+        r"\bfaculty\b",
+        r"\bhospital\b",
+        r"\bschool\b",
+        r"\baffiliation\b",
+        r"\bcountry\b",
+    ]
+)
+
+_EDITORIAL_BOARD_NO_BOARD_SIGNALS = _compile_any(
+    [
+        r"\bno\s+editorial\s+board\b",
+        r"\beditorial\s+board\s+not\s+available\b",
+    ]
+)
+
+
 def evaluate_editorial_board(submission: dict[str, Any]) -> dict[str, Any]:
     rule_id = "doaj.editorial_board.v1"
     rule_hint = "editorial_board"
@@ -1040,19 +1137,8 @@ def evaluate_editorial_board(submission: dict[str, Any]) -> dict[str, Any]:
     board_count = len(board_people)
     reviewer_count = len(reviewer_people)
     has_editor = any(str(item.get("role", "")) == "editor" for item in board_people)
-    board_affiliations = [str(item.get("affiliation", "")).strip() for item in board_people if str(item.get("affiliation", "")).strip()]
-    has_affiliation_field = bool(board_affiliations)
-    affiliation_signals = [
-        r"\buniversity\b",
-        r"\binstitute\b",
-        r"\bdepartment\b",
-        r"\bfaculty\b",
-        r"\bhospital\b",
-        r"\bschool\b",
-        r"\baffiliation\b",
-        r"\bcountry\b",
-    ]
-    has_affiliation_text = _contains_any(text, affiliation_signals)
+    has_affiliation_field = any(str(item.get("affiliation", "")).strip() for item in board_people)
+    has_affiliation_text = _contains_any(text, _EDITORIAL_BOARD_AFFILIATION_SIGNALS)
     publisher_signatures = _publisher_signatures(submission)
     board_same, board_outside, board_unknown = _count_group_affiliation_composition(
         board_people, publisher_signatures
@@ -1063,11 +1149,7 @@ def evaluate_editorial_board(submission: dict[str, Any]) -> dict[str, Any]:
     reviewer_urls = _get_policy_urls(submission, "reviewers")
     reviewer_page_exists = bool(reviewer_urls)
 
-    no_board_signals = [
-        r"\bno\s+editorial\s+board\b",
-        r"\beditorial\s+board\s+not\s+available\b",
-    ]
-    has_no_board = _contains_any(text, no_board_signals)
+    has_no_board = _contains_any(text, _EDITORIAL_BOARD_NO_BOARD_SIGNALS)
 
     if board_count == 0 and has_no_board:
         return {
@@ -1162,25 +1244,17 @@ def evaluate_editorial_board(submission: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def evaluate_instructions_for_authors(submission: dict[str, Any]) -> dict[str, Any]:
-    rule_id = "doaj.instructions_for_authors.v1"
-    rule_hint = "instructions_for_authors"
-    pages = _get_policy_pages(submission, rule_hint)
-    if not pages:
-        missing = _missing_policy_result(rule_id, rule_hint, submission)
-        missing["evidence_urls"] = _get_policy_urls(submission, rule_hint)
-        return missing
-
-    text = _text_blob(pages)
-    evidence_urls = [page["url"] for page in pages]
-
-    heading_signals = [
+_INSTRUCTIONS_HEADING_SIGNALS = _compile_any(
+    [
         r"\binstructions?\s+for\s+authors?\b",
         r"\bauthor\s+guidelines?\b",
         r"\bguide\s+for\s+authors?\b",
         r"\bsubmission\s+guidelines?\b",
     ]
-    process_signals = [
+)
+
+_INSTRUCTIONS_PROCESS_SIGNALS = _compile_patterns(
+    [
         r"\bmanuscript\b",
         r"\bsubmission\b",
         r"\bformat\b",
@@ -1190,14 +1264,31 @@ def evaluate_instructions_for_authors(submission: dict[str, Any]) -> dict[str, A
         r"\btemplate\b",
         r"\bpeer\s+review\b",
     ]
-    negative_signals = [
+)
+
+_INSTRUCTIONS_NEGATIVE_SIGNALS = _compile_any(
+    [
         r"\binstructions?\s+not\s+available\b",
         r"\bno\s+author\s+guidelines?\b",
     ]
+)
 
-    has_heading = _contains_any(text, heading_signals)
-    process_count = _count_any(text, process_signals)
-    has_negative = _contains_any(text, negative_signals)
+
+def evaluate_instructions_for_authors(submission: dict[str, Any]) -> dict[str, Any]:
+    rule_id = "doaj.instructions_for_authors.v1"
+    rule_hint = "instructions_for_authors"
+    pages = _get_policy_pages(submission, rule_hint)
+    if not pages:
+        missing = _missing_policy_result(rule_id, rule_hint, submission)
+        missing["evidence_urls"] = _get_policy_urls(submission, rule_hint)
+        return missing
+
+    text = _text_blob(pages)
+    evidence_urls = [page["url"] for page in pages]
+
+    has_heading = _contains_any(text, _INSTRUCTIONS_HEADING_SIGNALS)
+    process_count = _count_any(text, _INSTRUCTIONS_PROCESS_SIGNALS)
+    has_negative = _contains_any(text, _INSTRUCTIONS_NEGATIVE_SIGNALS)
 
     if has_negative and not (has_heading or process_count >= 2):
         return {
@@ -1246,13 +1337,30 @@ def _optional_not_provided(rule_id: str, rule_hint: str) -> dict[str, Any]:
     }
 
 
+_PLAGIARISM_FALLBACK_SIGNALS = _compile_any([r"\bplagiarism\b", r"\bsimilarity\b"])
+_PLAGIARISM_POLICY_SIGNALS = _compile_any([r"\bplagiarism\b", r"\bsimilarity index\b", r"\boriginality\b"])
+_PLAGIARISM_TOOL_RES = [
+    (name, re.compile(pattern, re.IGNORECASE))
+    for name, pattern in {
+        "Turnitin": r"\bturnitin\b",
+        "iThenticate": r"\bithenticate\b",
+        "Crossref Similarity Check": r"\bcrossref similarity check\b",
+        "PlagScan": r"\bplagscan\b",
+    }.items()
+]
+_PLAGIARISM_THRESHOLD_RE = re.compile(
+    r"(maximum|max|below|under)\s+(\d{1,2})\s*%[^.\n]{0,40}(similarity|plagiarism)", re.IGNORECASE
+)
+_PLAGIARISM_THRESHOLD_FALLBACK_RE = re.compile(r"(similarity|plagiarism)[^.\n]{0,40}(\d{1,2})\s*%", re.IGNORECASE)
+
+
 def evaluate_plagiarism_policy(submission: dict[str, Any]) -> dict[str, Any]:
     rule_id = "doaj.plagiarism_policy.v1"
     rule_hint = "plagiarism_policy"
     pages = _get_policy_pages(submission, rule_hint)
     if not pages:
         fallback_pages = _get_policy_pages(submission, "instructions_for_authors")
-        if fallback_pages and _contains_any(_text_blob(fallback_pages), [r"\bplagiarism\b", r"\bsimilarity\b"]):
+        if fallback_pages and _contains_any(_text_blob(fallback_pages), _PLAGIARISM_FALLBACK_SIGNALS):
             pages = fallback_pages
     if not pages:
         out = _optional_not_provided(rule_id, rule_hint)
@@ -1261,21 +1369,12 @@ def evaluate_plagiarism_policy(submission: dict[str, Any]) -> dict[str, Any]:
 
     text = _text_blob(pages)
     evidence_urls = [page["url"] for page in pages]
-    has_policy = _contains_any(text, [r"\bplagiarism\b", r"\bsimilarity index\b", r"\boriginality\b"])
-    tools = [
-        name
-        for name, pattern in {
-            "Turnitin": r"\bturnitin\b",
-            "iThenticate": r"\bithenticate\b",
-            "Crossref Similarity Check": r"\bcrossref similarity check\b",
-            "PlagScan": r"\bplagscan\b",
-        }.items()
-        if re.search(pattern, text, flags=re.IGNORECASE)
-    ]
+    has_policy = _contains_any(text, _PLAGIARISM_POLICY_SIGNALS)
+    tools = [name for name, pattern in _PLAGIARISM_TOOL_RES if pattern.search(text)]
 
-    threshold_match = re.search(r"(maximum|max|below|under)\s+(\d{1,2})\s*%[^.\n]{0,40}(similarity|plagiarism)", text, flags=re.IGNORECASE)
+    threshold_match = _PLAGIARISM_THRESHOLD_RE.search(text)
     if threshold_match is None:
-        threshold_match = re.search(r"(similarity|plagiarism)[^.\n]{0,40}(\d{1,2})\s*%", text, flags=re.IGNORECASE)
+        threshold_match = _PLAGIARISM_THRESHOLD_FALLBACK_RE.search(text)
     threshold = threshold_match.group(2) if threshold_match else ""
 
     if has_policy and tools and threshold:
@@ -1310,6 +1409,24 @@ def evaluate_plagiarism_policy(submission: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+_ARCHIVING_SERVICE_RES = [
+    (name, re.compile(pattern, re.IGNORECASE))
+    for name, pattern in {
+        "CLOCKSS": r"\bclockss\b",
+        "LOCKSS": r"\blockss\b",
+        "Portico": r"\bportico\b",
+        "PKP PN": r"\bpkp\s*pn\b",
+        "Internet Archive": r"\binternet archive\b",
+        "PubMed Central": r"\bpubmed central\b|\bpmc\b",
+        "National Library": r"\bnational library\b",
+        "CINES": r"\bcines\b",
+    }.items()
+]
+_ARCHIVING_NEGATIVE_SIGNALS = _compile_any(
+    [r"\bnot archived\b", r"\bno archiving\b", r"\bno long[- ]term preservation\b"]
+)
+
+
 def evaluate_archiving_policy(submission: dict[str, Any]) -> dict[str, Any]:
     rule_id = "doaj.archiving_policy.v1"
     rule_hint = "archiving_policy"
@@ -1321,21 +1438,8 @@ def evaluate_archiving_policy(submission: dict[str, Any]) -> dict[str, Any]:
 
     text = _text_blob(pages)
     evidence_urls = [page["url"] for page in pages]
-    services = [
-        name
-        for name, pattern in {
-            "CLOCKSS": r"\bclockss\b",
-            "LOCKSS": r"\blockss\b",
-            "Portico": r"\bportico\b",
-            "PKP PN": r"\bpkp\s*pn\b",
-            "Internet Archive": r"\binternet archive\b",
-            "PubMed Central": r"\bpubmed central\b|\bpmc\b",
-            "National Library": r"\bnational library\b",
-            "CINES": r"\bcines\b",
-        }.items()
-        if re.search(pattern, text, flags=re.IGNORECASE)
-    ]
-    has_no_archiving = _contains_any(text, [r"\bnot archived\b", r"\bno archiving\b", r"\bno long[- ]term preservation\b"])
+    services = [name for name, pattern in _ARCHIVING_SERVICE_RES if pattern.search(text)]
+    has_no_archiving = _contains_any(text, _ARCHIVING_NEGATIVE_SIGNALS)
 
     if services:
         return {
@@ -1364,6 +1468,34 @@ def evaluate_archiving_policy(submission: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+_REPOSITORY_VERSION_SIGNALS = _compile_any(
+    [
+        r"\bsubmitted version\b",
+        r"\baccepted version\b",
+        r"\bauthor accepted manuscript\b",
+        r"\bpostprint\b",
+        r"\bpreprint\b",
+        r"\bpublished version\b",
+        r"\bversion of record\b",
+    ]
+)
+
+_REPOSITORY_NEGATIVE_SIGNALS = _compile_any(
+    [r"\bno repository policy\b", r"\bjournal has no repository policy\b"]
+)
+_REPOSITORY_SERVICE_RES = [
+    (name, re.compile(pattern, re.IGNORECASE))
+    for name, pattern in {
+        "Sherpa/Romeo": r"\bsherpa/?romeo\b",
+        "Dulcinea": r"\bdulcinea\b",
+        "Diadorim": r"\bdiadorim\b",
+        "Mir@bel": r"\bmir@?bel\b",
+        "Institutional repository": r"\binstitutional repository\b",
+    }.items()
+]
+_REPOSITORY_LICENSE_SIGNALS = _compile_any(list(LICENSE_PATTERNS.values()) + [r"\blicen[sc]e\b"])
+
+
 def evaluate_repository_policy(submission: dict[str, Any]) -> dict[str, Any]:
     rule_id = "doaj.repository_policy.v1"
     rule_hint = "repository_policy"
@@ -1375,29 +1507,10 @@ def evaluate_repository_policy(submission: dict[str, Any]) -> dict[str, Any]:
 
     text = _text_blob(pages)
     evidence_urls = [page["url"] for page in pages]
-    has_no_policy = _contains_any(text, [r"\bno repository policy\b", r"\bjournal has no repository policy\b"])
-    version_signals = [
-        r"\bsubmitted version\b",
-        r"\baccepted version\b",
-        r"\bauthor accepted manuscript\b",
-        r"\bpostprint\b",
-        r"\bpreprint\b",
-        r"\bpublished version\b",
-        r"\bversion of record\b",
-    ]
-    repository_services = [
-        name
-        for name, pattern in {
-            "Sherpa/Romeo": r"\bsherpa/?romeo\b",
-            "Dulcinea": r"\bdulcinea\b",
-            "Diadorim": r"\bdiadorim\b",
-            "Mir@bel": r"\bmir@?bel\b",
-            "Institutional repository": r"\binstitutional repository\b",
-        }.items()
-        if re.search(pattern, text, flags=re.IGNORECASE)
-    ]
-    has_version_statement = _contains_any(text, version_signals)
-    has_license = _contains_any(text, list(LICENSE_PATTERNS.values()) + [r"\blicen[sc]e\b"])
+    has_no_policy = _contains_any(text, _REPOSITORY_NEGATIVE_SIGNALS)
+    repository_services = [name for name, pattern in _REPOSITORY_SERVICE_RES if pattern.search(text)]
+    has_version_statement = _contains_any(text, _REPOSITORY_VERSION_SIGNALS)
+    has_license = _contains_any(text, _REPOSITORY_LICENSE_SIGNALS)
 
     if has_no_policy:
         return {
@@ -1434,3 +1547,23 @@ def evaluate_repository_policy(submission: dict[str, Any]) -> dict[str, Any]:
         "notes": "Repository policy URL exists but no clear preprint/postprint/version-of-record policy was detected.",
         "evidence_urls": evidence_urls,
     }
+
+
+BASIC_RULES: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+    "open_access_statement": evaluate_open_access_statement,
+    "issn_consistency": evaluate_issn_consistency,
+    "publisher_identity": evaluate_publisher_identity,
+    "license_terms": evaluate_license_terms,
+    "copyright_author_rights": evaluate_copyright_author_rights,
+    "peer_review_policy": evaluate_peer_review_policy,
+    "aims_scope": evaluate_aims_scope,
+    "editorial_board": evaluate_editorial_board,
+    "instructions_for_authors": evaluate_instructions_for_authors,
+    "publication_fees_disclosure": evaluate_publication_fees_disclosure,
+}
+
+SUPPLEMENTARY_RULES: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+    "plagiarism_policy": evaluate_plagiarism_policy,
+    "archiving_policy": evaluate_archiving_policy,
+    "repository_policy": evaluate_repository_policy,
+}
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from difflib import SequenceMatcher
+from functools import lru_cache
 import re
 import unicodedata
 from typing import Any
@@ -15,21 +17,23 @@ FUZZY_THRESHOLD = 0.94
 ELIGIBLE_ROLES = {"editor", "editorial_board_member", "reviewer"}
 
 _TITLE_RE = re.compile(r"\b(dr|prof|professor|mr|ms|mrs)\.?\b", re.IGNORECASE)
-_SPACE_RE = re.compile(r"\s+")
+# ASCII punctuation and symbols become spaces; applied after ASCII folding and lowercasing.
+_NON_ALNUM_TABLE = str.maketrans(
+    {chr(code): " " for code in range(128) if not (chr(code).isalnum() or chr(code).isspace())}
+)
 
 
 def _now_iso_utc() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
+@lru_cache(maxsize=8192)
 def normalize_name(name: str) -> str:
     text = unicodedata.normalize("NFKD", name or "")
     text = text.encode("ascii", "ignore").decode("ascii")
     text = text.lower()
     text = _TITLE_RE.sub(" ", text)
-    text = re.sub(r"[^a-z0-9\s]", " ", text)
-    text = _SPACE_RE.sub(" ", text).strip()
-    return text
+    return " ".join(text.translate(_NON_ALNUM_TABLE).split())
 
 
 def initials_plus_family_key(normalized_name: str) -> str:
@@ -41,26 +45,39 @@ def initials_plus_family_key(normalized_name: str) -> str:
     return f"{initials}|{family}"
 
 
-def _build_people_index(role_people: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], dict[str, list[dict[str, Any]]], dict[str, list[dict[str, Any]]]]:
-    people: list[dict[str, Any]] = []
-    by_exact: dict[str, list[dict[str, Any]]] = {}
-    by_initials: dict[str, list[dict[str, Any]]] = {}
+@dataclass(frozen=True, slots=True)
+class _PersonRecord:
+    name: str
+    role: str
+    source_url: str
+    normalized_name: str
+    initials_key: str
+
+
+FuzzyCandidate = tuple[_PersonRecord, SequenceMatcher]
+
+
+def _build_people_index(role_people: list[dict[str, Any]]) -> tuple[list[FuzzyCandidate], dict[str, list[_PersonRecord]], dict[str, list[_PersonRecord]]]:
+    people: list[FuzzyCandidate] = []
+    by_exact: dict[str, list[_PersonRecord]] = {}
+    by_initials: dict[str, list[_PersonRecord]] = {}
 
     for person in role_people:
         normalized = normalize_name(person.get("name", ""))
         if not normalized:
             continue
-        entry = {
-            "name": person.get("name", ""),
-            "role": person.get("role", ""),
-            "source_url": person.get("source_url", ""),
-            "normalized_name": normalized,
-            "initials_key": initials_plus_family_key(normalized),
-        }
-        people.append(entry)
+        entry = _PersonRecord(
+            name=person.get("name", ""),
+            role=person.get("role", ""),
+            source_url=person.get("source_url", ""),
+            normalized_name=normalized,
+            initials_key=initials_plus_family_key(normalized),
+        )
+        # The matcher keeps the person's name as seq2 so its lookup tables are built once.
+        people.append((entry, SequenceMatcher(None, "", normalized)))
         by_exact.setdefault(normalized, []).append(entry)
-        if entry["initials_key"]:
-            by_initials.setdefault(entry["initials_key"], []).append(entry)
+        if entry.initials_key:
+            by_initials.setdefault(entry.initials_key, []).append(entry)
     return people, by_exact, by_initials
 
 
@@ -83,9 +100,9 @@ def _filter_eligible_role_people(role_people: list[dict[str, Any]]) -> tuple[lis
 
 def _match_author(
     author_name: str,
-    people: list[dict[str, Any]],
-    by_exact: dict[str, list[dict[str, Any]]],
-    by_initials: dict[str, list[dict[str, Any]]],
+    people: list[FuzzyCandidate],
+    by_exact: dict[str, list[_PersonRecord]],
+    by_initials: dict[str, list[_PersonRecord]],
 ) -> dict[str, Any] | None:
     normalized_author = normalize_name(author_name)
     if not normalized_author:
@@ -113,8 +130,12 @@ def _match_author(
         }
 
     best: dict[str, Any] | None = None
-    for person in people:
-        score = SequenceMatcher(None, normalized_author, person["normalized_name"]).ratio()
+    for person, matcher in people:
+        matcher.set_seq1(normalized_author)
+        # Both quick ratios are upper bounds of ratio(); skip people that cannot reach the threshold.
+        if matcher.real_quick_ratio() < FUZZY_THRESHOLD or matcher.quick_ratio() < FUZZY_THRESHOLD:
+            continue
+        score = matcher.ratio()
         if score < FUZZY_THRESHOLD:
             continue
         if best is None or score > best["match_score"]:
@@ -221,6 +242,8 @@ def evaluate_endogeny(submission: dict[str, Any]) -> dict[str, Any]:
     people, by_exact, by_initials = _build_people_index(role_people)
     matched_articles: list[dict[str, Any]] = []
     metrics_units: list[dict[str, Any]] = []
+    # Authors recur across articles and units; resolve each distinct name once.
+    author_matches: dict[str, dict[str, Any] | None] = {}
 
     for unit in units:
         label = str(unit.get("label", "Unknown unit"))
@@ -236,11 +259,16 @@ def evaluate_endogeny(submission: dict[str, Any]) -> dict[str, Any]:
 
             best_match: dict[str, Any] | None = None
             for author_name in authors:
-                maybe_match = _match_author(str(author_name), people, by_exact, by_initials)
+                author = str(author_name)
+                if author not in author_matches:
+                    author_matches[author] = _match_author(author, people, by_exact, by_initials)
+                maybe_match = author_matches[author]
                 if maybe_match is None:
                     continue
                 if best_match is None or maybe_match["match_score"] > best_match["match_score"]:
                     best_match = maybe_match
+                    if best_match["match_score"] >= 1.0:
+                        break
 
             if best_match is not None:
                 numerator += 1
@@ -250,11 +278,11 @@ def evaluate_endogeny(submission: dict[str, Any]) -> dict[str, Any]:
                         "article_title": article_title,
                         "article_url": article_url,
                         "matched_author": best_match["author"],
-                        "matched_role": best_match["person"]["role"],
-                        "matched_person_name": best_match["person"]["name"],
+                        "matched_role": best_match["person"].role,
+                        "matched_person_name": best_match["person"].name,
                         "matching_method": best_match["matching_method"],
                         "match_score": best_match["match_score"],
-                        "person_source_url": best_match["person"]["source_url"],
+                        "person_source_url": best_match["person"].source_url,
                     }
                 )
 
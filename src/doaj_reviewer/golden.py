@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import Future, ThreadPoolExecutor
 import copy
+from functools import lru_cache
 import json
 from pathlib import Path
 from typing import Any, Callable
 
-from .review import render_review_summary_markdown, render_review_summary_text, run_review
+from ._files import load_json, load_json_memoized
+from ._parallel import map_in_processes
+from .review import BoundedEvaluationCache, render_review_summary_markdown, render_review_summary_text, run_review
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -18,13 +22,12 @@ DEFAULT_CASES_PATH = REPO_ROOT / "specs" / "reviewer" / "golden" / "golden-cases
 
 ScenarioBuilder = Callable[[dict[str, Any]], dict[str, Any]]
 
-
-def _load_json(path: Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+ARTIFACT_WRITE_WORKERS = 4
+_EVALUATION_CACHE = BoundedEvaluationCache()
 
 
 def _write_json(path: Path, payload: dict[str, Any]) -> None:
+    # Golden artifacts are diffed across environments, so they always use the stdlib encoder.
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as handle:
         json.dump(payload, handle, indent=2, ensure_ascii=False)
@@ -37,6 +40,14 @@ def _write_text(path: Path, content: str) -> None:
         handle.write(content)
 
 
+ArtifactWriter = Callable[[Path, Any], None]
+ArtifactEmitter = Callable[[ArtifactWriter, Path, Any], None]
+
+
+def _emit_now(write: ArtifactWriter, path: Path, content: Any) -> None:
+    write(path, content)
+
+
 def _source_urls(payload: dict[str, Any]) -> dict[str, Any]:
     raw = payload.get("source_urls", {})
     if not isinstance(raw, dict):
@@ -341,7 +352,14 @@ SCENARIO_BUILDERS: dict[str, ScenarioBuilder] = {
 
 
 def load_case_definitions(path: Path = DEFAULT_CASES_PATH) -> dict[str, Any]:
-    dataset = _load_json(path)
+    # Parsing and validation are memoized per file snapshot; each caller gets its own copy to edit.
+    stat = path.stat()
+    return copy.deepcopy(_load_case_definitions_snapshot(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=32)
+def _load_case_definitions_snapshot(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    dataset = load_json(Path(path))
     cases = dataset.get("cases", [])
     if not isinstance(cases, list):
         raise ValueError("Golden dataset must contain a list in `cases`.")
@@ -490,77 +508,95 @@ def _render_report_markdown(report: dict[str, Any], cases_path: Path, ruleset_pa
     return "\n".join(lines) + "\n"
 
 
+def _run_case(
+    case: dict[str, Any],
+    ruleset: dict[str, Any],
+    base_submission: dict[str, Any],
+    output_dir: Path,
+    emit: ArtifactEmitter = _emit_now,
+) -> dict[str, Any]:
+    case_id = str(case.get("id", "")).strip()
+    scenario = str(case.get("scenario", "")).strip()
+    builder = SCENARIO_BUILDERS[scenario]
+    expected = case.get("expected", {})
+    if not isinstance(expected, dict):
+        expected = {}
+
+    submission = builder(base_submission)
+    submission["submission_id"] = case_id
+
+    summary, endogeny = run_review(submission=submission, ruleset=ruleset, evaluation_cache=_EVALUATION_CACHE)
+    mismatches = _compare_expected(expected=expected, summary=summary, endogeny=endogeny)
+    is_match = len(mismatches) == 0
+
+    case_dir = output_dir / case_id
+    emit(_write_json, case_dir / "submission.structured.json", submission)
+    emit(_write_json, case_dir / "review-summary.json", summary)
+    emit(_write_text, case_dir / "review-summary.md", render_review_summary_markdown(summary))
+    emit(_write_text, case_dir / "review-summary.txt", render_review_summary_text(summary))
+    emit(_write_json, case_dir / "endogeny-result.json", endogeny)
+    emit(
+        _write_json,
+        case_dir / "assertion-result.json",
+        {
+            "case_id": case_id,
+            "scenario": scenario,
+            "expected": expected,
+            "actual_overall": summary.get("overall_result", ""),
+            "actual_endogeny": endogeny.get("result", ""),
+            "is_match": is_match,
+            "mismatches": mismatches,
+        },
+    )
+
+    return {
+        "case_id": case_id,
+        "scenario": scenario,
+        "expected_overall": expected.get("overall_result", ""),
+        "actual_overall": summary.get("overall_result", ""),
+        "actual_endogeny": endogeny.get("result", ""),
+        "is_match": is_match,
+        "mismatches": mismatches,
+    }
+
+
 def run_golden_dataset(
     output_dir: Path,
     *,
     cases_path: Path = DEFAULT_CASES_PATH,
     ruleset_path: Path = DEFAULT_RULESET_PATH,
     base_submission_path: Path = DEFAULT_BASE_SUBMISSION,
+    max_workers: int = 1,
 ) -> dict[str, Any]:
     output_dir.mkdir(parents=True, exist_ok=True)
     dataset = load_case_definitions(cases_path)
-    ruleset = _load_json(ruleset_path)
-    base_submission = _load_json(base_submission_path)
+    ruleset = load_json_memoized(ruleset_path)
+    base_submission = load_json(base_submission_path)
 
-    rows: list[dict[str, Any]] = []
-    all_match = True
     cases = dataset.get("cases", [])
     if not isinstance(cases, list):
         cases = []
+    cases = [case for case in cases if isinstance(case, dict)]
 
-    for case in cases:
-        if not isinstance(case, dict):
-            continue
-        case_id = str(case.get("id", "")).strip()
-        scenario = str(case.get("scenario", "")).strip()
-        builder = SCENARIO_BUILDERS[scenario]
-        expected = case.get("expected", {})
-        if not isinstance(expected, dict):
-            expected = {}
-
-        submission = builder(base_submission)
-        submission["submission_id"] = case_id
-
-        summary, endogeny = run_review(submission=submission, ruleset=ruleset)
-        mismatches = _compare_expected(expected=expected, summary=summary, endogeny=endogeny)
-        is_match = len(mismatches) == 0
-        all_match = all_match and is_match
-
-        case_dir = output_dir / case_id
-        _write_json(case_dir / "submission.structured.json", submission)
-        _write_json(case_dir / "review-summary.json", summary)
-        _write_text(case_dir / "review-summary.md", render_review_summary_markdown(summary))
-        _write_text(case_dir / "review-summary.txt", render_review_summary_text(summary))
-        _write_json(case_dir / "endogeny-result.json", endogeny)
-        _write_json(
-            case_dir / "assertion-result.json",
-            {
-                "case_id": case_id,
-                "scenario": scenario,
-                "expected": expected,
-                "actual_overall": summary.get("overall_result", ""),
-                "actual_endogeny": endogeny.get("result", ""),
-                "is_match": is_match,
-                "mismatches": mismatches,
-            },
-        )
+    if max_workers > 1 and len(cases) > 1:
+        # Cases are independent and CPU-bound, so spread them over processes.
+        rows = map_in_processes(_run_case, cases, ruleset, base_submission, output_dir, max_workers=max_workers)
+    else:
+        # Hand artifact writes to a small thread pool so disk I/O overlaps with evaluating the next case.
+        pending: list[Future[None]] = []
+        with ThreadPoolExecutor(max_workers=ARTIFACT_WRITE_WORKERS) as writer:
 
-        rows.append(
-            {
-                "case_id": case_id,
-                "scenario": scenario,
-                "expected_overall": expected.get("overall_result", ""),
-                "actual_overall": summary.get("overall_result", ""),
-                "actual_endogeny": endogeny.get("result", ""),
-                "is_match": is_match,
-                "mismatches": mismatches,
-            }
-        )
+            def emit(write: ArtifactWriter, path: Path, content: Any) -> None:
+                pending.append(writer.submit(write, path, content))
+
+            rows = [_run_case(case, ruleset, base_submission, output_dir, emit) for case in cases]
+        for future in pending:
+            future.result()
 
     report = {
         "dataset_id": dataset.get("dataset_id", ""),
         "dataset_version": dataset.get("version", ""),
-        "ok": all_match,
+        "ok": all(bool(row.get("is_match", False)) for row in rows),
         "scenario_count": len(rows),
         "matched_count": len([row for row in rows if bool(row.get("is_match", False))]),
         "rows": rows,
@@ -576,6 +612,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--cases", default=str(DEFAULT_CASES_PATH), help="Path to golden case definitions JSON.")
     parser.add_argument("--ruleset", default=str(DEFAULT_RULESET_PATH), help="Path to must-ruleset JSON.")
     parser.add_argument("--base-submission", default=str(DEFAULT_BASE_SUBMISSION), help="Path to base structured submission JSON.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes used to run golden cases (default 1 runs them in-process).",
+    )
     return parser.parse_args()
 
 
@@ -586,6 +628,7 @@ def main() -> int:
         cases_path=Path(args.cases),
         ruleset_path=Path(args.ruleset),
         base_submission_path=Path(args.base_submission),
+        max_workers=max(1, args.workers),
     )
     print(f"Golden cases: {report.get('scenario_count', 0)}")
     print(f"Matched expectation: {report.get('matched_count', 0)}")
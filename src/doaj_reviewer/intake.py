@@ -82,6 +82,10 @@ STOPWORDS = {
     "access",
 }
 PERSON_PATTERN = re.compile(r"[A-Z][A-Za-z'`\-]+(?:\s+[A-Z][A-Za-z'`\-]+){1,4}")
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_LOWER_ALPHA_RE = re.compile(r"[^a-z]")
+_NAME_SEPARATOR_RE = re.compile(r"[-,;|]")
+_YEAR_RE = re.compile(r"(19|20)\d{2}")
 AFFILIATION_KEYWORDS = {
     "university",
     "institute",
@@ -98,6 +102,17 @@ AFFILIATION_KEYWORDS = {
     "laboratoire",
     "research",
 }
+# Meta keys are already lowercase, matching the keys stored by parse_html.
+ARTICLE_AUTHOR_META_KEYS = ("citation_author", "dc.creator", "dc.contributor.author", "author")
+ARTICLE_TITLE_META_KEYS = ("citation_title", "og:title", "twitter:title")
+ARTICLE_TYPE_META_KEYS = ("citation_article_type", "dc.type", "article:section")
+PUBLICATION_DATE_META_KEYS = (
+    "citation_publication_date",
+    "citation_date",
+    "dc.date",
+    "prism.publicationdate",
+    "article:published_time",
+)
 
 
 def _now_iso_utc() -> str:
@@ -169,6 +184,24 @@ def _build_throttled_fetcher(
     return _fetch
 
 
+def _memoize_fetcher(fetcher):
+    # Per-submission memo: a URL listed under several source keys is fetched once.
+    results: dict[str, tuple[bool, Any]] = {}
+
+    def _fetch(url: str, timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS):
+        if url not in results:
+            try:
+                results[url] = (True, fetcher(url, timeout_seconds=timeout_seconds))
+            except Exception as exc:
+                results[url] = (False, exc)
+        ok, value = results[url]
+        if not ok:
+            raise value
+        return value
+
+    return _fetch
+
+
 def _waf_crawl_note(url: str, locator_hint: str, detection: dict[str, Any]) -> dict[str, str]:
     provider = str(detection.get("provider", "")).strip() or "unknown provider"
     reason = str(detection.get("reason", "")).strip() or "challenge page detected"
@@ -221,10 +254,10 @@ def _looks_like_person_name(raw_name: str) -> bool:
         return False
     if any(ch.isdigit() for ch in name):
         return False
-    parts = [part for part in re.split(r"\s+", name) if part]
+    parts = [part for part in _WHITESPACE_RE.split(name) if part]
     if len(parts) < 2 or len(parts) > 5:
         return False
-    normalized_parts = [re.sub(r"[^a-z]", "", part.lower()) for part in parts]
+    normalized_parts = [_NON_LOWER_ALPHA_RE.sub("", part.lower()) for part in parts]
     if any(part in STOPWORDS for part in normalized_parts if part):
         return False
     alpha_len = sum(c.isalpha() for c in name)
@@ -250,7 +283,7 @@ def _extract_person_names_from_line(line: str) -> list[str]:
 
 
 def _clean_affiliation(text: str) -> str:
-    value = re.sub(r"\s+", " ", text or "").strip(" -,:;|()[]")
+    value = _WHITESPACE_RE.sub(" ", text or "").strip(" -,:;|()[]")
     return value[:180]
 
 
@@ -287,22 +320,18 @@ def _extract_affiliation_from_line(line: str, person_name: str) -> str:
 
 
 def extract_role_people_from_document(doc: ParsedDocument, default_role: str) -> list[dict[str, str]]:
-    lines = [line.strip() for line in doc.text.splitlines() if line.strip()]
+    lines = doc.nonempty_lines
     people: list[dict[str, str]] = []
-    seen = set()
+    seen: dict[tuple[str, str], dict[str, str]] = {}
     active_role = default_role
 
     def _append_person(name: str, role: str, affiliation: str) -> None:
         key = (normalize_name(name), role)
-        if key in seen:
-            if affiliation:
-                for item in people:
-                    if normalize_name(item.get("name", "")) == key[0] and item.get("role", "") == role:
-                        if not str(item.get("affiliation", "")).strip():
-                            item["affiliation"] = affiliation
-                        break
+        existing = seen.get(key)
+        if existing is not None:
+            if affiliation and not str(existing.get("affiliation", "")).strip():
+                existing["affiliation"] = affiliation
             return
-        seen.add(key)
         payload = {
             "name": name,
             "role": role,
@@ -310,6 +339,7 @@ def extract_role_people_from_document(doc: ParsedDocument, default_role: str) ->
         }
         if affiliation:
             payload["affiliation"] = affiliation
+        seen[key] = payload
         people.append(payload)
 
     for line in lines:
@@ -317,7 +347,7 @@ def extract_role_people_from_document(doc: ParsedDocument, default_role: str) ->
 
         # Pattern: "Jane Smith - Editor in Chief"
         if "-" in line or "," in line:
-            primary = re.split(r"[-,;|]", line, maxsplit=1)[0].strip()
+            primary = _NAME_SEPARATOR_RE.split(line, maxsplit=1)[0].strip()
             if _looks_like_person_name(primary):
                 _append_person(primary, active_role, _extract_affiliation_from_line(line, primary))
 
@@ -360,30 +390,26 @@ def _article_link_score(link: str) -> int:
     return score
 
 
+def _first_meta_value(meta: dict[str, list[str]], keys: tuple[str, ...]) -> str | None:
+    for key in keys:
+        for value in meta.get(key, ()):
+            if value:
+                return value
+    return None
+
+
 def _extract_publication_date(doc: ParsedDocument) -> str | None:
-    values = flatten_meta_values(
-        doc.meta,
-        [
-            "citation_publication_date",
-            "citation_date",
-            "dc.date",
-            "prism.publicationdate",
-            "article:published_time",
-        ],
-    )
-    for value in values:
-        value = value.strip()
-        if not value:
-            continue
-        return value
+    for key in PUBLICATION_DATE_META_KEYS:
+        for value in doc.meta.get(key, ()):
+            value = value.strip()
+            if value:
+                return value
     return None
 
 
 def _extract_article_type(doc: ParsedDocument) -> str:
-    values = flatten_meta_values(doc.meta, ["citation_article_type", "dc.type", "article:section"])
-    if values:
-        return values[0].strip()
-    return ""
+    value = _first_meta_value(doc.meta, ARTICLE_TYPE_META_KEYS)
+    return value.strip() if value else ""
 
 
 def _is_research_article(article_type: str, title: str) -> bool:
@@ -395,13 +421,13 @@ def _is_research_article(article_type: str, title: str) -> bool:
 
 
 def extract_article_from_document(doc: ParsedDocument) -> dict[str, Any] | None:
-    authors = flatten_meta_values(doc.meta, ["citation_author", "dc.creator", "dc.contributor.author", "author"])
-    title_candidates = flatten_meta_values(doc.meta, ["citation_title", "og:title", "twitter:title"])
-    title = title_candidates[0].strip() if title_candidates else doc.title.strip()
-    article_type = _extract_article_type(doc)
-
+    authors = flatten_meta_values(doc.meta, ARTICLE_AUTHOR_META_KEYS)
     if not authors:
         return None
+    title_value = _first_meta_value(doc.meta, ARTICLE_TITLE_META_KEYS)
+    title = title_value.strip() if title_value else doc.title.strip()
+    article_type = _extract_article_type(doc)
+
     if not title:
         title = doc.url
     if not _is_research_article(article_type, title):
@@ -523,7 +549,7 @@ def collect_research_articles_from_unit(
 def _year_from_date_text(value: str | None) -> int | None:
     if not value:
         return None
-    match = re.search(r"(19|20)\d{2}", value)
+    match = _YEAR_RE.search(value)
     if not match:
         return None
     year = int(match.group(0))
@@ -592,6 +618,7 @@ def build_structured_submission_from_raw(
             return fetch_parsed_document_with_fallback(url=url, timeout_seconds=timeout_seconds, js_mode=js_mode)
 
         fetcher = _build_throttled_fetcher(base_fetcher)
+    fetcher = _memoize_fetcher(fetcher)
 
     submission_id = str(raw_submission.get("submission_id", ""))
     homepage = str(raw_submission.get("journal_homepage_url", ""))
@@ -673,7 +700,7 @@ def build_structured_submission_from_raw(
             {
                 "kind": "editor_list",
                 "url": url,
-                "excerpt": safe_excerpt(" | ".join(top_lines(doc.text, limit=3))),
+                "excerpt": safe_excerpt(" | ".join(doc.nonempty_lines[:3])),
                 "locator_hint": "editorial-page-top-lines",
             }
         )
@@ -706,7 +733,7 @@ def build_structured_submission_from_raw(
             {
                 "kind": "reviewer_list",
                 "url": url,
-                "excerpt": safe_excerpt(" | ".join(top_lines(doc.text, limit=3))),
+                "excerpt": safe_excerpt(" | ".join(doc.nonempty_lines[:3])),
                 "locator_hint": "reviewer-page-top-lines",
             }
         )
@@ -3,31 +3,22 @@
 from __future__ import annotations
 
 import argparse
+from collections import OrderedDict
 from datetime import datetime, timezone
+import hashlib
 import json
 from pathlib import Path
-from typing import Any
-
-from .basic_rules import (
-    evaluate_aims_scope,
-    evaluate_archiving_policy,
-    evaluate_copyright_author_rights,
-    evaluate_editorial_board,
-    evaluate_issn_consistency,
-    evaluate_instructions_for_authors,
-    evaluate_license_terms,
-    evaluate_open_access_statement,
-    evaluate_peer_review_policy,
-    evaluate_plagiarism_policy,
-    evaluate_publisher_identity,
-    evaluate_publication_fees_disclosure,
-    evaluate_repository_policy,
-)
+import threading
+from typing import Any, Callable, Iterator, MutableMapping
+
+from ._files import load_json
+from .basic_rules import BASIC_RULES, SUPPLEMENTARY_RULES, policy_page_index
 from .endogeny import evaluate_endogeny
 from .reporting import render_endogeny_markdown
 
 
 DEFAULT_RULESET_PATH = "specs/reviewer/rules/ruleset.must.v1.json"
+EVALUATION_CACHE_MAXSIZE = 4096
 
 MUST_RULE_HINT_BY_ID = {
     "doaj.open_access_statement.v1": "open_access_statement",
@@ -54,11 +45,6 @@ def _now_iso_utc() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
-def _load_json(path: Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
-
-
 def _write_json(path: Path, payload: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as handle:
@@ -764,102 +750,156 @@ def render_review_summary_text(summary: dict[str, Any]) -> str:
     return "\n".join(lines).rstrip() + "\n"
 
 
-def run_review(submission: dict[str, Any], ruleset: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+# Submission fields read by the basic rule evaluators; anything else does not
+# affect their outcome and is left out of the cache key.
+EVALUATOR_INPUT_FIELDS = ("source_urls", "policy_pages", "evidence", "role_people")
+
+EvaluationCache = MutableMapping[tuple[str, bytes], dict[str, Any]]
+
+
+class BoundedEvaluationCache(MutableMapping):
+    # LRU-bounded and locked on every access, so concurrent review threads can share one instance.
+    def __init__(self, maxsize: int = EVALUATION_CACHE_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, bytes], dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: tuple[str, bytes]) -> dict[str, Any]:
+        with self._lock:
+            value = self._entries[key]
+            self._entries.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: tuple[str, bytes], value: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __delitem__(self, key: tuple[str, bytes]) -> None:
+        with self._lock:
+            del self._entries[key]
+
+    def __iter__(self) -> Iterator[tuple[str, bytes]]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def evaluator_input_digest(submission: dict[str, Any]) -> bytes:
+    payload = {field: submission.get(field) for field in EVALUATOR_INPUT_FIELDS}
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+def _run_evaluator(
+    evaluator: Callable[[dict[str, Any]], dict[str, Any]],
+    submission: dict[str, Any],
+    cache: EvaluationCache | None,
+    digest: bytes,
+) -> dict[str, Any]:
+    if cache is None:
+        return evaluator(submission)
+    key = (evaluator.__name__, digest)
+    outcome = cache.get(key)
+    if outcome is None:
+        outcome = evaluator(submission)
+        cache[key] = outcome
+    return outcome
+
+
+def run_review(
+    submission: dict[str, Any],
+    ruleset: dict[str, Any],
+    *,
+    evaluation_cache: EvaluationCache | None = None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
     checks_out: list[dict[str, Any]] = []
     supplementary_checks: list[dict[str, Any]] = []
     endogeny_report: dict[str, Any] | None = None
-    rule_evaluators = {
-        "doaj.open_access_statement.v1": evaluate_open_access_statement,
-        "doaj.aims_scope.v1": evaluate_aims_scope,
-        "doaj.editorial_board.v1": evaluate_editorial_board,
-        "doaj.instructions_for_authors.v1": evaluate_instructions_for_authors,
-        "doaj.peer_review_policy.v1": evaluate_peer_review_policy,
-        "doaj.license_terms.v1": evaluate_license_terms,
-        "doaj.copyright_author_rights.v1": evaluate_copyright_author_rights,
-        "doaj.publication_fees_disclosure.v1": evaluate_publication_fees_disclosure,
-        "doaj.publisher_identity.v1": evaluate_publisher_identity,
-        "doaj.issn_consistency.v1": evaluate_issn_consistency,
-    }
-    supplementary_evaluators = [
-        evaluate_plagiarism_policy,
-        evaluate_archiving_policy,
-        evaluate_repository_policy,
-    ]
-
-    for check in ruleset.get("checks", []):
-        rule_id = str(check.get("rule_id", ""))
-        implemented = bool(check.get("implemented", False))
-
-        if rule_id == "doaj.endogeny.v1":
-            endogeny_report = evaluate_endogeny(submission)
-            evidence_urls = []
-            for item in endogeny_report.get("evidence", []):
-                if not isinstance(item, dict):
-                    continue
-                url = str(item.get("url", "")).strip()
-                if url:
-                    evidence_urls.append(url)
+    digest = evaluator_input_digest(submission) if evaluation_cache is not None else b""
+
+    with policy_page_index(submission):
+        for check in ruleset.get("checks", []):
+            rule_id = str(check.get("rule_id", ""))
+            implemented = bool(check.get("implemented", False))
+
+            if rule_id == "doaj.endogeny.v1":
+                endogeny_report = evaluate_endogeny(submission)
+                evidence_urls = []
+                for item in endogeny_report.get("evidence", []):
+                    if not isinstance(item, dict):
+                        continue
+                    url = str(item.get("url", "")).strip()
+                    if url:
+                        evidence_urls.append(url)
+                checks_out.append(
+                    {
+                        "rule_id": rule_id,
+                        "implemented": True,
+                        "result": endogeny_report.get("result", "need_human_review"),
+                        "confidence": endogeny_report.get("confidence", 0.0),
+                        "notes": endogeny_report.get("explanation_en", ""),
+                        "evidence_urls": _dedupe_strings(evidence_urls),
+                    }
+                )
+                continue
+
+            rule_hint = MUST_RULE_HINT_BY_ID.get(rule_id, "")
+            if rule_hint in BASIC_RULES:
+                outcome = _run_evaluator(BASIC_RULES[rule_hint], submission, evaluation_cache, digest)
+                checks_out.append(
+                    {
+                        "rule_id": rule_id,
+                        "implemented": True,
+                        "result": outcome.get("result", "need_human_review"),
+                        "confidence": outcome.get("confidence", 0.0),
+                        "notes": outcome.get("notes", ""),
+                        "evidence_urls": _dedupe_strings(_as_string_list(outcome.get("evidence_urls", []))),
+                    }
+                )
+                continue
+
+            if not implemented:
+                checks_out.append(
+                    {
+                        "rule_id": rule_id,
+                        "implemented": False,
+                        "result": "need_human_review",
+                        "confidence": 0.0,
+                        "notes": "Rule evaluator is not implemented yet.",
+                        "evidence_urls": [],
+                    }
+                )
+                continue
+
             checks_out.append(
                 {
                     "rule_id": rule_id,
                     "implemented": True,
-                    "result": endogeny_report.get("result", "need_human_review"),
-                    "confidence": endogeny_report.get("confidence", 0.0),
-                    "notes": endogeny_report.get("explanation_en", ""),
-                    "evidence_urls": _dedupe_strings(evidence_urls),
+                    "result": "need_human_review",
+                    "confidence": 0.0,
+                    "notes": "Rule is marked implemented but no evaluator binding exists.",
+                    "evidence_urls": [],
                 }
             )
-            continue
 
-        if rule_id in rule_evaluators:
-            outcome = rule_evaluators[rule_id](submission)
-            checks_out.append(
+        for rule_hint in SUPPLEMENTARY_RULE_HINT_BY_ID.values():
+            evaluator = SUPPLEMENTARY_RULES[rule_hint]
+            outcome = _run_evaluator(evaluator, submission, evaluation_cache, digest)
+            supplementary_checks.append(
                 {
-                    "rule_id": rule_id,
-                    "implemented": True,
+                    "rule_id": outcome.get("rule_id", ""),
                     "result": outcome.get("result", "need_human_review"),
                     "confidence": outcome.get("confidence", 0.0),
                     "notes": outcome.get("notes", ""),
                     "evidence_urls": _dedupe_strings(_as_string_list(outcome.get("evidence_urls", []))),
                 }
             )
-            continue
-
-        if not implemented:
-            checks_out.append(
-                {
-                    "rule_id": rule_id,
-                    "implemented": False,
-                    "result": "need_human_review",
-                    "confidence": 0.0,
-                    "notes": "Rule evaluator is not implemented yet.",
-                    "evidence_urls": [],
-                }
-            )
-            continue
-
-        checks_out.append(
-            {
-                "rule_id": rule_id,
-                "implemented": True,
-                "result": "need_human_review",
-                "confidence": 0.0,
-                "notes": "Rule is marked implemented but no evaluator binding exists.",
-                "evidence_urls": [],
-            }
-        )
-
-    for evaluator in supplementary_evaluators:
-        outcome = evaluator(submission)
-        supplementary_checks.append(
-            {
-                "rule_id": outcome.get("rule_id", ""),
-                "result": outcome.get("result", "need_human_review"),
-                "confidence": outcome.get("confidence", 0.0),
-                "notes": outcome.get("notes", ""),
-                "evidence_urls": _dedupe_strings(_as_string_list(outcome.get("evidence_urls", []))),
-            }
-        )
 
     if endogeny_report is None:
         endogeny_report = {
@@ -937,8 +977,8 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> int:
     args = parse_args()
-    submission = _load_json(Path(args.submission))
-    ruleset = _load_json(Path(args.ruleset))
+    submission = load_json(Path(args.submission))
+    ruleset = load_json(Path(args.ruleset))
     summary, endogeny = run_review(submission=submission, ruleset=ruleset)
 
     _write_json(Path(args.summary_json), summary)
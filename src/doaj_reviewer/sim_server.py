@@ -10,15 +10,18 @@ from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import io
 import json
+import os
 from pathlib import Path
+import re
 import traceback
 from typing import Any
 from urllib.parse import parse_qs, unquote, urlparse
 from uuid import uuid4
 
+from ._files import TextWriter, json_text, load_json_memoized, write_text
 from .intake import build_structured_submission_from_raw
 from .reporting import render_endogeny_markdown
-from .review import render_review_summary_markdown, render_review_summary_text, run_review
+from .review import BoundedEvaluationCache, render_review_summary_markdown, render_review_summary_text, run_review
 
 
 URL_FIELDS = [
@@ -99,25 +102,21 @@ REQUIRED_URL_FIELDS = [
     "publication_fees_disclosure",
 ]
 
+# URL_FIELDS lists these in the same relative order, so fused validation reports them in this order.
+_REQUIRED_URL_FIELD_SET = frozenset(REQUIRED_URL_FIELDS)
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_RULESET_PATH = REPO_ROOT / "specs" / "reviewer" / "rules" / "ruleset.must.v1.json"
 DEFAULT_RUNS_DIR = REPO_ROOT / "runs"
+_B64_RE = re.compile(r"[A-Za-z0-9+/]+=*")
 
 
 def split_urls(text: str) -> list[str]:
     if not text:
         return []
-    seen = set()
-    out: list[str] = []
-    for line in text.replace("|", "\n").splitlines():
-        value = line.strip()
-        if not value:
-            continue
-        if value in seen:
-            continue
-        seen.add(value)
-        out.append(value)
-    return out
+    # dict.fromkeys keeps first-seen order while dropping repeats.
+    values = (line.strip() for line in text.replace("|", "\n").splitlines())
+    return list(dict.fromkeys(value for value in values if value))
 
 
 def _extract_text_from_pdf_bytes(payload: bytes) -> str:
@@ -175,9 +174,14 @@ def _normalize_manual_policy_pages(payload: dict[str, Any]) -> tuple[list[dict[s
         pdf_base64 = str(item.get("pdf_base64", "")).strip()
         if pdf_base64:
             file_name = str(item.get("file_name", "")).strip() or f"{hint}.pdf"
-            try:
-                pdf_bytes = base64.b64decode(pdf_base64, validate=True)
-            except Exception:
+            # Cheap shape check first so malformed uploads skip the decoder's exception path.
+            pdf_bytes = None
+            if _B64_RE.fullmatch(pdf_base64):
+                try:
+                    pdf_bytes = base64.b64decode(pdf_base64, validate=True)
+                except Exception:
+                    pdf_bytes = None
+            if pdf_bytes is None:
                 warnings.append(f"Manual PDF `{file_name}` for `{hint}` could not be decoded.")
                 continue
             extracted = _extract_text_from_pdf_bytes(pdf_bytes)
@@ -203,6 +207,12 @@ def _now_stamp() -> str:
 
 
 def build_raw_submission_from_form(payload: dict[str, Any]) -> dict[str, Any]:
+    raw, _ = build_and_validate_raw_submission(payload)
+    return raw
+
+
+# Same errors as validate_raw_submission, collected while the URL lists are built.
+def build_and_validate_raw_submission(payload: dict[str, Any]) -> tuple[dict[str, Any], list[str]]:
     submission_id = str(payload.get("submission_id", "")).strip()
     homepage = str(payload.get("journal_homepage_url", "")).strip()
     publication_model = str(payload.get("publication_model", "issue_based")).strip() or "issue_based"
@@ -212,9 +222,15 @@ def build_raw_submission_from_form(payload: dict[str, Any]) -> dict[str, Any]:
         suffix = uuid4().hex[:8]
         submission_id = f"SIM-{_now_stamp()}-{suffix}"
 
+    errors: list[str] = []
+    if not homepage:
+        errors.append("journal_homepage_url is required")
     source_urls: dict[str, list[str]] = {}
     for field in URL_FIELDS:
-        source_urls[field] = split_urls(str(payload.get(field, "")))
+        urls = split_urls(str(payload.get(field, "")))
+        source_urls[field] = urls
+        if not urls and field in _REQUIRED_URL_FIELD_SET:
+            errors.append(f"At least one `{field}` URL is required")
     manual_policy_pages, manual_warnings = _normalize_manual_policy_pages(payload)
 
     raw = {
@@ -227,7 +243,7 @@ def build_raw_submission_from_form(payload: dict[str, Any]) -> dict[str, Any]:
         raw["manual_policy_pages"] = manual_policy_pages
     if manual_warnings:
         raw["manual_input_warnings"] = manual_warnings
-    return raw
+    return raw, errors
 
 
 def validate_raw_submission(raw: dict[str, Any]) -> list[str]:
@@ -244,24 +260,6 @@ def validate_raw_submission(raw: dict[str, Any]) -> list[str]:
     return errors
 
 
-def _write_json(path: Path, data: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(data, handle, indent=2, ensure_ascii=False)
-        handle.write("\n")
-
-
-def _write_text(path: Path, data: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        handle.write(data)
-
-
-def _read_json(path: Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
-
-
 def _sanitize_cell(value: Any) -> str:
     return " ".join(str(value or "").split())
 
@@ -340,6 +338,13 @@ def _export_fieldnames() -> list[str]:
     return fieldnames
 
 
+# Export columns are fixed by RESULT_RULE_COLUMNS, so build the header once.
+EXPORT_FIELDNAMES = tuple(_export_fieldnames())
+_RULE_EXPORT_KEYS = tuple(
+    (rule_id, f"{rule_id}__note", f"{rule_id}__problem_urls") for rule_id in RESULT_RULE_COLUMNS
+)
+
+
 def _parse_limit(raw: str | None, default: int | None) -> int | None:
     if raw is None:
         return default
@@ -355,20 +360,22 @@ def _parse_limit(raw: str | None, default: int | None) -> int | None:
 
 
 class SimulationApp:
-    def __init__(self, ruleset_path: Path, runs_dir: Path) -> None:
+    def __init__(self, ruleset_path: Path, runs_dir: Path, *, ruleset: dict[str, Any] | None = None) -> None:
+        # A pre-parsed ruleset is used as-is; otherwise the path shares the memoized parse.
         self.ruleset_path = ruleset_path
         self.runs_dir = runs_dir
         self.runs_dir.mkdir(parents=True, exist_ok=True)
-        self.ruleset = _read_json(ruleset_path)
+        self.ruleset = ruleset if ruleset is not None else load_json_memoized(ruleset_path)
+        # Re-runs of an unchanged crawl reuse rule outcomes; generated_at_utc is still fresh per run.
+        self._evaluation_cache = BoundedEvaluationCache()
 
-    def run_submission(self, form_payload: dict[str, Any]) -> dict[str, Any]:
+    def run_submission(self, form_payload: dict[str, Any], writer: TextWriter = write_text) -> dict[str, Any]:
         js_mode = str(form_payload.get("js_mode", "auto")).strip().lower() or "auto"
         if js_mode not in {"off", "auto", "on"}:
             js_mode = "auto"
 
-        raw = build_raw_submission_from_form(form_payload)
+        raw, errors = build_and_validate_raw_submission(form_payload)
         warnings = [str(item) for item in raw.get("manual_input_warnings", []) if str(item).strip()]
-        errors = validate_raw_submission(raw)
         if errors:
             return {
                 "ok": False,
@@ -378,7 +385,6 @@ class SimulationApp:
 
         run_id = f"{_now_stamp()}-{uuid4().hex[:8]}"
         run_dir = self.runs_dir / run_id
-        run_dir.mkdir(parents=True, exist_ok=True)
 
         raw_path = run_dir / "submission.raw.json"
         structured_path = run_dir / "submission.structured.json"
@@ -389,17 +395,21 @@ class SimulationApp:
         endogeny_md_path = run_dir / "endogeny-report.md"
         error_path = run_dir / "error.txt"
 
-        _write_json(raw_path, raw)
+        writer(raw_path, json_text(raw))
         try:
             structured = build_structured_submission_from_raw(raw, js_mode=js_mode)
-            _write_json(structured_path, structured)
+            writer(structured_path, json_text(structured))
 
-            summary, endogeny = run_review(submission=structured, ruleset=self.ruleset)
-            _write_json(summary_json_path, summary)
-            _write_text(summary_md_path, render_review_summary_markdown(summary))
-            _write_text(summary_txt_path, render_review_summary_text(summary))
-            _write_json(endogeny_json_path, endogeny)
-            _write_text(endogeny_md_path, render_endogeny_markdown(endogeny))
+            summary, endogeny = run_review(
+                submission=structured,
+                ruleset=self.ruleset,
+                evaluation_cache=self._evaluation_cache,
+            )
+            writer(summary_json_path, json_text(summary))
+            writer(summary_md_path, render_review_summary_markdown(summary))
+            writer(summary_txt_path, render_review_summary_text(summary))
+            writer(endogeny_json_path, json_text(endogeny))
+            writer(endogeny_md_path, render_endogeny_markdown(endogeny))
 
             artifacts = {
                 "raw": f"/runs/{run_id}/submission.raw.json",
@@ -423,7 +433,7 @@ class SimulationApp:
             }
         except Exception:
             stack = traceback.format_exc()
-            _write_text(error_path, stack)
+            writer(error_path, stack)
             return {
                 "ok": False,
                 "run_id": run_id,
@@ -436,10 +446,12 @@ class SimulationApp:
             }
 
     def _run_dirs(self, limit: int | None = 20) -> list[Path]:
-        run_dirs = sorted([p for p in self.runs_dir.iterdir() if p.is_dir()], reverse=True)
-        if limit is None:
-            return run_dirs
-        return run_dirs[:limit]
+        # scandir reports the entry type from the directory listing, so no stat per run.
+        with os.scandir(self.runs_dir) as entries:
+            names = sorted((entry.name for entry in entries if entry.is_dir()), reverse=True)
+        if limit is not None:
+            names = names[:limit]
+        return [self.runs_dir / name for name in names]
 
     def list_runs(self, limit: int | None = 20) -> list[dict[str, Any]]:
         rows: list[dict[str, Any]] = []
@@ -452,7 +464,7 @@ class SimulationApp:
             summary_file = run_dir / "review-summary.json"
             if summary_file.exists():
                 try:
-                    summary = _read_json(summary_file)
+                    summary = load_json_memoized(summary_file)
                     item["overall_result"] = summary.get("overall_result", "")
                 except Exception:
                     item["overall_result"] = "unknown"
@@ -463,9 +475,8 @@ class SimulationApp:
 
     def export_rows(self, limit: int | None = None) -> list[dict[str, str]]:
         rows: list[dict[str, str]] = []
-        fieldnames = _export_fieldnames()
         for run_dir in self._run_dirs(limit=limit):
-            row = {name: "" for name in fieldnames}
+            row = dict.fromkeys(EXPORT_FIELDNAMES, "")
             row["run_id"] = run_dir.name
             row["overall_result"] = "not_available"
 
@@ -473,7 +484,7 @@ class SimulationApp:
             raw_file = run_dir / "submission.raw.json"
             if raw_file.exists():
                 try:
-                    raw = _read_json(raw_file)
+                    raw = load_json_memoized(raw_file)
                     row["submission_id"] = str(raw.get("submission_id", ""))
                     source_urls = raw.get("source_urls", {})
                     if isinstance(source_urls, dict):
@@ -484,7 +495,7 @@ class SimulationApp:
             summary_file = run_dir / "review-summary.json"
             if summary_file.exists():
                 try:
-                    summary = _read_json(summary_file)
+                    summary = load_json_memoized(summary_file)
                     row["submission_id"] = str(summary.get("submission_id", row["submission_id"]))
                     row["overall_result"] = str(summary.get("overall_result", ""))
                     row["overall_decision_reason"] = _sanitize_cell(summary.get("overall_decision_reason", ""))
@@ -498,7 +509,7 @@ class SimulationApp:
                     must_attention_notes: list[str] = []
                     must_attention_urls: list[str] = []
 
-                    for rule_id in RESULT_RULE_COLUMNS:
+                    for rule_id, note_key, urls_key in _RULE_EXPORT_KEYS:
                         check = by_rule.get(rule_id, {})
                         if isinstance(check, dict):
                             result = _sanitize_cell(check.get("result", ""))
@@ -510,9 +521,9 @@ class SimulationApp:
                             problem_urls = []
 
                         row[rule_id] = result
-                        row[f"{rule_id}__note"] = note
+                        row[note_key] = note
                         if result in {"fail", "need_human_review"}:
-                            row[f"{rule_id}__problem_urls"] = _join_csv_cell(problem_urls)
+                            row[urls_key] = _join_csv_cell(problem_urls)
                             if result:
                                 must_attention_rules.append(f"{rule_id}:{result}")
                             if note:
@@ -520,7 +531,7 @@ class SimulationApp:
                             for url in problem_urls:
                                 must_attention_urls.append(f"{rule_id}:{url}")
                         else:
-                            row[f"{rule_id}__problem_urls"] = ""
+                            row[urls_key] = ""
 
                     supplementary_checks = [
                         check for check in summary.get("supplementary_checks", []) if isinstance(check, dict)
@@ -554,12 +565,12 @@ class SimulationApp:
         return rows
 
     def render_export_csv(self, limit: int | None = None) -> str:
-        fieldnames = _export_fieldnames()
+        fieldnames = EXPORT_FIELDNAMES
         buffer = io.StringIO()
-        writer = csv.DictWriter(buffer, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in self.export_rows(limit=limit):
-            writer.writerow({key: row.get(key, "") for key in fieldnames})
+        writer = csv.writer(buffer)
+        writer.writerow(fieldnames)
+        # export_rows fills every field, so rows map straight onto the header order.
+        writer.writerows(tuple(row[key] for key in fieldnames) for row in self.export_rows(limit=limit))
         return buffer.getvalue()
 
 
@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import argparse
 import csv
-import json
 from pathlib import Path
 from typing import Any
 
+from ._files import TextWriter, json_text, load_json_memoized, write_text
 from .intake import build_structured_submission_from_raw
 from .review import render_review_summary_markdown, render_review_summary_text, run_review
 from .reporting import render_endogeny_markdown
@@ -135,24 +135,6 @@ def _validate_raw_submission(raw: dict[str, Any]) -> list[str]:
     return errors
 
 
-def _load_ruleset(path: Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
-
-
-def _write_json(path: Path, payload: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2, ensure_ascii=False)
-        handle.write("\n")
-
-
-def _write_text(path: Path, content: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        handle.write(content)
-
-
 def _write_overview_csv(path: Path, rows: list[dict[str, str]]) -> None:
     fieldnames = ["submission_id", "overall_result"] + RESULT_RULE_COLUMNS
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -170,8 +152,14 @@ def run_batch(
     list_sep: str = "|",
     js_mode: str = "auto",
     convert_only: bool = False,
+    writer: TextWriter = write_text,
+    *,
+    ruleset: dict[str, Any] | None = None,
 ) -> int:
-    ruleset = {} if convert_only else _load_ruleset(ruleset_path)
+    if convert_only:
+        ruleset = {}
+    elif ruleset is None:
+        ruleset = load_json_memoized(ruleset_path)
     results_overview: list[dict[str, str]] = []
 
     with input_csv.open("r", encoding="utf-8-sig", newline="") as handle:
@@ -198,7 +186,7 @@ def run_batch(
             endogeny_json_path = base / "endogeny-result.json"
             endogeny_md_path = base / "endogeny-report.md"
 
-            _write_json(raw_path, raw)
+            writer(raw_path, json_text(raw))
             if convert_only:
                 overview_row = {
                     "submission_id": submission_id,
@@ -210,14 +198,14 @@ def run_batch(
                 continue
 
             structured = build_structured_submission_from_raw(raw, js_mode=js_mode)
-            _write_json(structured_path, structured)
+            writer(structured_path, json_text(structured))
 
             summary, endogeny = run_review(submission=structured, ruleset=ruleset)
-            _write_json(summary_json_path, summary)
-            _write_text(summary_md_path, render_review_summary_markdown(summary))
-            _write_text(summary_txt_path, render_review_summary_text(summary))
-            _write_json(endogeny_json_path, endogeny)
-            _write_text(endogeny_md_path, render_endogeny_markdown(endogeny))
+            writer(summary_json_path, json_text(summary))
+            writer(summary_md_path, render_review_summary_markdown(summary))
+            writer(summary_txt_path, render_review_summary_text(summary))
+            writer(endogeny_json_path, json_text(endogeny))
+            writer(endogeny_md_path, render_endogeny_markdown(endogeny))
 
             by_rule = {item["rule_id"]: item["result"] for item in summary.get("checks", [])}
             overview_row = {
@@ -8,6 +8,7 @@ import json
 from pathlib import Path
 from typing import Any
 
+from ._parallel import map_in_processes
 from .review import render_review_summary_markdown, render_review_summary_text, run_review
 
 
@@ -158,45 +159,50 @@ def _render_uat_markdown(rows: list[dict[str, Any]], ruleset_path: Path) -> str:
     return "\n".join(lines) + "\n"
 
 
+def _run_scenario(scenario: dict[str, Any], ruleset: dict[str, Any], output_dir: Path) -> dict[str, Any]:
+    scenario_id = str(scenario["id"])
+    submission = copy.deepcopy(scenario["submission"])
+    summary, endogeny = run_review(submission=submission, ruleset=ruleset)
+    actual = str(summary.get("overall_result", "need_human_review"))
+    expected = str(scenario["expected_overall"])
+
+    scenario_dir = output_dir / scenario_id
+    _write_json(scenario_dir / "review-summary.json", summary)
+    _write_text(scenario_dir / "review-summary.md", render_review_summary_markdown(summary))
+    _write_text(scenario_dir / "review-summary.txt", render_review_summary_text(summary))
+    _write_json(scenario_dir / "endogeny-result.json", endogeny)
+
+    return {
+        "scenario_id": scenario_id,
+        "scenario_name": str(scenario["name"]),
+        "expected": expected,
+        "actual": actual,
+        "is_match": actual == expected,
+    }
+
+
 def run_uat_scenarios(
     output_dir: Path,
     ruleset_path: Path = DEFAULT_RULESET_PATH,
     base_submission_path: Path = DEFAULT_BASE_SUBMISSION,
+    *,
+    base_submission: dict[str, Any] | None = None,
+    max_workers: int = 1,
 ) -> dict[str, Any]:
     output_dir.mkdir(parents=True, exist_ok=True)
     ruleset = _load_json(ruleset_path)
-    base_submission = _load_json(base_submission_path)
+    # Scenarios deep-copy the base, so a caller's pre-parsed submission is never mutated.
+    if base_submission is None:
+        base_submission = _load_json(base_submission_path)
     scenarios = build_uat_scenarios(base_submission)
 
-    rows: list[dict[str, Any]] = []
-    all_match = True
-    for scenario in scenarios:
-        scenario_id = str(scenario["id"])
-        submission = copy.deepcopy(scenario["submission"])
-        summary, endogeny = run_review(submission=submission, ruleset=ruleset)
-        actual = str(summary.get("overall_result", "need_human_review"))
-        expected = str(scenario["expected_overall"])
-        is_match = actual == expected
-        all_match = all_match and is_match
-
-        scenario_dir = output_dir / scenario_id
-        _write_json(scenario_dir / "review-summary.json", summary)
-        _write_text(scenario_dir / "review-summary.md", render_review_summary_markdown(summary))
-        _write_text(scenario_dir / "review-summary.txt", render_review_summary_text(summary))
-        _write_json(scenario_dir / "endogeny-result.json", endogeny)
-
-        rows.append(
-            {
-                "scenario_id": scenario_id,
-                "scenario_name": str(scenario["name"]),
-                "expected": expected,
-                "actual": actual,
-                "is_match": is_match,
-            }
-        )
+    if max_workers > 1 and len(scenarios) > 1:
+        rows = map_in_processes(_run_scenario, scenarios, ruleset, output_dir, max_workers=max_workers)
+    else:
+        rows = [_run_scenario(scenario, ruleset, output_dir) for scenario in scenarios]
 
     report = {
-        "ok": all_match,
+        "ok": all(bool(row["is_match"]) for row in rows),
         "scenario_count": len(rows),
         "matched_count": len([row for row in rows if row["is_match"]]),
         "rows": rows,
@@ -211,6 +217,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--output-dir", default="artifacts/uat", help="Directory to store UAT output artifacts.")
     parser.add_argument("--ruleset", default=str(DEFAULT_RULESET_PATH), help="Path to ruleset JSON.")
     parser.add_argument("--base-submission", default=str(DEFAULT_BASE_SUBMISSION), help="Path to base structured submission JSON.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes used to run UAT scenarios (default 1 runs them in-process).",
+    )
     return parser.parse_args()
 
 
@@ -220,6 +232,7 @@ def main() -> int:
         output_dir=Path(args.output_dir),
         ruleset_path=Path(args.ruleset),
         base_submission_path=Path(args.base_submission),
+        max_workers=max(1, args.workers),
     )
     print(f"UAT scenarios: {report.get('scenario_count', 0)}")
     print(f"Matched expectation: {report.get('matched_count', 0)}")
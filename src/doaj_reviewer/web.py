@@ -2,18 +2,98 @@
 
 from __future__ import annotations
 
+import atexit
+import codecs
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from html import unescape
 from html.parser import HTMLParser
+import io
+import os
 import re
 import ssl
-from typing import Any
+import threading
+import time
+from typing import Any, Iterable, Iterator
 from urllib.error import HTTPError, URLError
 from urllib.parse import urljoin, urlparse
 from urllib.request import Request, urlopen
 
 
 DEFAULT_USER_AGENT = "DOAJ-Reviewer/0.1 (+https://github.com/)"
+HTTPX_MAX_KEEPALIVE_CONNECTIONS = 32
+READ_CHUNK_BYTES = 65536
+FETCH_CACHE_ENV = "DOAJ_REVIEWER_FETCH_CACHE"
+FETCH_CACHE_MAXSIZE = 256
+FETCH_CACHE_TTL_SECONDS = 3600
+FETCH_CACHE_NEGATIVE_TTL_SECONDS = 300
+HTML_PARSER_ENV = "DOAJ_REVIEWER_HTML_PARSER"
+
+_ABSOLUTE_URL_PREFIXES = ("http://", "https://")
+_INLINE_SPACE_RE = re.compile(r"[ \t\r\f\v]+")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_SPACE_RE = re.compile(r"\s+")
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?([A-Za-z0-9_.:-]+)", re.IGNORECASE)
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_TEXT_MEDIA_TYPE_RE = re.compile(r"^(?:text/|application/(?:xhtml|xml|json|rss|atom|javascript)|.+\+(?:xml|json)$)")
+_CERT_ERROR_RE = re.compile(r"certificate verify failed|unable to get local issuer certificate", re.IGNORECASE)
+WAF_PROVIDER_TOKENS = (
+    ("cloudflare", ("cloudflare", "__cf_chl_", "cf-ray", "cf-chl", "just a moment...")),
+    ("akamai", ("akamai", "akamai ghost", "akamaibot")),
+    ("imperva", ("imperva", "incapsula")),
+    ("sucuri", ("sucuri", "sucuri website firewall")),
+    ("generic_waf", ("web application firewall", "waf", "ddos protection")),
+)
+WAF_STRONG_MARKERS = (
+    "checking your browser before accessing",
+    "attention required!",
+    "verify you are human",
+    "please enable cookies",
+    "captcha",
+    "turnstile",
+    "security check",
+    "request blocked",
+    "access denied",
+    "automated queries",
+    "bot protection",
+    "challenge platform",
+)
+WAF_GENERIC_MARKERS = (
+    "forbidden",
+    "temporarily unavailable",
+    "rate limited",
+    "too many requests",
+    "blocked",
+    "challenge",
+)
+WAF_SCAN_TOKENS = tuple(
+    dict.fromkeys(
+        [token for _, tokens in WAF_PROVIDER_TOKENS for token in tokens]
+        + list(WAF_STRONG_MARKERS)
+        + list(WAF_GENERIC_MARKERS)
+    )
+)
+
+BLOCK_TAGS = {"p", "div", "section", "article", "li", "h1", "h2", "h3", "h4", "h5", "h6"}
+JS_ROOT_MOUNT_IDS = {"app", "root"}
+JS_TEXT_HINTS = ("enable javascript", "javascript is required")
+JS_RAW_HTML_HINTS = JS_TEXT_HINTS + ("noscript", "__next", "data-reactroot")
+
+_HTTPX_CLIENTS: dict[bool, Any] = {}
+_HTTPX_CLIENTS_LOCK = threading.Lock()
+_PLAYWRIGHT_STATE: dict[str, Any] = {}
+_FETCH_URL_CACHE: OrderedDict[tuple[str, int], tuple[float, tuple[int, str, str]]] = OrderedDict()
+_PARSED_DOCUMENT_CACHE: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+# sim_server runs reviews on concurrent request threads, so cache reads and writes go through one lock.
+_FETCH_CACHE_LOCK = threading.Lock()
+_LXML_PARSERS = threading.local()
 
 
 @dataclass
@@ -26,6 +106,13 @@ class ParsedDocument:
     links: list[str]
     meta: dict[str, list[str]]
     raw_html: str
+    script_count: int | None = None
+    has_root_mount: bool | None = None
+    has_js_hint: bool | None = None
+
+    @cached_property
+    def nonempty_lines(self) -> list[str]:
+        return [line.strip() for line in self.text.splitlines() if line.strip()]
 
 
 class _HTMLCollector(HTMLParser):
@@ -35,82 +122,215 @@ class _HTMLCollector(HTMLParser):
         self._skip_depth = 0
         self._in_title = False
         self.title_parts: list[str] = []
-        self.text_parts: list[str] = []
+        self.text_buffer = io.StringIO()
         self.links: list[str] = []
+        self._seen_hrefs: set[str] = set()
+        self._seen_links: set[str] = set()
         self.meta: dict[str, list[str]] = {}
+        self.script_count = 0
+        self.has_root_mount = False
+        self.has_js_hint = False
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        attrs_dict = {k.lower(): (v or "") for k, v in attrs}
-        tag_l = tag.lower()
-
-        if tag_l in {"script", "style", "noscript"}:
+        # HTMLParser already lowercases tag and attribute names.
+        for name, value in attrs:
+            if name == "id" and value:
+                element_id = value.strip().lower()
+                if element_id in JS_ROOT_MOUNT_IDS:
+                    self.has_root_mount = True
+                elif "__next" in element_id:
+                    self.has_js_hint = True
+            elif name == "data-reactroot":
+                self.has_js_hint = True
+
+        if tag in {"script", "style", "noscript"}:
+            if tag == "script":
+                self.script_count += 1
+            elif tag == "noscript":
+                self.has_js_hint = True
             self._skip_depth += 1
             return
-        if tag_l == "title":
+        if tag == "title":
             self._in_title = True
             return
-        if tag_l == "br":
-            self.text_parts.append("\n")
+        if tag == "br":
+            self.text_buffer.write("\n ")
+            return
+        if tag in BLOCK_TAGS:
+            self.text_buffer.write("\n ")
             return
-        if tag_l in {"p", "div", "section", "article", "li", "h1", "h2", "h3", "h4", "h5", "h6"}:
-            self.text_parts.append("\n")
 
-        if tag_l == "a":
-            href = attrs_dict.get("href", "").strip()
-            if href:
-                self.links.append(urljoin(self.base_url, href))
+        if tag == "a":
+            href = ""
+            for name, value in attrs:
+                if name == "href":
+                    href = (value or "").strip()
+            if href and href not in self._seen_hrefs:
+                self._seen_hrefs.add(href)
+                link = href if href.startswith(_ABSOLUTE_URL_PREFIXES) else urljoin(self.base_url, href).strip()
+                if link and link not in self._seen_links:
+                    self._seen_links.add(link)
+                    self.links.append(link)
             return
 
-        if tag_l == "meta":
-            key = (
-                attrs_dict.get("name", "")
-                or attrs_dict.get("property", "")
-                or attrs_dict.get("http-equiv", "")
-            ).strip().lower()
-            value = attrs_dict.get("content", "").strip()
+        if tag == "meta":
+            meta_name = meta_property = http_equiv = content = ""
+            for name, value in attrs:
+                if name == "name":
+                    meta_name = value or ""
+                elif name == "property":
+                    meta_property = value or ""
+                elif name == "http-equiv":
+                    http_equiv = value or ""
+                elif name == "content":
+                    content = value or ""
+            key = (meta_name or meta_property or http_equiv).strip().lower()
+            value = content.strip()
             if key and value:
                 self.meta.setdefault(key, []).append(value)
 
     def handle_endtag(self, tag: str) -> None:
-        tag_l = tag.lower()
-        if tag_l in {"script", "style", "noscript"}:
+        if tag in {"script", "style", "noscript"}:
             self._skip_depth = max(0, self._skip_depth - 1)
             return
-        if tag_l == "title":
+        if tag == "title":
             self._in_title = False
             return
-        if tag_l in {"p", "div", "section", "article", "li", "h1", "h2", "h3", "h4", "h5", "h6"}:
-            self.text_parts.append("\n")
+        if tag in BLOCK_TAGS:
+            self.text_buffer.write("\n ")
 
     def handle_data(self, data: str) -> None:
         if self._skip_depth > 0:
             return
         if self._in_title:
             self.title_parts.append(data)
-        self.text_parts.append(data)
+        self.text_buffer.write(data)
+        self.text_buffer.write(" ")
 
 
-def _decode_body(body: bytes, content_type: str) -> str:
-    charset_match = re.search(r"charset=([^\s;]+)", content_type or "", re.IGNORECASE)
-    if charset_match:
-        encoding = charset_match.group(1).strip("\"' ")
-        try:
-            return body.decode(encoding, errors="replace")
-        except LookupError:
-            pass
-    for fallback in ("utf-8", "latin-1"):
-        try:
-            return body.decode(fallback, errors="replace")
-        except Exception:
+def _lxml_modules() -> tuple[Any, Any] | None:
+    # Opt-in only: libxml2 repairs broken markup differently from html.parser.
+    if os.environ.get(HTML_PARSER_ENV, "").strip().lower() != "lxml":
+        return None
+    try:
+        from lxml import etree, html as lxml_html  # type: ignore
+    except ImportError:
+        return None
+    return etree, lxml_html
+
+
+def _feed_lxml(collector: _HTMLCollector, html: str) -> bool:
+    modules = _lxml_modules()
+    if modules is None:
+        return False
+    etree, lxml_html = modules
+    # lxml parsers are not thread-safe, so reuse one per thread.
+    parser = getattr(_LXML_PARSERS, "parser", None)
+    if parser is None:
+        parser = _LXML_PARSERS.parser = lxml_html.HTMLParser(encoding="utf-8")
+    try:
+        root = lxml_html.document_fromstring(html.encode("utf-8"), parser=parser)
+    except (ValueError, etree.ParserError):
+        return False
+
+    # Replay the tree as HTMLParser events so both backends share one collector.
+    for event, element in etree.iterwalk(root, events=("start", "end")):
+        is_tag = isinstance(element.tag, str)
+        if event == "start":
+            if is_tag:
+                collector.handle_starttag(element.tag.lower(), list(element.attrib.items()))
+                if element.text:
+                    collector.handle_data(element.text)
+            continue
+        if is_tag:
+            collector.handle_endtag(element.tag.lower())
+        if element.tail and element is not root:
+            collector.handle_data(element.tail)
+        # Subtree fully replayed; drop it so large pages do not keep the whole tree alive.
+        element.clear(keep_tail=True)
+    return True
+
+
+def _text_encoding(name: str) -> str | None:
+    if not name:
+        return None
+    try:
+        info = codecs.lookup(name)
+    except LookupError:
+        return None
+    if not getattr(info, "_is_text_encoding", True):
+        return None
+    return info.name
+
+
+def _detect_encoding(head: bytes, content_type: str) -> str:
+    for bom, encoding in _BOM_ENCODINGS:
+        if head.startswith(bom):
+            return encoding
+
+    content_type = content_type or ""
+    idx = content_type.lower().find("charset=")
+    if idx != -1:
+        charset = content_type[idx + 8 :].split(";", 1)[0].split()
+        encoding = _text_encoding(charset[0].strip("\"' ") if charset else "")
+        if encoding:
+            return encoding
+
+    meta_match = _META_CHARSET_RE.search(head[:1024])
+    if meta_match:
+        encoding = _text_encoding(meta_match.group(1).decode("ascii", errors="ignore"))
+        if encoding:
+            return encoding
+    return "utf-8"
+
+
+def _decode_chunks(chunks: Iterable[bytes], content_type: str, max_bytes: int) -> str:
+    decoder = None
+    parts: list[str] = []
+    remaining = max_bytes
+    for chunk in chunks:
+        if remaining <= 0:
+            break
+        if not chunk:
             continue
-    return body.decode("utf-8", errors="replace")
+        if len(chunk) > remaining:
+            chunk = chunk[:remaining]
+        remaining -= len(chunk)
+        if decoder is None:
+            decoder = codecs.getincrementaldecoder(_detect_encoding(chunk, content_type))(errors="replace")
+        parts.append(decoder.decode(chunk))
+    if decoder is not None:
+        parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+
+def _iter_response_chunks(response, max_bytes: int) -> Iterator[bytes]:
+    remaining = max_bytes
+    while remaining > 0:
+        chunk = response.read(min(READ_CHUNK_BYTES, remaining))
+        if not chunk:
+            return
+        remaining -= len(chunk)
+        yield chunk
+
+
+def _is_text_content_type(content_type: str) -> bool:
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if not media_type:
+        return True
+    return _TEXT_MEDIA_TYPE_RE.match(media_type) is not None
+
+
+def _read_decoded(response, content_type: str, max_bytes: int) -> str:
+    if not _is_text_content_type(content_type):
+        return ""
+    return _decode_chunks(_iter_response_chunks(response, max_bytes), content_type, max_bytes)
 
 
 def _response_to_tuple(response, max_bytes: int) -> tuple[int, str, str]:
     status_code = int(getattr(response, "status", 200))
     content_type = str(response.headers.get("Content-Type", ""))
-    body = response.read(max_bytes)
-    return status_code, content_type, _decode_body(body, content_type)
+    return status_code, content_type, _read_decoded(response, content_type, max_bytes)
 
 
 def _is_cert_verification_error(exc: Exception) -> bool:
@@ -120,21 +340,137 @@ def _is_cert_verification_error(exc: Exception) -> bool:
         reason = exc.reason
         if isinstance(reason, ssl.SSLCertVerificationError):
             return True
-        if isinstance(reason, ssl.SSLError) and "CERTIFICATE_VERIFY_FAILED" in str(reason):
-            return True
-    text = str(exc).lower()
-    return "certificate verify failed" in text or "unable to get local issuer certificate" in text
+        if isinstance(reason, ssl.SSLError):
+            reason_text = str(reason)
+            return "CERTIFICATE_VERIFY_FAILED" in reason_text or _CERT_ERROR_RE.search(reason_text) is not None
+        if isinstance(reason, OSError):
+            return False
+    return _CERT_ERROR_RE.search(str(exc)) is not None
+
+
+@lru_cache(maxsize=1)
+def _httpx_module() -> Any | None:
+    # httpx is optional; probe once so the default install does not retry the import on every fetch.
+    try:
+        import httpx  # type: ignore
+    except ImportError:
+        return None
+    return httpx
+
+
+def _httpx_client(verify: bool = True):
+    client = _HTTPX_CLIENTS.get(verify)
+    if client is not None:
+        return client
+    httpx = _httpx_module()
+    if httpx is None:
+        return None
+
+    # Concurrent sim_server requests must not each build (and leak) a client.
+    with _HTTPX_CLIENTS_LOCK:
+        client = _HTTPX_CLIENTS.get(verify)
+        if client is None:
+            client = httpx.Client(
+                headers={"User-Agent": DEFAULT_USER_AGENT},
+                follow_redirects=True,
+                verify=verify,
+                limits=httpx.Limits(max_keepalive_connections=HTTPX_MAX_KEEPALIVE_CONNECTIONS),
+            )
+            _HTTPX_CLIENTS[verify] = client
+    return client
+
+
+def close_session() -> None:
+    with _HTTPX_CLIENTS_LOCK:
+        clients = list(_HTTPX_CLIENTS.values())
+        _HTTPX_CLIENTS.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+def _fetch_url_httpx(client, url: str, timeout_seconds: int, max_bytes: int) -> tuple[int, str, str]:
+    with client.stream("GET", url, timeout=timeout_seconds) as response:
+        content_type = str(response.headers.get("Content-Type", ""))
+        html = ""
+        if _is_text_content_type(content_type):
+            html = _decode_chunks(response.iter_bytes(), content_type, max_bytes)
+        return int(response.status_code), content_type, html
+
+
+def _mark_insecure(content_type: str) -> str:
+    if content_type:
+        return f"{content_type}; tls=insecure-no-verify"
+    return "text/html; tls=insecure-no-verify"
+
+
+def fetch_cache_enabled() -> bool:
+    return os.environ.get(FETCH_CACHE_ENV, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def clear_fetch_cache() -> None:
+    with _FETCH_CACHE_LOCK:
+        _FETCH_URL_CACHE.clear()
+        _PARSED_DOCUMENT_CACHE.clear()
+
+
+def _cache_get(cache: OrderedDict, key: Any) -> Any:
+    with _FETCH_CACHE_LOCK:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return value
+
+
+def _cache_put(cache: OrderedDict, key: Any, value: Any, status_code: int) -> None:
+    ttl = FETCH_CACHE_NEGATIVE_TTL_SECONDS if status_code >= 400 else FETCH_CACHE_TTL_SECONDS
+    with _FETCH_CACHE_LOCK:
+        cache[key] = (time.monotonic() + ttl, value)
+        cache.move_to_end(key)
+        while len(cache) > FETCH_CACHE_MAXSIZE:
+            cache.popitem(last=False)
 
 
 def fetch_url(url: str, timeout_seconds: int = 20, max_bytes: int = 2_000_000) -> tuple[int, str, str]:
+    if not fetch_cache_enabled():
+        return _fetch_url_uncached(url, timeout_seconds=timeout_seconds, max_bytes=max_bytes)
+
+    key = (url, max_bytes)
+    cached = _cache_get(_FETCH_URL_CACHE, key)
+    if cached is not None:
+        return cached
+    result = _fetch_url_uncached(url, timeout_seconds=timeout_seconds, max_bytes=max_bytes)
+    _cache_put(_FETCH_URL_CACHE, key, result, result[0])
+    return result
+
+
+def _fetch_url_uncached(url: str, timeout_seconds: int, max_bytes: int) -> tuple[int, str, str]:
+    client = _httpx_client()
+    if client is not None:
+        try:
+            return _fetch_url_httpx(client, url, timeout_seconds, max_bytes)
+        except Exception as exc:
+            if not _is_cert_verification_error(exc):
+                raise
+        status_code, content_type, html = _fetch_url_httpx(
+            _httpx_client(verify=False), url, timeout_seconds, max_bytes
+        )
+        return status_code, _mark_insecure(content_type), html
+
     req = Request(url=url, headers={"User-Agent": DEFAULT_USER_AGENT})
     try:
         with urlopen(req, timeout=timeout_seconds) as response:
             return _response_to_tuple(response, max_bytes=max_bytes)
     except HTTPError as exc:
         content_type = str(exc.headers.get("Content-Type", ""))
-        body = exc.read(max_bytes)
-        return int(exc.code), content_type, _decode_body(body, content_type)
+        return int(exc.code), content_type, _read_decoded(exc, content_type, max_bytes)
     except Exception as exc:
         if not _is_cert_verification_error(exc):
             raise
@@ -143,19 +479,56 @@ def fetch_url(url: str, timeout_seconds: int = 20, max_bytes: int = 2_000_000) -
         try:
             with urlopen(req, timeout=timeout_seconds, context=insecure_context) as response:
                 status_code, content_type, html = _response_to_tuple(response, max_bytes=max_bytes)
-                if content_type:
-                    content_type = f"{content_type}; tls=insecure-no-verify"
-                else:
-                    content_type = "text/html; tls=insecure-no-verify"
-                return status_code, content_type, html
+                return status_code, _mark_insecure(content_type), html
         except HTTPError as insecure_exc:
             content_type = str(insecure_exc.headers.get("Content-Type", ""))
-            body = insecure_exc.read(max_bytes)
-            if content_type:
-                content_type = f"{content_type}; tls=insecure-no-verify"
-            else:
-                content_type = "text/html; tls=insecure-no-verify"
-            return int(insecure_exc.code), content_type, _decode_body(body, content_type)
+            html = _read_decoded(insecure_exc, content_type, max_bytes)
+            return int(insecure_exc.code), _mark_insecure(content_type), html
+
+
+def close_playwright() -> None:
+    state = dict(_PLAYWRIGHT_STATE)
+    _PLAYWRIGHT_STATE.clear()
+    for key, method in (("context", "close"), ("browser", "close"), ("playwright", "stop")):
+        handle = state.get(key)
+        if handle is None:
+            continue
+        try:
+            getattr(handle, method)()
+        except Exception:
+            pass
+
+
+atexit.register(close_playwright)
+
+
+def _shared_playwright_context(sync_playwright):
+    # The sync API is bound to the thread that started it, so only the main
+    # thread keeps a long-lived browser; worker threads launch one per call.
+    if threading.current_thread() is not threading.main_thread():
+        return None
+    context = _PLAYWRIGHT_STATE.get("context")
+    if context is not None:
+        return context
+
+    playwright = sync_playwright().start()  # pragma: no cover - environment dependent
+    _PLAYWRIGHT_STATE["playwright"] = playwright
+    browser = playwright.chromium.launch(headless=True)
+    _PLAYWRIGHT_STATE["browser"] = browser
+    context = browser.new_context(user_agent=DEFAULT_USER_AGENT)
+    _PLAYWRIGHT_STATE["context"] = context
+    return context
+
+
+def _playwright_session_lost(exc: Exception) -> bool:
+    # Page-level failures (timeouts, navigation errors) keep the shared browser; a closed target does not.
+    browser = _PLAYWRIGHT_STATE.get("browser")
+    try:
+        if browser is not None and not browser.is_connected():
+            return True
+    except Exception:
+        return True
+    return "has been closed" in str(exc).lower()
 
 
 def fetch_url_playwright(url: str, timeout_seconds: int = 20) -> tuple[int, str, str]:
@@ -164,6 +537,35 @@ def fetch_url_playwright(url: str, timeout_seconds: int = 20) -> tuple[int, str,
     except Exception as exc:  # pragma: no cover - environment dependent
         raise RuntimeError("Playwright is not available in this environment.") from exc
 
+    content_type = "text/html; renderer=playwright"
+    try:
+        context = _shared_playwright_context(sync_playwright)
+    except Exception:  # pragma: no cover - environment dependent
+        close_playwright()
+        raise
+
+    if context is not None:
+        try:
+            page = context.new_page()
+        except Exception:
+            # A cached context that cannot open pages is dead; drop it so the next call relaunches.
+            close_playwright()
+            raise
+        try:
+            response = page.goto(url, wait_until="networkidle", timeout=max(1, timeout_seconds) * 1000)
+            html = page.content()
+            status_code = int(response.status) if response else 200
+        except Exception as exc:
+            if _playwright_session_lost(exc):
+                close_playwright()
+            raise
+        finally:
+            try:
+                page.close()
+            except Exception:
+                pass
+        return status_code, content_type, html
+
     with sync_playwright() as playwright:  # pragma: no cover - environment dependent
         browser = playwright.chromium.launch(headless=True)
         context = browser.new_context(user_agent=DEFAULT_USER_AGENT)
@@ -171,7 +573,6 @@ def fetch_url_playwright(url: str, timeout_seconds: int = 20) -> tuple[int, str,
         response = page.goto(url, wait_until="networkidle", timeout=max(1, timeout_seconds) * 1000)
         html = page.content()
         status_code = int(response.status) if response else 200
-        content_type = "text/html; renderer=playwright"
         page.close()
         context.close()
         browser.close()
@@ -180,24 +581,16 @@ def fetch_url_playwright(url: str, timeout_seconds: int = 20) -> tuple[int, str,
 
 def parse_html(url: str, status_code: int, content_type: str, html: str) -> ParsedDocument:
     parser = _HTMLCollector(url)
-    parser.feed(html)
-    parser.close()
+    if not _feed_lxml(parser, html):
+        parser.feed(html)
+        parser.close()
 
     title = unescape(" ".join(parser.title_parts)).strip()
-    text = unescape(" ".join(parser.text_parts))
-    text = re.sub(r"[ \t\r\f\v]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = unescape(parser.text_buffer.getvalue())
+    text = _INLINE_SPACE_RE.sub(" ", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
     text = "\n".join(line.strip() for line in text.splitlines())
-    text = re.sub(r"\n{3,}", "\n\n", text).strip()
-
-    links: list[str] = []
-    seen = set()
-    for link in parser.links:
-        link = link.strip()
-        if not link or link in seen:
-            continue
-        seen.add(link)
-        links.append(link)
+    text = _BLANK_LINES_RE.sub("\n\n", text).strip()
 
     return ParsedDocument(
         url=url,
@@ -205,15 +598,27 @@ def parse_html(url: str, status_code: int, content_type: str, html: str) -> Pars
         content_type=content_type,
         title=title,
         text=text,
-        links=links,
+        links=parser.links,
         meta=parser.meta,
         raw_html=html,
+        script_count=parser.script_count,
+        has_root_mount=parser.has_root_mount,
+        has_js_hint=parser.has_js_hint,
     )
 
 
 def fetch_parsed_document(url: str, timeout_seconds: int = 20) -> ParsedDocument:
+    # With the fetch cache on, every caller for a URL gets the same ParsedDocument; treat it as read-only.
+    use_cache = fetch_cache_enabled()
+    if use_cache:
+        cached = _cache_get(_PARSED_DOCUMENT_CACHE, url)
+        if cached is not None:
+            return cached
     status_code, content_type, html = fetch_url(url=url, timeout_seconds=timeout_seconds)
-    return parse_html(url=url, status_code=status_code, content_type=content_type, html=html)
+    doc = parse_html(url=url, status_code=status_code, content_type=content_type, html=html)
+    if use_cache:
+        _cache_put(_PARSED_DOCUMENT_CACHE, url, doc, status_code)
+    return doc
 
 
 def fetch_parsed_document_playwright(url: str, timeout_seconds: int = 20) -> ParsedDocument:
@@ -221,47 +626,49 @@ def fetch_parsed_document_playwright(url: str, timeout_seconds: int = 20) -> Par
     return parse_html(url=url, status_code=status_code, content_type=content_type, html=html)
 
 
+def _build_waf_automaton():
+    try:
+        import ahocorasick  # type: ignore
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for token in WAF_SCAN_TOKENS:
+        automaton.add_word(token, token)
+    automaton.make_automaton()
+    return automaton
+
+
+_WAF_AUTOMATON = _build_waf_automaton()
+
+
+def _scan_waf_tokens(fields: tuple[str, ...]) -> set[str]:
+    hits: set[str] = set()
+    for field in fields:
+        if not field:
+            continue
+        field_l = field.lower()
+        if _WAF_AUTOMATON is not None:
+            hits.update(token for _, token in _WAF_AUTOMATON.iter(field_l))
+            continue
+        hits.update(token for token in WAF_SCAN_TOKENS if token not in hits and token in field_l)
+        if len(hits) == len(WAF_SCAN_TOKENS):
+            break
+    return hits
+
+
 def detect_waf_challenge(doc: ParsedDocument) -> dict[str, Any]:
-    blob = f"{doc.title}\n{doc.text[:5000]}\n{doc.raw_html[:15000]}".lower()
     status_suspicious = doc.status_code in {401, 403, 406, 409, 429, 503}
+    hits = _scan_waf_tokens((doc.title, doc.text[:5000], doc.raw_html[:15000]))
 
     provider = ""
-    if any(token in blob for token in ["cloudflare", "__cf_chl_", "cf-ray", "cf-chl", "just a moment..."]):
-        provider = "cloudflare"
-    elif any(token in blob for token in ["akamai", "akamai ghost", "akamaibot"]):
-        provider = "akamai"
-    elif any(token in blob for token in ["imperva", "incapsula"]):
-        provider = "imperva"
-    elif any(token in blob for token in ["sucuri", "sucuri website firewall"]):
-        provider = "sucuri"
-    elif any(token in blob for token in ["web application firewall", "waf", "ddos protection"]):
-        provider = "generic_waf"
-
-    strong_markers = [
-        "checking your browser before accessing",
-        "attention required!",
-        "verify you are human",
-        "please enable cookies",
-        "captcha",
-        "turnstile",
-        "security check",
-        "request blocked",
-        "access denied",
-        "automated queries",
-        "bot protection",
-        "challenge platform",
-    ]
-    generic_markers = [
-        "forbidden",
-        "temporarily unavailable",
-        "rate limited",
-        "too many requests",
-        "blocked",
-        "challenge",
-    ]
-
-    matched_strong = [token for token in strong_markers if token in blob]
-    matched_generic = [token for token in generic_markers if token in blob]
+    for name, tokens in WAF_PROVIDER_TOKENS:
+        if not hits.isdisjoint(tokens):
+            provider = name
+            break
+
+    matched_strong = [token for token in WAF_STRONG_MARKERS if token in hits]
+    matched_generic = [token for token in WAF_GENERIC_MARKERS if token in hits]
     marker_count = len(matched_strong) + len(matched_generic)
     is_short_shell = len(doc.text.strip()) < 700
 
@@ -286,31 +693,33 @@ def detect_waf_challenge(doc: ParsedDocument) -> dict[str, Any]:
     }
 
 
-def needs_js_render(doc: ParsedDocument) -> bool:
-    html_l = doc.raw_html.lower()
-    text_len = len(doc.text.strip())
-    line_count = len([line for line in doc.text.splitlines() if line.strip()])
+def _raw_html_js_signals(raw_html: str) -> tuple[int, bool, bool]:
+    html_l = raw_html.lower()
     script_count = html_l.count("<script")
     has_root_mount = any(token in html_l for token in ['id="app"', "id='app'", 'id="root"', "id='root'"])
-    has_js_hint = any(
-        hint in html_l
-        for hint in [
-            "enable javascript",
-            "javascript is required",
-            "noscript",
-            "__next",
-            "data-reactroot",
-        ]
-    )
-    has_citation_meta = any(key.startswith("citation_") for key in doc.meta.keys())
+    has_js_hint = any(hint in html_l for hint in JS_RAW_HTML_HINTS)
+    return script_count, has_root_mount, has_js_hint
+
 
-    if has_citation_meta:
+def needs_js_render(doc: ParsedDocument) -> bool:
+    if any(key.startswith("citation_") for key in doc.meta.keys()):
         return False
+
+    if doc.script_count is None or doc.has_root_mount is None or doc.has_js_hint is None:
+        script_count, has_root_mount, has_js_hint = _raw_html_js_signals(doc.raw_html)
+    else:
+        script_count, has_root_mount, has_js_hint = doc.script_count, doc.has_root_mount, doc.has_js_hint
+
+    text_len = len(doc.text.strip())
+    if not has_js_hint and text_len < 300:
+        text_l = doc.text.lower()
+        has_js_hint = any(hint in text_l for hint in JS_TEXT_HINTS)
+
     if has_js_hint and text_len < 300:
         return True
     if has_root_mount and script_count >= 2 and text_len < 500:
         return True
-    if script_count >= 4 and line_count <= 5 and text_len < 220:
+    if script_count >= 4 and len(doc.nonempty_lines) <= 5 and text_len < 220:
         return True
     return False
 
@@ -358,9 +767,12 @@ def fetch_parsed_document_with_fallback(
         return static_doc
 
 
+_urlparse_cached = lru_cache(maxsize=4096)(urlparse)
+
+
 def same_domain(url_a: str, url_b: str) -> bool:
-    host_a = (urlparse(url_a).netloc or "").lower()
-    host_b = (urlparse(url_b).netloc or "").lower()
+    host_a = (_urlparse_cached(url_a).netloc or "").lower()
+    host_b = (_urlparse_cached(url_b).netloc or "").lower()
     if not host_a or not host_b:
         return False
     if host_a == host_b:
@@ -369,28 +781,38 @@ def same_domain(url_a: str, url_b: str) -> bool:
 
 
 def url_path(url: str) -> str:
-    return (urlparse(url).path or "").lower()
+    return (_urlparse_cached(url).path or "").lower()
 
 
-def flatten_meta_values(meta: dict[str, list[str]], keys: list[str]) -> list[str]:
+def flatten_meta_values(meta: dict[str, list[str]], keys: Iterable[str]) -> list[str]:
     values: list[str] = []
+    seen: set[str] = set()
     for key in keys:
         for value in meta.get(key.lower(), []):
-            if value and value not in values:
+            if value and value not in seen:
+                seen.add(value)
                 values.append(value)
     return values
 
 
 def safe_excerpt(text: str, limit: int = 300) -> str:
-    cleaned = re.sub(r"\s+", " ", text).strip()
+    cleaned = _SPACE_RE.sub(" ", text).strip()
     if len(cleaned) <= limit:
         return cleaned
     return cleaned[: limit - 3] + "..."
 
 
 def top_lines(text: str, limit: int = 8) -> list[str]:
-    lines = [line.strip() for line in text.splitlines() if line.strip()]
-    return lines[:limit]
+    lines: list[str] = []
+    if limit <= 0:
+        return lines
+    for line in text.splitlines():
+        line = line.strip()
+        if line:
+            lines.append(line)
+            if len(lines) >= limit:
+                break
+    return lines
 
 
 def summarize_document(doc: ParsedDocument) -> dict[str, Any]:
@@ -399,6 +821,6 @@ def summarize_document(doc: ParsedDocument) -> dict[str, Any]:
         "status_code": doc.status_code,
         "title": doc.title,
         "content_type": doc.content_type,
-        "line_count": len([line for line in doc.text.splitlines() if line.strip()]),
+        "line_count": len(doc.nonempty_lines),
         "link_count": len(doc.links),
     }
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import copy
 import unittest
 
+from doaj_reviewer._keyword_index import scan as scan_keywords
 from doaj_reviewer.basic_rules import (
+    BASIC_RULES,
+    SUPPLEMENTARY_RULES,
     evaluate_aims_scope,
     evaluate_copyright_author_rights,
     evaluate_editorial_board,
@@ -13,66 +17,83 @@ from doaj_reviewer.basic_rules import (
     evaluate_peer_review_policy,
     evaluate_publisher_identity,
     evaluate_publication_fees_disclosure,
+    policy_page_index,
 )
 
 
-def _submission_with_policy_pages(policy_pages):
-    return {
-        "submission_id": "BASIC-1",
-        "journal_homepage_url": "https://example.org",
-        "publication_model": "issue_based",
-        "source_urls": {
-            "editorial_board": ["https://example.org/editorial-board"],
-            "open_access_statement": ["https://example.org/open-access"],
-            "issn_consistency": ["https://example.org/about"],
-            "publisher_identity": ["https://example.org/publisher"],
-            "license_terms": ["https://example.org/licensing"],
-            "copyright_author_rights": ["https://example.org/copyright"],
-            "peer_review_policy": ["https://example.org/peer-review"],
-            "plagiarism_policy": [],
-            "aims_scope": ["https://example.org/aims-and-scope"],
-            "publication_fees_disclosure": ["https://example.org/apc"],
-            "archiving_policy": [],
-            "repository_policy": [],
-            "reviewers": [],
-            "latest_content": ["https://example.org/issue-1", "https://example.org/issue-2"],
-            "instructions_for_authors": ["https://example.org/instructions"],
-            "archives": [],
+_EDITORIAL_BOARD_URL = "https://example.org/editorial-board"
+_REVIEWERS_URL = "https://example.org/reviewers"
+_OPEN_ACCESS_URL = "https://example.org/open-access"
+_PUBLISHER_URL = "https://example.org/publisher"
+_LICENSING_URL = "https://example.org/licensing"
+_PEER_REVIEW_URL = "https://example.org/peer-review"
+_COPYRIGHT_URL = "https://example.org/copyright"
+_APC_URL = "https://example.org/apc"
+_ABOUT_URL = "https://example.org/about"
+_INSTRUCTIONS_URL = "https://example.org/instructions"
+_AIMS_SCOPE_URL = "https://example.org/aims-and-scope"
+
+
+_SUBMISSION_TEMPLATE = {
+    "submission_id": "BASIC-1",
+    "journal_homepage_url": "https://example.org",
+    "publication_model": "issue_based",
+    "source_urls": {
+        "editorial_board": [_EDITORIAL_BOARD_URL],
+        "open_access_statement": [_OPEN_ACCESS_URL],
+        "issn_consistency": [_ABOUT_URL],
+        "publisher_identity": [_PUBLISHER_URL],
+        "license_terms": [_LICENSING_URL],
+        "copyright_author_rights": [_COPYRIGHT_URL],
+        "peer_review_policy": [_PEER_REVIEW_URL],
+        "plagiarism_policy": [],
+        "aims_scope": [_AIMS_SCOPE_URL],
+        "publication_fees_disclosure": [_APC_URL],
+        "archiving_policy": [],
+        "repository_policy": [],
+        "reviewers": [],
+        "latest_content": ["https://example.org/issue-1", "https://example.org/issue-2"],
+        "instructions_for_authors": [_INSTRUCTIONS_URL],
+        "archives": [],
+    },
+    "role_people": [
+        {
+            "name": "Dr Jane Smith",
+            "role": "editor",
+            "source_url": _EDITORIAL_BOARD_URL,
+            "affiliation": "Example University",
         },
-        "role_people": [
-            {
-                "name": "Dr Jane Smith",
-                "role": "editor",
-                "source_url": "https://example.org/editorial-board",
-                "affiliation": "Example University",
-            },
-            {
-                "name": "Asep Rahman",
-                "role": "editorial_board_member",
-                "source_url": "https://example.org/editorial-board",
-                "affiliation": "Institute A",
-            },
-            {
-                "name": "Lina Putri",
-                "role": "editorial_board_member",
-                "source_url": "https://example.org/editorial-board",
-                "affiliation": "Institute B",
-            },
-            {
-                "name": "Dwi Prasetyo",
-                "role": "editorial_board_member",
-                "source_url": "https://example.org/editorial-board",
-                "affiliation": "Institute C",
-            },
-            {
-                "name": "Rina Lestari",
-                "role": "editorial_board_member",
-                "source_url": "https://example.org/editorial-board",
-                "affiliation": "Institute D",
-            },
-        ],
-        "policy_pages": policy_pages,
-    }
+        {
+            "name": "Asep Rahman",
+            "role": "editorial_board_member",
+            "source_url": _EDITORIAL_BOARD_URL,
+            "affiliation": "Institute A",
+        },
+        {
+            "name": "Lina Putri",
+            "role": "editorial_board_member",
+            "source_url": _EDITORIAL_BOARD_URL,
+            "affiliation": "Institute B",
+        },
+        {
+            "name": "Dwi Prasetyo",
+            "role": "editorial_board_member",
+            "source_url": _EDITORIAL_BOARD_URL,
+            "affiliation": "Institute C",
+        },
+        {
+            "name": "Rina Lestari",
+            "role": "editorial_board_member",
+            "source_url": _EDITORIAL_BOARD_URL,
+            "affiliation": "Institute D",
+        },
+    ],
+}
+
+
+def _submission_with_policy_pages(policy_pages):
+    # Deep copy so a test that edits source_urls or role_people cannot leak into later tests.
+    return {**copy.deepcopy(_SUBMISSION_TEMPLATE), "policy_pages": policy_pages}
 
 
 class BasicRuleTests(unittest.TestCase):
@@ -81,7 +102,7 @@ class BasicRuleTests(unittest.TestCase):
             [
                 {
                     "rule_hint": "open_access_statement",
-                    "url": "https://example.org/open-access",
+                    "url": _OPEN_ACCESS_URL,
                     "title": "Open Access",
                     "text": "This is an open access journal. Users may read, download, copy, distribute and reuse articles under Creative Commons CC BY.",
                 }
@@ -95,7 +116,7 @@ class BasicRuleTests(unittest.TestCase):
             [
                 {
                     "rule_hint": "open_access_statement",
-                    "url": "https://example.org/open-access",
+                    "url": _OPEN_ACCESS_URL,
                     "title": "Access Policy",
                     "text": "Access limited to subscribers and members only. Subscription required for full-text access.",
                 }
@@ -106,11 +127,11 @@ class BasicRuleTests(unittest.TestCase):
 
     def test_missing_policy_mentions_waf_block(self) -> None:
         submission = _submission_with_policy_pages([])
-        submission["source_urls"]["open_access_statement"] = ["https://example.org/open-access"]
+        submission["source_urls"]["open_access_statement"] = [_OPEN_ACCESS_URL]
         submission["evidence"] = [
             {
                 "kind": "crawl_note",
-                "url": "https://example.org/open-access",
+                "url": _OPEN_ACCESS_URL,
                 "excerpt": "WAF/anti-bot challenge detected (cloudflare): checking your browser before accessing.",
                 "locator_hint": "policy-waf-blocked-open_access_statement",
             }
@@ -124,7 +145,7 @@ class BasicRuleTests(unittest.TestCase):
             [
                 {
                     "rule_hint": "peer_review_policy",
-                    "url": "https://example.org/peer-review",
+                    "url": _PEER_REVIEW_URL,
                     "title": "Peer Review",
                     "text": "All manuscripts are peer reviewed with double blind process. At least two independent reviewers evaluate each article before editorial decision.",
                 }
@@ -138,7 +159,7 @@ class BasicRuleTests(unittest.TestCase):
             [
                 {
                     "rule_hint": "peer_review_policy",
-                    "url": "https://example.org/peer-review",
+                    "url": _PEER_REVIEW_URL,
                     "title": "Peer Review",
                     "text": "The journal applies peer review and editorial decision process for each submission.",
                 }
@@ -152,7 +173,7 @@ class BasicRuleTests(unittest.TestCase):
             [
                 {
                     "rule_hint": "license_terms",
-                    "url": "https://example.org/licensing",
+                    "url": _LICENSING_URL,
                     "title": "Licensing",
                     "text": "Articles are published under Creative Commons CC BY 4.0 license.",
                 }
@@ -162,7 +183,7 @@ class BasicRuleTests(unittest.TestCase):
             [
                 {
                     "rule_hint": "license_terms",
-                    "url": "https://example.org/licensing",
+                    "url": _LICENSING_URL,
                     "title": "Copyright",
                     "text": "All rights reserved. No license is granted for redistribution.",
                 }
@@ -185,7 +206,7 @@ class BasicRuleTests(unittest.TestCase):
             [
                 {
                     "rule_hint": "license_terms",
-                    "url": "https://example.org/licensing",
+                    "url": _LICENSING_URL,
                     "title": "License",
                     "text": "Please see our policy for further information on publication matters.",
                 }
@@ -201,7 +222,7 @@ class BasicRuleTests(unittest.TestCase):
             [
                 {
                     "rule_hint": "copyright_author_rights",
-                    "url": "https://example.org/copyright",
+                    "url": _COPYRIGHT_URL,
                     "title": "Copyright",
                     "text": "Authors retain copyright and grant a non-exclusive license to publish.",
                 }
@@ -211,7 +232,7 @@ class BasicRuleTests(unittest.TestCase):
             [
                 {
                     "rule_hint": "copyright_author_rights",
-                    "url": "https://example.org/copyright",
+                    "url": _COPYRIGHT_URL,
                     "title": "Copyright",
                     "text": "Authors transfer copyright to the publisher and assign exclusive rights.",
                 }
@@ -225,7 +246,7 @@ class BasicRuleTests(unittest.TestCase):
             [
                 {
                     "rule_hint": "publication_fees_disclosure",
-                    "url": "https://example.org/apc",
+                    "url": _APC_URL,
                     "title": "APC",
                     "text": "The journal charges an article processing charge (APC) of USD 100.",
                 }
@@ -235,7 +256,7 @@ class BasicRuleTests(unittest.TestCase):
             [
                 {
                     "rule_hint": "publication_fees_disclosure",
-                    "url": "https://example.org/apc",
+                    "url": _APC_URL,
                     "title": "Fees",
                     "text": "The journal does not charge any publication fee and has no APC.",
                 }
@@ -249,7 +270,7 @@ class BasicRuleTests(unittest.TestCase):
             [
                 {
                     "rule_hint": "publisher_identity",
-                    "url": "https://example.org/publisher",
+                    "url": _PUBLISHER_URL,
                     "title": "Publisher",
                     "text": "Publisher: Example University Press. Contact: editor@example.org. Address: City, Country.",
                 }
@@ -263,7 +284,7 @@ class BasicRuleTests(unittest.TestCase):
             [
                 {
                     "rule_hint": "issn_consistency",
-                    "url": "https://example.org/about",
+                    "url": _ABOUT_URL,
                     "title": "About",
                     "text": "ISSN (Print): 1234-5679. ISSN (Online): 2049-3630.",
                 }
@@ -273,7 +294,7 @@ class BasicRuleTests(unittest.TestCase):
             [
                 {
                     "rule_hint": "issn_consistency",
-                    "url": "https://example.org/about",
+                    "url": _ABOUT_URL,
                     "title": "About",
                     "text": "ISSN: 1234-5678",
                 }
@@ -287,7 +308,7 @@ class BasicRuleTests(unittest.TestCase):
             [
                 {
                     "rule_hint": "aims_scope",
-                    "url": "https://example.org/aims-and-scope",
+                    "url": _AIMS_SCOPE_URL,
                     "title": "Aims and Scope",
                     "text": "Aims and Scope: The journal publishes research articles in informatics and digital policy.",
                 }
@@ -297,7 +318,7 @@ class BasicRuleTests(unittest.TestCase):
             [
                 {
                     "rule_hint": "instructions_for_authors",
-                    "url": "https://example.org/instructions",
+                    "url": _INSTRUCTIONS_URL,
                     "title": "Instructions for Authors",
                     "text": "Instructions for Authors include manuscript format, submission guidelines, template, ethics and peer review process.",
                 }
@@ -311,7 +332,7 @@ class BasicRuleTests(unittest.TestCase):
             [
                 {
                     "rule_hint": "editorial_board",
-                    "url": "https://example.org/editorial-board",
+                    "url": _EDITORIAL_BOARD_URL,
                     "title": "Editorial Board",
                     "text": "Editor in Chief and editorial board members with university affiliations are listed.",
                 }
@@ -325,25 +346,25 @@ class BasicRuleTests(unittest.TestCase):
             [
                 {
                     "rule_hint": "editorial_board",
-                    "url": "https://example.org/editorial-board",
+                    "url": _EDITORIAL_BOARD_URL,
                     "title": "Editorial Board",
                     "text": "Editor in Chief and editorial board members with affiliations are listed.",
                 },
                 {
                     "rule_hint": "reviewers",
-                    "url": "https://example.org/reviewers",
+                    "url": _REVIEWERS_URL,
                     "title": "Reviewers",
                     "text": "Reviewer list and affiliations.",
                 },
                 {
                     "rule_hint": "publisher_identity",
-                    "url": "https://example.org/publisher",
+                    "url": _PUBLISHER_URL,
                     "title": "Publisher",
                     "text": "Publisher: Example University Press. Address: City, Country.",
                 },
             ]
         )
-        submission["source_urls"]["reviewers"] = ["https://example.org/reviewers"]
+        submission["source_urls"]["reviewers"] = [_REVIEWERS_URL]
         for item in submission["role_people"]:
             if item["role"] in {"editor", "editorial_board_member"}:
                 item["affiliation"] = "Example University Press"
@@ -354,7 +375,7 @@ class BasicRuleTests(unittest.TestCase):
                 {
                     "name": f"Reviewer Same {idx}",
                     "role": "reviewer",
-                    "source_url": "https://example.org/reviewers",
+                    "source_url": _REVIEWERS_URL,
                     "affiliation": "Example University Press",
                 }
             )
@@ -363,7 +384,7 @@ class BasicRuleTests(unittest.TestCase):
                 {
                     "name": f"Reviewer Outside {idx}",
                     "role": "reviewer",
-                    "source_url": "https://example.org/reviewers",
+                    "source_url": _REVIEWERS_URL,
                     "affiliation": f"Institute Outside {idx}",
                 }
             )
@@ -379,25 +400,25 @@ class BasicRuleTests(unittest.TestCase):
             [
                 {
                     "rule_hint": "editorial_board",
-                    "url": "https://example.org/editorial-board",
+                    "url": _EDITORIAL_BOARD_URL,
                     "title": "Editorial Board",
                     "text": "Editor in Chief and editorial board members with affiliations are listed.",
                 },
                 {
                     "rule_hint": "reviewers",
-                    "url": "https://example.org/reviewers",
+                    "url": _REVIEWERS_URL,
                     "title": "Reviewers",
                     "text": "Reviewer list and affiliations.",
                 },
                 {
                     "rule_hint": "publisher_identity",
-                    "url": "https://example.org/publisher",
+                    "url": _PUBLISHER_URL,
                     "title": "Publisher",
                     "text": "Publisher: Example University Press. Address: City, Country.",
                 },
             ]
         )
-        submission["source_urls"]["reviewers"] = ["https://example.org/reviewers"]
+        submission["source_urls"]["reviewers"] = [_REVIEWERS_URL]
         for item in submission["role_people"]:
             if item["role"] in {"editor", "editorial_board_member"}:
                 item["affiliation"] = "Example University Press"
@@ -408,7 +429,7 @@ class BasicRuleTests(unittest.TestCase):
                 {
                     "name": f"Reviewer Same {idx}",
                     "role": "reviewer",
-                    "source_url": "https://example.org/reviewers",
+                    "source_url": _REVIEWERS_URL,
                     "affiliation": "Example University Press",
                 }
             )
@@ -417,7 +438,7 @@ class BasicRuleTests(unittest.TestCase):
                 {
                     "name": f"Reviewer Outside {idx}",
                     "role": "reviewer",
-                    "source_url": "https://example.org/reviewers",
+                    "source_url": _REVIEWERS_URL,
                     "affiliation": f"Institute Outside {idx}",
                 }
             )
@@ -427,6 +448,32 @@ class BasicRuleTests(unittest.TestCase):
         self.assertEqual(result["result"], "fail")
         self.assertIn("Reviewer affiliation composition is outside target range", result["notes"])
 
+    def test_keyword_scan_respects_word_boundaries(self) -> None:
+        hints = scan_keywords("articles are open access under cc by-nc; no peer-reviewed unreadable text")
+        self.assertIn("oa_positive", hints)
+        self.assertIn("oa_license", hints)
+        self.assertIn("lic_cc_cc", hints)
+        self.assertIn("pr_positive", hints)
+        self.assertNotIn("oa_reuse_read", hints)
+        self.assertNotIn("pr_fail", hints)
+
+    def test_rule_tables_dispatch_by_rule_hint(self) -> None:
+        submission = _submission_with_policy_pages([])
+        for rule_hint, evaluator in {**BASIC_RULES, **SUPPLEMENTARY_RULES}.items():
+            with self.subTest(rule_hint=rule_hint):
+                self.assertEqual(evaluator(submission)["rule_id"], f"doaj.{rule_hint}.v1")
+
+    def test_policy_page_index_only_serves_the_indexed_submission(self) -> None:
+        page = {"rule_hint": "open_access_statement", "url": _OPEN_ACCESS_URL, "title": "Open Access", "text": ""}
+        indexed = _submission_with_policy_pages([page])
+        other = _submission_with_policy_pages([])
+        expected_indexed = evaluate_open_access_statement(indexed)
+        expected_other = evaluate_open_access_statement(other)
+        with policy_page_index(indexed):
+            self.assertEqual(evaluate_open_access_statement(indexed), expected_indexed)
+            self.assertEqual(evaluate_open_access_statement(other), expected_other)
+        self.assertNotEqual(expected_indexed, expected_other)
+
 
 if __name__ == "__main__":
     unittest.main()
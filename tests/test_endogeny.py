@@ -1,50 +1,54 @@
 from __future__ import annotations
 
-from copy import deepcopy
+import copy
 import unittest
 
 from doaj_reviewer.endogeny import evaluate_endogeny
 
 
-def _base_submission() -> dict:
-    return {
-        "submission_id": "T-1",
-        "journal_homepage_url": "https://example.org",
-        "publication_model": "issue_based",
-        "source_urls": {
-            "editorial_board": ["https://example.org/editorial-board"],
-            "latest_content": ["https://example.org/issue-2", "https://example.org/issue-1"],
-            "reviewers": ["https://example.org/reviewers"],
+_TEMPLATE = {
+    "submission_id": "T-1",
+    "journal_homepage_url": "https://example.org",
+    "publication_model": "issue_based",
+    "source_urls": {
+        "editorial_board": ["https://example.org/editorial-board"],
+        "latest_content": ["https://example.org/issue-2", "https://example.org/issue-1"],
+        "reviewers": ["https://example.org/reviewers"],
+    },
+    "role_people": [
+        {"name": "Dr. Jane Smith", "role": "editor", "source_url": "https://example.org/editorial-board"},
+        {"name": "Lina Putri", "role": "reviewer", "source_url": "https://example.org/reviewers"},
+    ],
+    "units": [
+        {
+            "label": "Issue 2",
+            "window_type": "issue",
+            "source_url": "https://example.org/issue-2",
+            "research_articles": [
+                {"title": "A", "url": "https://example.org/a", "authors": ["Jane Smith"]},
+                {"title": "B", "url": "https://example.org/b", "authors": ["Author B"]},
+                {"title": "C", "url": "https://example.org/c", "authors": ["Author C"]},
+                {"title": "D", "url": "https://example.org/d", "authors": ["Author D"]},
+            ],
         },
-        "role_people": [
-            {"name": "Dr. Jane Smith", "role": "editor", "source_url": "https://example.org/editorial-board"},
-            {"name": "Lina Putri", "role": "reviewer", "source_url": "https://example.org/reviewers"},
-        ],
-        "units": [
-            {
-                "label": "Issue 2",
-                "window_type": "issue",
-                "source_url": "https://example.org/issue-2",
-                "research_articles": [
-                    {"title": "A", "url": "https://example.org/a", "authors": ["Jane Smith"]},
-                    {"title": "B", "url": "https://example.org/b", "authors": ["Author B"]},
-                    {"title": "C", "url": "https://example.org/c", "authors": ["Author C"]},
-                    {"title": "D", "url": "https://example.org/d", "authors": ["Author D"]},
-                ],
-            },
-            {
-                "label": "Issue 1",
-                "window_type": "issue",
-                "source_url": "https://example.org/issue-1",
-                "research_articles": [
-                    {"title": "E", "url": "https://example.org/e", "authors": ["L. Putri"]},
-                    {"title": "F", "url": "https://example.org/f", "authors": ["Author F"]},
-                    {"title": "G", "url": "https://example.org/g", "authors": ["Author G"]},
-                    {"title": "H", "url": "https://example.org/h", "authors": ["Author H"]},
-                ],
-            },
-        ],
-    }
+        {
+            "label": "Issue 1",
+            "window_type": "issue",
+            "source_url": "https://example.org/issue-1",
+            "research_articles": [
+                {"title": "E", "url": "https://example.org/e", "authors": ["L. Putri"]},
+                {"title": "F", "url": "https://example.org/f", "authors": ["Author F"]},
+                {"title": "G", "url": "https://example.org/g", "authors": ["Author G"]},
+                {"title": "H", "url": "https://example.org/h", "authors": ["Author H"]},
+            ],
+        },
+    ],
+}
+
+
+def _base_submission() -> dict:
+    # Deep copy so a test that edits nested units/articles cannot leak into later tests.
+    return copy.deepcopy(_TEMPLATE)
 
 
 class EndogenyEvaluatorTests(unittest.TestCase):
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from doaj_reviewer import _files
+
+
+class LoadJsonTests(unittest.TestCase):
+    def test_load_json_does_not_depend_on_orjson(self) -> None:
+        payload = {"submission_id": "SIM-\u2013", "score": 0.97, "nan": float("nan"), "items": [1, 2]}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "summary.json"
+            path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            fast = _files.load_json(path)
+            with patch.object(_files, "orjson_module", return_value=None):
+                fallback = _files.load_json(path)
+        self.assertEqual(json.dumps(fast, sort_keys=True), json.dumps(fallback, sort_keys=True))
+        self.assertEqual(fast["submission_id"], "SIM-\u2013")
+
+    def test_load_json_memoized_reparses_when_size_changes_at_same_mtime(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "ruleset.json"
+            path.write_text('{"id": 1}', encoding="utf-8")
+            first = _files.load_json_memoized(path)
+            self.assertIs(_files.load_json_memoized(path), first)
+
+            mtime_ns = path.stat().st_mtime_ns
+            path.write_text('{"id": 22}', encoding="utf-8")
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+            self.assertEqual(_files.load_json_memoized(path), {"id": 22})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import json
+import os
 from pathlib import Path
+import shutil
+import sys
 import tempfile
 import unittest
+from unittest.mock import patch
 
+from doaj_reviewer import golden
 from doaj_reviewer.golden import (
     DEFAULT_BASE_SUBMISSION,
     DEFAULT_CASES_PATH,
@@ -22,6 +28,25 @@ class GoldenDatasetTests(unittest.TestCase):
         self.assertIsInstance(cases, list)
         self.assertGreaterEqual(len(cases), 10)
 
+    def test_case_definitions_are_reloaded_only_when_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cases_path = Path(tmpdir) / "cases.json"
+            shutil.copyfile(DEFAULT_CASES_PATH, cases_path)
+            with patch.object(golden, "load_json", wraps=golden.load_json) as load:
+                first = load_case_definitions(cases_path)
+                self.assertEqual(load_case_definitions(cases_path), first)
+                self.assertEqual(load.call_count, 1)
+
+                stat = cases_path.stat()
+                os.utime(cases_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+                self.assertEqual(load_case_definitions(cases_path), first)
+                self.assertEqual(load.call_count, 2)
+
+    def test_case_definitions_edits_do_not_leak_between_callers(self) -> None:
+        first = load_case_definitions(DEFAULT_CASES_PATH)
+        first["cases"].clear()
+        self.assertGreaterEqual(len(load_case_definitions(DEFAULT_CASES_PATH)["cases"]), 10)
+
     def test_golden_dataset_matches_expected_results(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             out_dir = Path(tmpdir) / "golden-out"
@@ -39,6 +64,35 @@ class GoldenDatasetTests(unittest.TestCase):
             self.assertTrue((out_dir / "G7_FAIL_REVIEWER_COMPOSITION" / "assertion-result.json").exists())
             self.assertTrue((out_dir / "G9_FAIL_ENDOGENY_ISSUE_OVER_THRESHOLD" / "endogeny-result.json").exists())
 
+    def test_golden_dataset_process_pool_matches_sequential_run(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sequential = run_golden_dataset(output_dir=Path(tmpdir) / "seq")
+            parallel = run_golden_dataset(output_dir=Path(tmpdir) / "par", max_workers=2)
+            self.assertEqual(parallel["rows"], sequential["rows"])
+            self.assertTrue((Path(tmpdir) / "par" / "G1_PASS_BASELINE" / "review-summary.json").exists())
+
+    def test_write_json_output_does_not_depend_on_orjson(self) -> None:
+        payload = {
+            "case_id": "G1",
+            "notes": "Jurnal Ilmiah \u2013 Universitas",
+            "score": 0.97,
+            "tiny": 1e-05,
+            "huge": 1e16,
+            "missing": float("nan"),
+            "unbounded": float("inf"),
+            "items": [],
+            "nested": {"ok": True},
+        }
+        expected = json.dumps(payload, indent=2, ensure_ascii=False) + "\n"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            default_path = Path(tmpdir) / "default.json"
+            golden._write_json(default_path, payload)
+            with patch.dict(sys.modules, {"orjson": None}):
+                fallback_path = Path(tmpdir) / "fallback.json"
+                golden._write_json(fallback_path, payload)
+            self.assertEqual(default_path.read_text(encoding="utf-8"), expected)
+            self.assertEqual(fallback_path.read_text(encoding="utf-8"), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
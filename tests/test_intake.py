@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import Mapping
 import unittest
 
 from doaj_reviewer.intake import (
@@ -7,13 +9,125 @@ from doaj_reviewer.intake import (
     extract_article_from_document,
     extract_role_people_from_document,
 )
-from doaj_reviewer.web import parse_html
+from doaj_reviewer.web import ParsedDocument, parse_html
+
+
+_PAGES: Mapping[str, str] = MappingProxyType(
+    {
+        "https://journal.example/editorial-board": """
+        <html><body>
+          <h2>Editorial Board</h2>
+          <p>Editor in Chief: Jane Smith</p>
+          <li>Asep Rahman</li>
+        </body></html>
+        """,
+        "https://journal.example/reviewers": """
+        <html><body>
+          <h2>Reviewers</h2>
+          <li>Lina Putri</li>
+        </body></html>
+        """,
+        "https://journal.example/issue-2": """
+        <html><body>
+          <a href="/article/view/1">Article 1</a>
+          <a href="/article/view/2">Article 2</a>
+        </body></html>
+        """,
+        "https://journal.example/issue-1": """
+        <html><body>
+          <a href="/article/view/3">Article 3</a>
+        </body></html>
+        """,
+        "https://journal.example/article/view/1": """
+        <html><head>
+          <meta name="citation_title" content="Research A" />
+          <meta name="citation_author" content="Jane Smith" />
+          <meta name="citation_publication_date" content="2025-01-10" />
+        </head></html>
+        """,
+        "https://journal.example/article/view/2": """
+        <html><head>
+          <meta name="citation_title" content="Research B" />
+          <meta name="citation_author" content="Author B" />
+          <meta name="citation_publication_date" content="2025-01-11" />
+        </head></html>
+        """,
+        "https://journal.example/article/view/3": """
+        <html><head>
+          <meta name="citation_title" content="Research C" />
+          <meta name="citation_author" content="Author C" />
+          <meta name="citation_publication_date" content="2025-01-12" />
+        </head></html>
+        """,
+        "https://journal.example/open-access": """
+        <html><body>
+          <h1>Open Access Policy</h1>
+          <p>This is an open access journal. Users can read, download, copy, and distribute articles.</p>
+        </body></html>
+        """,
+        "https://journal.example/peer-review": """
+        <html><body>
+          <h1>Peer Review Policy</h1>
+          <p>All manuscripts are peer reviewed by two external reviewers.</p>
+        </body></html>
+        """,
+        "https://journal.example/licensing": """
+        <html><body>
+          <h1>Licensing</h1>
+          <p>Articles use Creative Commons CC BY 4.0 license terms.</p>
+        </body></html>
+        """,
+        "https://journal.example/copyright": """
+        <html><body>
+          <h1>Copyright Policy</h1>
+          <p>Authors retain copyright and grant a non-exclusive publishing license to the journal.</p>
+        </body></html>
+        """,
+        "https://journal.example/apc": """
+        <html><body>
+          <h1>Publication Fees</h1>
+          <p>The journal charges an APC of USD 100 per accepted article.</p>
+        </body></html>
+        """,
+        "https://journal.example/publisher": """
+        <html><body>
+          <h1>Publisher</h1>
+          <p>Publisher: Journal University Press</p>
+          <p>Contact: editor@journal.example</p>
+          <p>Address: 10 Main Street, City, Country</p>
+        </body></html>
+        """,
+        "https://journal.example/about": """
+        <html><body>
+          <h1>About</h1>
+          <p>ISSN (Print): 1234-5679</p>
+          <p>E-ISSN: 2049-3630</p>
+        </body></html>
+        """,
+        "https://journal.example/aims-and-scope": """
+        <html><body>
+          <h1>Aims and Scope</h1>
+          <p>The journal publishes research articles in data science and software engineering.</p>
+        </body></html>
+        """,
+        "https://journal.example/instructions": """
+        <html><body>
+          <h1>Instructions for Authors</h1>
+          <p>Submission guidelines include manuscript format, references, template, and ethics statements.</p>
+        </body></html>
+        """,
+    }
+)
 
 
 def _doc(url: str, html: str):
     return parse_html(url=url, status_code=200, content_type="text/html; charset=utf-8", html=html)
 
 
+# Parsed once per process; intake only reads the documents.
+_DOCS: Mapping[str, ParsedDocument] = MappingProxyType({url: _doc(url, html) for url, html in _PAGES.items()})
+
+
 class IntakeTests(unittest.TestCase):
     def test_extract_role_people_from_document(self) -> None:
         html = """
@@ -53,116 +167,11 @@ class IntakeTests(unittest.TestCase):
         self.assertEqual(article["article_type"], "Research Article")
 
     def test_build_structured_submission_from_raw(self) -> None:
-        pages = {
-            "https://journal.example/editorial-board": """
-            <html><body>
-              <h2>Editorial Board</h2>
-              <p>Editor in Chief: Jane Smith</p>
-              <li>Asep Rahman</li>
-            </body></html>
-            """,
-            "https://journal.example/reviewers": """
-            <html><body>
-              <h2>Reviewers</h2>
-              <li>Lina Putri</li>
-            </body></html>
-            """,
-            "https://journal.example/issue-2": """
-            <html><body>
-              <a href="/article/view/1">Article 1</a>
-              <a href="/article/view/2">Article 2</a>
-            </body></html>
-            """,
-            "https://journal.example/issue-1": """
-            <html><body>
-              <a href="/article/view/3">Article 3</a>
-            </body></html>
-            """,
-            "https://journal.example/article/view/1": """
-            <html><head>
-              <meta name="citation_title" content="Research A" />
-              <meta name="citation_author" content="Jane Smith" />
-              <meta name="citation_publication_date" content="2025-01-10" />
-            </head></html>
-            """,
-            "https://journal.example/article/view/2": """
-            <html><head>
-              <meta name="citation_title" content="Research B" />
-              <meta name="citation_author" content="Author B" />
-              <meta name="citation_publication_date" content="2025-01-11" />
-            </head></html>
-            """,
-            "https://journal.example/article/view/3": """
-            <html><head>
-              <meta name="citation_title" content="Research C" />
-              <meta name="citation_author" content="Author C" />
-              <meta name="citation_publication_date" content="2025-01-12" />
-            </head></html>
-            """,
-            "https://journal.example/open-access": """
-            <html><body>
-              <h1>Open Access Policy</h1>
-              <p>This is an open access journal. Users can read, download, copy, and distribute articles.</p>
-            </body></html>
-            """,
-            "https://journal.example/peer-review": """
-            <html><body>
-              <h1>Peer Review Policy</h1>
-              <p>All manuscripts are peer reviewed by two external reviewers.</p>
-            </body></html>
-            """,
-            "https://journal.example/licensing": """
-            <html><body>
-              <h1>Licensing</h1>
-              <p>Articles use Creative Commons CC BY 4.0 license terms.</p>
-            </body></html>
-            """,
-            "https://journal.example/copyright": """
-            <html><body>
-              <h1>Copyright Policy</h1>
-              <p>Authors retain copyright and grant a non-exclusive publishing license to the journal.</p>
-            </body></html>
-            """,
-            "https://journal.example/apc": """
-            <html><body>
-              <h1>Publication Fees</h1>
-              <p>The journal charges an APC of USD 100 per accepted article.</p>
-            </body></html>
-            """,
-            "https://journal.example/publisher": """
-            <html><body>
-              <h1>Publisher</h1>
-              <p>Publisher: Journal University Press</p>
-              <p>Contact: editor@journal.example</p>
-              <p>Address: 10 Main Street, City, Country</p>
-            </body></html>
-            """,
-            "https://journal.example/about": """
-            <html><body>
-              <h1>About</h1>
-              <p>ISSN (Print): 1234-5679</p>
-              <p>E-ISSN: 2049-3630</p>
-            </body></html>
-            """,
-            "https://journal.example/aims-and-scope": """
-            <html><body>
-              <h1>Aims and Scope</h1>
-              <p>The journal publishes research articles in data science and software engineering.</p>
-            </body></html>
-            """,
-            "https://journal.example/instructions": """
-            <html><body>
-              <h1>Instructions for Authors</h1>
-              <p>Submission guidelines include manuscript format, references, template, and ethics statements.</p>
-            </body></html>
-            """,
-        }
-
         def fake_fetcher(url: str, timeout_seconds: int = 18):
             _ = timeout_seconds
-            if url not in pages:
+            if url not in _DOCS:
                 raise RuntimeError(f"missing fixture for {url}")
-            return _doc(url, pages[url])
+            return _DOCS[url]
 
         raw_submission = {
             "submission_id": "RAW-1",
@@ -194,6 +203,39 @@ class IntakeTests(unittest.TestCase):
         self.assertEqual(total_articles, 3)
         self.assertEqual(len(structured["policy_pages"]), 10)
 
+    def test_build_structured_submission_fetches_each_url_once(self) -> None:
+        about_url = "https://journal.example/about"
+        missing_url = "https://journal.example/missing"
+        calls: list[str] = []
+
+        def fake_fetcher(url: str, timeout_seconds: int = 18):
+            _ = timeout_seconds
+            calls.append(url)
+            if url != about_url:
+                raise RuntimeError(f"missing fixture for {url}")
+            return _doc(url, "<html><body><p>ISSN 1234-5679. Aims and scope of the journal.</p></body></html>")
+
+        raw_submission = {
+            "submission_id": "RAW-DUP",
+            "journal_homepage_url": "https://journal.example",
+            "publication_model": "issue_based",
+            "source_urls": {
+                "issn_consistency": [about_url],
+                "aims_scope": [about_url],
+                "publisher_identity": [missing_url],
+                "open_access_statement": [missing_url],
+            },
+        }
+
+        structured = build_structured_submission_from_raw(raw_submission, fetcher=fake_fetcher)
+
+        self.assertEqual(calls.count(about_url), 1)
+        self.assertEqual(calls.count(missing_url), 1)
+        hints = [page["rule_hint"] for page in structured["policy_pages"] if page["url"] == about_url]
+        self.assertEqual(hints, ["issn_consistency", "aims_scope"])
+        fetch_errors = [item for item in structured["evidence"] if item.get("locator_hint") == "policy-fetch-error"]
+        self.assertEqual(len(fetch_errors), 2)
+
     def test_manual_policy_text_used_when_waf_blocks_url(self) -> None:
         waf_doc = parse_html(
             url="https://journal.example/open-access",
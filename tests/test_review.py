@@ -4,7 +4,7 @@ import json
 from pathlib import Path
 import unittest
 
-from doaj_reviewer.review import render_review_summary_text, run_review
+from doaj_reviewer.review import BoundedEvaluationCache, render_review_summary_text, run_review
 
 
 class ReviewRunnerTests(unittest.TestCase):
@@ -73,6 +73,37 @@ class ReviewRunnerTests(unittest.TestCase):
         self.assertIn("Must Checks", text)
         self.assertIn("Supplementary Checks (Non-must)", text)
 
+    def test_evaluation_cache_reuses_outcomes_for_identical_inputs(self) -> None:
+        repo_root = Path(__file__).resolve().parents[1]
+        with (repo_root / "specs" / "reviewer" / "rules" / "ruleset.must.v1.json").open("r", encoding="utf-8") as f:
+            ruleset = json.load(f)
+        with (repo_root / "examples" / "submission.example.json").open("r", encoding="utf-8") as f:
+            submission = json.load(f)
+
+        cache: dict = {}
+        first, _ = run_review(submission=submission, ruleset=ruleset, evaluation_cache=cache)
+        cached_keys = set(cache)
+        self.assertGreater(len(cached_keys), 1)
+
+        other = dict(submission, submission_id="OTHER-ID")
+        second, _ = run_review(submission=other, ruleset=ruleset, evaluation_cache=cache)
+        self.assertEqual(set(cache), cached_keys)
+        self.assertEqual(first["checks"], second["checks"])
+        self.assertEqual(first["supplementary_checks"], second["supplementary_checks"])
+
+        changed = dict(submission, policy_pages=[])
+        run_review(submission=changed, ruleset=ruleset, evaluation_cache=cache)
+        self.assertGreater(len(cache), len(cached_keys))
+
+    def test_bounded_evaluation_cache_evicts_least_recently_used(self) -> None:
+        cache = BoundedEvaluationCache(maxsize=2)
+        cache[("a", b"")] = {"n": 1}
+        cache[("b", b"")] = {"n": 2}
+        self.assertEqual(cache.get(("a", b"")), {"n": 1})
+        cache[("c", b"")] = {"n": 3}
+        self.assertEqual(list(cache), [("a", b""), ("c", b"")])
+        self.assertIsNone(cache.get(("b", b"")))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,13 +3,17 @@ from __future__ import annotations
 import csv
 import io
 import json
+import os
 from pathlib import Path
 import tempfile
+from types import MappingProxyType
 import unittest
 from unittest.mock import patch
 
+from doaj_reviewer import _files, sim_server
 from doaj_reviewer.sim_server import (
     SimulationApp,
+    build_and_validate_raw_submission,
     build_raw_submission_from_form,
     split_urls,
     validate_raw_submission,
@@ -17,9 +21,205 @@ from doaj_reviewer.sim_server import (
 
 
 RULESET_PATH = Path(__file__).resolve().parents[1] / "specs" / "reviewer" / "rules" / "ruleset.must.v1.json"
+_RULESET = json.loads(RULESET_PATH.read_text("utf-8"))
+
+
+# The form builder only reads its payload, so one frozen copy serves every call.
+_MANUAL_PAYLOAD = MappingProxyType(
+    {
+        "submission_id": "SIM-MANUAL",
+        "journal_homepage_url": "https://journal.example",
+        "publication_model": "issue_based",
+        "open_access_statement": "https://journal.example/open-access",
+        "issn_consistency": "https://journal.example/about",
+        "publisher_identity": "https://journal.example/publisher",
+        "license_terms": "https://journal.example/licensing",
+        "copyright_author_rights": "https://journal.example/copyright",
+        "peer_review_policy": "https://journal.example/peer-review",
+        "aims_scope": "https://journal.example/aims-scope",
+        "editorial_board": "https://journal.example/editorial-board",
+        "latest_content": "https://journal.example/issue-1",
+        "instructions_for_authors": "https://journal.example/instructions",
+        "publication_fees_disclosure": "https://journal.example/apc",
+        "manual_policy_pages": [
+            {
+                "rule_hint": "open_access_statement",
+                "title": "Manual fallback text",
+                "source_label": "manual://open_access_statement/text",
+                "text": "This journal provides open access under CC BY terms.",
+            },
+            {
+                "rule_hint": "peer_review_policy",
+                "title": "Manual PDF",
+                "source_label": "manual://peer_review_policy/pdf",
+                "file_name": "peer-review.pdf",
+                "pdf_base64": "this-is-not-base64",
+            },
+        ],
+    }
+)
+
+
+def _parse_csv(text: str) -> tuple[dict[str, int], list[list[str]]]:
+    reader = csv.reader(io.StringIO(text))
+    header = next(reader)
+    return {name: index for index, name in enumerate(header)}, list(reader)
+
+
+def _dump_json(payload: dict) -> bytes:
+    orjson = _files.orjson_module()
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+# Export-test run files, serialised once at import.
+_RAW_AGG_OLD = _dump_json(
+    {
+        "submission_id": "SIM-OLD",
+        "journal_homepage_url": "https://journal.example",
+    }
+)
+_SUMMARY_AGG_OLD = _dump_json(
+    {
+        "submission_id": "SIM-OLD",
+        "overall_result": "pass",
+        "checks": [
+            {"rule_id": "doaj.open_access_statement.v1", "result": "pass"},
+            {"rule_id": "doaj.endogeny.v1", "result": "need_human_review"},
+        ],
+    }
+)
+_RAW_AGG_NEW = _dump_json(
+    {
+        "submission_id": "SIM-NEW",
+        "journal_homepage_url": "https://journal.example",
+    }
+)
+_RAW_FLAGGED = _dump_json(
+    {
+        "submission_id": "SIM-FLAGGED",
+        "journal_homepage_url": "https://journal.example",
+        "source_urls": {
+            "open_access_statement": ["https://journal.example/open-access"],
+            "aims_scope": ["https://journal.example/aims-scope"],
+        },
+    }
+)
+_SUMMARY_FLAGGED = _dump_json(
+    {
+        "submission_id": "SIM-FLAGGED",
+        "overall_result": "fail",
+        "overall_decision_reason": "At least one must-rule returned fail.",
+        "checks": [
+            {
+                "rule_id": "doaj.open_access_statement.v1",
+                "result": "need_human_review",
+                "notes": "Policy text is ambiguous.",
+                "evidence_urls": ["https://journal.example/open-access"],
+            },
+            {
+                "rule_id": "doaj.aims_scope.v1",
+                "result": "fail",
+                "notes": "Aims and scope statement missing.",
+                "source_urls": ["https://journal.example/aims-scope"],
+                "evidence_urls": [],
+            },
+        ],
+        "supplementary_checks": [
+            {
+                "rule_id": "doaj.plagiarism_policy.v1",
+                "result": "need_human_review",
+                "notes": "Similarity threshold not explicit.",
+                "evidence_urls": ["https://journal.example/plagiarism"],
+            }
+        ],
+    }
+)
+_RAW_ENDO = _dump_json(
+    {
+        "submission_id": "SIM-ENDO-FALLBACK",
+        "journal_homepage_url": "https://journal.example",
+        "source_urls": {
+            "latest_content": [
+                "https://journal.example/issue-1",
+                "https://journal.example/issue-2",
+            ],
+            "archives": ["https://journal.example/archive"],
+        },
+    }
+)
+_SUMMARY_ENDO = _dump_json(
+    {
+        "submission_id": "SIM-ENDO-FALLBACK",
+        "overall_result": "fail",
+        "checks": [
+            {
+                "rule_id": "doaj.endogeny.v1",
+                "result": "fail",
+                "notes": "Endogeny exceeds threshold.",
+                "evidence_urls": [],
+            }
+        ],
+        "supplementary_checks": [],
+    }
+)
+
+
+# Read-only stub payloads; the stubs hand out shallow copies.
+_FAKE_STRUCTURED = MappingProxyType(
+    {
+        "submission_id": "SIM-ART-1",
+        "journal_homepage_url": "https://journal.example",
+        "publication_model": "issue_based",
+        "crawl_timestamp_utc": "2026-02-16T00:00:00Z",
+        "source_urls": {},
+        "role_people": (),
+        "units": (),
+        "evidence": (),
+        "policy_pages": (),
+    }
+)
+_FAKE_SUMMARY = MappingProxyType(
+    {
+        "submission_id": "SIM-ART-1",
+        "ruleset_id": "doaj.must.v1",
+        "overall_result": "pass",
+        "checks": (),
+        "supplementary_checks": (),
+    }
+)
+_FAKE_ENDOGENY = MappingProxyType(
+    {
+        "rule_id": "doaj.endogeny.v1",
+        "result": "pass",
+        "confidence": 0.9,
+        "crawl_timestamp_utc": "2026-02-16T00:00:00Z",
+        "explanation_en": "Endogeny is within threshold.",
+        "computed_metrics": {"units": ()},
+        "matched_articles": (),
+        "evidence": (),
+        "limitations": (),
+    }
+)
 
 
 class SimServerHelperTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls._root = Path(cls._tmp.name)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._tmp.cleanup()
+
+    def _test_dir(self) -> Path:
+        # One shared temp root per class; each test still gets its own directory.
+        path = self._root / self._testMethodName
+        path.mkdir()
+        return path
+
     def test_split_urls_supports_newline_and_pipe(self) -> None:
         raw = "https://a.example|https://b.example\nhttps://a.example\n\nhttps://c.example"
         self.assertEqual(
@@ -27,6 +227,11 @@ class SimServerHelperTests(unittest.TestCase):
             ["https://a.example", "https://b.example", "https://c.example"],
         )
 
+    def test_split_urls_dedupes_large_input_in_order(self) -> None:
+        urls = [f"https://journal.example/page-{index}" for index in range(10000)]
+        raw = "|".join(urls) + "\n" + "|".join(urls)
+        self.assertEqual(split_urls(raw), urls)
+
     def test_build_raw_submission_from_form(self) -> None:
         payload = {
             "submission_id": "SIM-10",
@@ -43,38 +248,7 @@ class SimServerHelperTests(unittest.TestCase):
         self.assertEqual(raw["source_urls"]["latest_content"][0], "https://journal.example/issue-2")
 
     def test_build_raw_submission_with_manual_text_and_invalid_pdf(self) -> None:
-        payload = {
-            "submission_id": "SIM-MANUAL",
-            "journal_homepage_url": "https://journal.example",
-            "publication_model": "issue_based",
-            "open_access_statement": "https://journal.example/open-access",
-            "issn_consistency": "https://journal.example/about",
-            "publisher_identity": "https://journal.example/publisher",
-            "license_terms": "https://journal.example/licensing",
-            "copyright_author_rights": "https://journal.example/copyright",
-            "peer_review_policy": "https://journal.example/peer-review",
-            "aims_scope": "https://journal.example/aims-scope",
-            "editorial_board": "https://journal.example/editorial-board",
-            "latest_content": "https://journal.example/issue-1",
-            "instructions_for_authors": "https://journal.example/instructions",
-            "publication_fees_disclosure": "https://journal.example/apc",
-            "manual_policy_pages": [
-                {
-                    "rule_hint": "open_access_statement",
-                    "title": "Manual fallback text",
-                    "source_label": "manual://open_access_statement/text",
-                    "text": "This journal provides open access under CC BY terms.",
-                },
-                {
-                    "rule_hint": "peer_review_policy",
-                    "title": "Manual PDF",
-                    "source_label": "manual://peer_review_policy/pdf",
-                    "file_name": "peer-review.pdf",
-                    "pdf_base64": "this-is-not-base64",
-                },
-            ],
-        }
-        raw = build_raw_submission_from_form(payload)
+        raw = build_raw_submission_from_form(dict(_MANUAL_PAYLOAD))
         self.assertIn("manual_policy_pages", raw)
         self.assertEqual(len(raw["manual_policy_pages"]), 1)
         self.assertEqual(raw["manual_policy_pages"][0]["rule_hint"], "open_access_statement")
@@ -109,243 +283,185 @@ class SimServerHelperTests(unittest.TestCase):
         self.assertEqual(validate_raw_submission(valid), [])
         self.assertTrue(validate_raw_submission(invalid))
 
+    def test_build_and_validate_matches_separate_validation(self) -> None:
+        payloads = [
+            {},
+            {"journal_homepage_url": "https://journal.example", "aims_scope": "https://journal.example/aims"},
+            {
+                "journal_homepage_url": "https://journal.example",
+                **{field: f"https://journal.example/{field}" for field in sim_server.REQUIRED_URL_FIELDS},
+            },
+        ]
+        for payload in payloads:
+            raw, errors = build_and_validate_raw_submission(payload)
+            self.assertEqual(errors, validate_raw_submission(raw))
+
     def test_run_submission_writes_summary_txt_artifact(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            runs_dir = Path(tmpdir) / "runs"
-            app = SimulationApp(ruleset_path=RULESET_PATH, runs_dir=runs_dir)
+        tmpdir = self._test_dir()
+        runs_dir = Path(tmpdir) / "runs"
+        app = SimulationApp(ruleset_path=RULESET_PATH, ruleset=_RULESET, runs_dir=runs_dir)
+        sink: dict[str, str] = {}
 
-            payload = {
-                "submission_id": "SIM-ART-1",
-                "journal_homepage_url": "https://journal.example",
-                "publication_model": "issue_based",
-                "open_access_statement": "https://journal.example/open-access",
-                "issn_consistency": "https://journal.example/about",
-                "publisher_identity": "https://journal.example/publisher",
-                "license_terms": "https://journal.example/licensing",
-                "copyright_author_rights": "https://journal.example/copyright",
-                "peer_review_policy": "https://journal.example/peer-review",
-                "aims_scope": "https://journal.example/aims-scope",
-                "editorial_board": "https://journal.example/editorial-board",
-                "latest_content": "https://journal.example/issue-1",
-                "instructions_for_authors": "https://journal.example/instructions",
-                "publication_fees_disclosure": "https://journal.example/apc",
-            }
+        payload = {
+            "submission_id": "SIM-ART-1",
+            "journal_homepage_url": "https://journal.example",
+            "publication_model": "issue_based",
+            "open_access_statement": "https://journal.example/open-access",
+            "issn_consistency": "https://journal.example/about",
+            "publisher_identity": "https://journal.example/publisher",
+            "license_terms": "https://journal.example/licensing",
+            "copyright_author_rights": "https://journal.example/copyright",
+            "peer_review_policy": "https://journal.example/peer-review",
+            "aims_scope": "https://journal.example/aims-scope",
+            "editorial_board": "https://journal.example/editorial-board",
+            "latest_content": "https://journal.example/issue-1",
+            "instructions_for_authors": "https://journal.example/instructions",
+            "publication_fees_disclosure": "https://journal.example/apc",
+        }
 
-            fake_structured = {
-                "submission_id": "SIM-ART-1",
-                "journal_homepage_url": "https://journal.example",
-                "publication_model": "issue_based",
-                "crawl_timestamp_utc": "2026-02-16T00:00:00Z",
-                "source_urls": {},
-                "role_people": [],
-                "units": [],
-                "evidence": [],
-                "policy_pages": [],
-            }
-            fake_summary = {
-                "submission_id": "SIM-ART-1",
-                "ruleset_id": "doaj.must.v1",
-                "overall_result": "pass",
-                "checks": [],
-                "supplementary_checks": [],
-            }
-            fake_endogeny = {
-                "rule_id": "doaj.endogeny.v1",
-                "result": "pass",
-                "confidence": 0.9,
-                "crawl_timestamp_utc": "2026-02-16T00:00:00Z",
-                "explanation_en": "Endogeny is within threshold.",
-                "computed_metrics": {"units": []},
-                "matched_articles": [],
-                "evidence": [],
-                "limitations": [],
-            }
+        with patch.object(sim_server, "build_structured_submission_from_raw", new=lambda *_a, **_k: dict(_FAKE_STRUCTURED)):
+            with patch.object(sim_server, "run_review", new=lambda *_a, **_k: (dict(_FAKE_SUMMARY), dict(_FAKE_ENDOGENY))):
+                result = app.run_submission(payload, writer=lambda path, text: sink.setdefault(path.name, text))
 
-            with patch("doaj_reviewer.sim_server.build_structured_submission_from_raw", return_value=fake_structured):
-                with patch("doaj_reviewer.sim_server.run_review", return_value=(fake_summary, fake_endogeny)):
-                    result = app.run_submission(payload)
+        self.assertTrue(result["ok"])
+        self.assertIn("summary_txt", result["artifacts"])
+        self.assertIn("DOAJ Reviewer Summary", sink["review-summary.txt"])
+        self.assertFalse(os.path.exists(os.path.join(os.fspath(runs_dir), str(result["run_id"]))))
 
-            self.assertTrue(result["ok"])
-            self.assertIn("summary_txt", result["artifacts"])
-            run_id = str(result["run_id"])
-            summary_txt = runs_dir / run_id / "review-summary.txt"
-            self.assertTrue(summary_txt.exists())
+    def test_run_submission_reuses_rule_outcomes_for_unchanged_crawl(self) -> None:
+        payload = {
+            "submission_id": "SIM-RERUN",
+            "journal_homepage_url": "https://journal.example",
+            "publication_model": "issue_based",
+            **{field: f"https://journal.example/{field}" for field in sim_server.REQUIRED_URL_FIELDS},
+        }
+        structured = {
+            "submission_id": "SIM-RERUN",
+            "journal_homepage_url": "https://journal.example",
+            "publication_model": "issue_based",
+            "crawl_timestamp_utc": "2026-02-16T00:00:00Z",
+            "source_urls": {},
+            "role_people": [],
+            "units": [],
+            "evidence": [],
+            "policy_pages": [
+                {
+                    "rule_hint": "open_access_statement",
+                    "url": "https://journal.example/open-access",
+                    "title": "Open Access",
+                    "text": "This is an open access journal under CC BY.",
+                }
+            ],
+        }
+        tmpdir = self._test_dir()
+        app = SimulationApp(ruleset_path=RULESET_PATH, ruleset=_RULESET, runs_dir=Path(tmpdir) / "runs")
+        with patch.object(sim_server, "build_structured_submission_from_raw", new=lambda *_a, **_k: structured):
+            first = app.run_submission(payload)
+            cached = dict(app._evaluation_cache)
+            second = app.run_submission(payload)
+
+        self.assertTrue(first["ok"])
+        self.assertTrue(second["ok"])
+        self.assertTrue(cached)
+        self.assertEqual(app._evaluation_cache.keys(), cached.keys())
+        self.assertTrue(all(app._evaluation_cache[key] is outcome for key, outcome in cached.items()))
+        self.assertEqual(first["checks"], second["checks"])
 
     def test_export_csv_aggregates_runs(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            runs_dir = Path(tmpdir) / "runs"
-
-            run_old = runs_dir / "20260215-aaa11111"
-            run_old.mkdir(parents=True, exist_ok=True)
-            (run_old / "submission.raw.json").write_text(
-                json.dumps(
-                    {
-                        "submission_id": "SIM-OLD",
-                        "journal_homepage_url": "https://journal.example",
-                    }
-                ),
-                encoding="utf-8",
-            )
-            (run_old / "review-summary.json").write_text(
-                json.dumps(
-                    {
-                        "submission_id": "SIM-OLD",
-                        "overall_result": "pass",
-                        "checks": [
-                            {"rule_id": "doaj.open_access_statement.v1", "result": "pass"},
-                            {"rule_id": "doaj.endogeny.v1", "result": "need_human_review"},
-                        ],
-                    }
-                ),
-                encoding="utf-8",
-            )
-
-            run_new = runs_dir / "20260216-bbb22222"
-            run_new.mkdir(parents=True, exist_ok=True)
-            (run_new / "submission.raw.json").write_text(
-                json.dumps(
-                    {
-                        "submission_id": "SIM-NEW",
-                        "journal_homepage_url": "https://journal.example",
-                    }
-                ),
-                encoding="utf-8",
-            )
-
-            app = SimulationApp(ruleset_path=RULESET_PATH, runs_dir=runs_dir)
-            content = app.render_export_csv(limit=None)
-            rows = list(csv.DictReader(io.StringIO(content)))
-
-            self.assertEqual(len(rows), 2)
-            self.assertEqual(rows[0]["run_id"], "20260216-bbb22222")
-            self.assertEqual(rows[0]["submission_id"], "SIM-NEW")
-            self.assertEqual(rows[0]["overall_result"], "not_available")
-            self.assertEqual(rows[1]["run_id"], "20260215-aaa11111")
-            self.assertEqual(rows[1]["submission_id"], "SIM-OLD")
-            self.assertEqual(rows[1]["overall_result"], "pass")
-            self.assertEqual(rows[1]["doaj.open_access_statement.v1"], "pass")
-            self.assertEqual(rows[1]["doaj.endogeny.v1"], "need_human_review")
+        tmpdir = self._test_dir()
+        runs_dir = Path(tmpdir) / "runs"
+
+        run_old = runs_dir / "20260215-aaa11111"
+        run_old.mkdir(parents=True, exist_ok=True)
+        (run_old / "submission.raw.json").write_bytes(_RAW_AGG_OLD)
+        (run_old / "review-summary.json").write_bytes(_SUMMARY_AGG_OLD)
+
+        run_new = runs_dir / "20260216-bbb22222"
+        run_new.mkdir(parents=True, exist_ok=True)
+        (run_new / "submission.raw.json").write_bytes(_RAW_AGG_NEW)
+
+        app = SimulationApp(ruleset_path=RULESET_PATH, ruleset=_RULESET, runs_dir=runs_dir)
+        content = app.render_export_csv(limit=None)
+        idx, rows = _parse_csv(content)
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0][idx["run_id"]], "20260216-bbb22222")
+        self.assertEqual(rows[0][idx["submission_id"]], "SIM-NEW")
+        self.assertEqual(rows[0][idx["overall_result"]], "not_available")
+        self.assertEqual(rows[1][idx["run_id"]], "20260215-aaa11111")
+        self.assertEqual(rows[1][idx["submission_id"]], "SIM-OLD")
+        self.assertEqual(rows[1][idx["overall_result"]], "pass")
+        self.assertEqual(rows[1][idx["doaj.open_access_statement.v1"]], "pass")
+        self.assertEqual(rows[1][idx["doaj.endogeny.v1"]], "need_human_review")
 
     def test_export_csv_includes_problem_urls_for_flagged_results(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            runs_dir = Path(tmpdir) / "runs"
-            run_dir = runs_dir / "20260216-ccc33333"
-            run_dir.mkdir(parents=True, exist_ok=True)
-
-            (run_dir / "submission.raw.json").write_text(
-                json.dumps(
-                    {
-                        "submission_id": "SIM-FLAGGED",
-                        "journal_homepage_url": "https://journal.example",
-                        "source_urls": {
-                            "open_access_statement": ["https://journal.example/open-access"],
-                            "aims_scope": ["https://journal.example/aims-scope"],
-                        },
-                    }
-                ),
-                encoding="utf-8",
-            )
-            (run_dir / "review-summary.json").write_text(
-                json.dumps(
-                    {
-                        "submission_id": "SIM-FLAGGED",
-                        "overall_result": "fail",
-                        "overall_decision_reason": "At least one must-rule returned fail.",
-                        "checks": [
-                            {
-                                "rule_id": "doaj.open_access_statement.v1",
-                                "result": "need_human_review",
-                                "notes": "Policy text is ambiguous.",
-                                "evidence_urls": ["https://journal.example/open-access"],
-                            },
-                            {
-                                "rule_id": "doaj.aims_scope.v1",
-                                "result": "fail",
-                                "notes": "Aims and scope statement missing.",
-                                "source_urls": ["https://journal.example/aims-scope"],
-                                "evidence_urls": [],
-                            },
-                        ],
-                        "supplementary_checks": [
-                            {
-                                "rule_id": "doaj.plagiarism_policy.v1",
-                                "result": "need_human_review",
-                                "notes": "Similarity threshold not explicit.",
-                                "evidence_urls": ["https://journal.example/plagiarism"],
-                            }
-                        ],
-                    }
-                ),
-                encoding="utf-8",
-            )
-
-            app = SimulationApp(ruleset_path=RULESET_PATH, runs_dir=runs_dir)
-            content = app.render_export_csv(limit=None)
-            rows = list(csv.DictReader(io.StringIO(content)))
-            self.assertEqual(len(rows), 1)
-            row = rows[0]
-
-            self.assertEqual(row["overall_result"], "fail")
-            self.assertEqual(row["overall_decision_reason"], "At least one must-rule returned fail.")
-            self.assertEqual(row["doaj.open_access_statement.v1"], "need_human_review")
-            self.assertIn("Policy text is ambiguous.", row["doaj.open_access_statement.v1__note"])
-            self.assertIn("https://journal.example/open-access", row["doaj.open_access_statement.v1__problem_urls"])
-            self.assertEqual(row["doaj.aims_scope.v1"], "fail")
-            self.assertIn("https://journal.example/aims-scope", row["doaj.aims_scope.v1__problem_urls"])
-            self.assertIn("doaj.aims_scope.v1:fail", row["must_attention_rules"])
-            self.assertIn("doaj.open_access_statement.v1:need_human_review", row["must_attention_rules"])
-            self.assertIn("doaj.plagiarism_policy.v1:need_human_review", row["supplementary_attention_rules"])
-
-    def test_export_csv_uses_endogeny_fallback_urls_from_raw_submission(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            runs_dir = Path(tmpdir) / "runs"
-            run_dir = runs_dir / "20260216-ddd44444"
-            run_dir.mkdir(parents=True, exist_ok=True)
-
-            (run_dir / "submission.raw.json").write_text(
-                json.dumps(
-                    {
-                        "submission_id": "SIM-ENDO-FALLBACK",
-                        "journal_homepage_url": "https://journal.example",
-                        "source_urls": {
-                            "latest_content": [
-                                "https://journal.example/issue-1",
-                                "https://journal.example/issue-2",
-                            ],
-                            "archives": ["https://journal.example/archive"],
-                        },
-                    }
-                ),
-                encoding="utf-8",
-            )
-            (run_dir / "review-summary.json").write_text(
-                json.dumps(
-                    {
-                        "submission_id": "SIM-ENDO-FALLBACK",
-                        "overall_result": "fail",
-                        "checks": [
-                            {
-                                "rule_id": "doaj.endogeny.v1",
-                                "result": "fail",
-                                "notes": "Endogeny exceeds threshold.",
-                                "evidence_urls": [],
-                            }
-                        ],
-                        "supplementary_checks": [],
-                    }
-                ),
-                encoding="utf-8",
-            )
-
-            app = SimulationApp(ruleset_path=RULESET_PATH, runs_dir=runs_dir)
-            content = app.render_export_csv(limit=None)
-            rows = list(csv.DictReader(io.StringIO(content)))
-            self.assertEqual(len(rows), 1)
-            row = rows[0]
-
-            self.assertEqual(row["doaj.endogeny.v1"], "fail")
-            self.assertIn("https://journal.example/issue-1", row["doaj.endogeny.v1__problem_urls"])
-            self.assertIn("https://journal.example/archive", row["doaj.endogeny.v1__problem_urls"])
+        # Both flagged-result layouts share one runs_dir and one CSV render.
+        tmpdir = self._test_dir()
+        runs_dir = Path(tmpdir) / "runs"
+        run_dir = runs_dir / "20260216-ccc33333"
+        run_dir.mkdir(parents=True, exist_ok=True)
+        (run_dir / "submission.raw.json").write_bytes(_RAW_FLAGGED)
+        (run_dir / "review-summary.json").write_bytes(_SUMMARY_FLAGGED)
+
+        run_dir = runs_dir / "20260216-ddd44444"
+        run_dir.mkdir(parents=True, exist_ok=True)
+        (run_dir / "submission.raw.json").write_bytes(_RAW_ENDO)
+        (run_dir / "review-summary.json").write_bytes(_SUMMARY_ENDO)
+
+        app = SimulationApp(ruleset_path=RULESET_PATH, ruleset=_RULESET, runs_dir=runs_dir)
+        content = app.render_export_csv(limit=None)
+        idx, rows = _parse_csv(content)
+        self.assertEqual(len(rows), 2)
+        by_submission = {row[idx["submission_id"]]: row for row in rows}
+
+        with self.subTest("must and supplementary attention rules"):
+            row = by_submission["SIM-FLAGGED"]
+            self.assertEqual(row[idx["overall_result"]], "fail")
+            self.assertEqual(row[idx["overall_decision_reason"]], "At least one must-rule returned fail.")
+            self.assertEqual(row[idx["doaj.open_access_statement.v1"]], "need_human_review")
+            self.assertIn("Policy text is ambiguous.", row[idx["doaj.open_access_statement.v1__note"]])
+            self.assertIn("https://journal.example/open-access", row[idx["doaj.open_access_statement.v1__problem_urls"]])
+            self.assertEqual(row[idx["doaj.aims_scope.v1"]], "fail")
+            self.assertIn("https://journal.example/aims-scope", row[idx["doaj.aims_scope.v1__problem_urls"]])
+            self.assertIn("doaj.aims_scope.v1:fail", row[idx["must_attention_rules"]])
+            self.assertIn("doaj.open_access_statement.v1:need_human_review", row[idx["must_attention_rules"]])
+            self.assertIn("doaj.plagiarism_policy.v1:need_human_review", row[idx["supplementary_attention_rules"]])
+
+        with self.subTest("endogeny fallback urls from raw submission"):
+            row = by_submission["SIM-ENDO-FALLBACK"]
+            self.assertEqual(row[idx["doaj.endogeny.v1"]], "fail")
+            self.assertIn("https://journal.example/issue-1", row[idx["doaj.endogeny.v1__problem_urls"]])
+            self.assertIn("https://journal.example/archive", row[idx["doaj.endogeny.v1__problem_urls"]])
+
+    def test_export_csv_reparses_only_changed_run_files(self) -> None:
+        tmpdir = self._test_dir()
+        runs_dir = Path(tmpdir) / "runs"
+        run_dir = runs_dir / "20260216-eee55555"
+        run_dir.mkdir(parents=True, exist_ok=True)
+        (run_dir / "submission.raw.json").write_bytes(
+            _dump_json({"submission_id": "SIM-CACHE"}),
+        )
+        summary_file = run_dir / "review-summary.json"
+        summary_file.write_bytes(
+            _dump_json({"submission_id": "SIM-CACHE", "overall_result": "pass", "checks": []}),
+        )
+
+        app = SimulationApp(ruleset_path=RULESET_PATH, ruleset=_RULESET, runs_dir=runs_dir)
+        _, first = _parse_csv(app.render_export_csv(limit=None))
+        with patch.object(_files, "load_json", wraps=_files.load_json) as read_json:
+            _, second = _parse_csv(app.render_export_csv(limit=None))
+            self.assertEqual(read_json.call_count, 0)
+        self.assertEqual(first, second)
+
+        summary_file.write_bytes(
+            _dump_json({"submission_id": "SIM-CACHE", "overall_result": "fail", "checks": []}),
+        )
+        stat = summary_file.stat()
+        os.utime(summary_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        with patch.object(_files, "load_json", wraps=_files.load_json) as read_json:
+            idx, third = _parse_csv(app.render_export_csv(limit=None))
+            self.assertEqual(read_json.call_count, 1)
+        self.assertEqual(third[0][idx["overall_result"]], "fail")
 
 
 if __name__ == "__main__":
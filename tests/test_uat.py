@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+import os
 from pathlib import Path
 import tempfile
 import unittest
@@ -12,14 +14,13 @@ from doaj_reviewer.uat import (
 )
 
 
-class UATRunnerTests(unittest.TestCase):
-    def test_build_uat_scenarios_has_expected_targets(self) -> None:
-        import json
+with DEFAULT_BASE_SUBMISSION.open("r", encoding="utf-8") as _handle:
+    _BASE_SUBMISSION = json.load(_handle)
 
-        with DEFAULT_BASE_SUBMISSION.open("r", encoding="utf-8") as handle:
-            base_submission = json.load(handle)
 
-        scenarios = build_uat_scenarios(base_submission)
+class UATRunnerTests(unittest.TestCase):
+    def test_build_uat_scenarios_has_expected_targets(self) -> None:
+        scenarios = build_uat_scenarios(_BASE_SUBMISSION)
         self.assertEqual(len(scenarios), 3)
         expected = {item["expected_overall"] for item in scenarios}
         self.assertEqual(expected, {"pass", "need_human_review", "fail"})
@@ -30,16 +31,24 @@ class UATRunnerTests(unittest.TestCase):
             report = run_uat_scenarios(
                 output_dir=out_dir,
                 ruleset_path=DEFAULT_RULESET_PATH,
-                base_submission_path=DEFAULT_BASE_SUBMISSION,
+                base_submission=_BASE_SUBMISSION,
             )
             self.assertTrue(report["ok"])
             self.assertEqual(report["scenario_count"], 3)
             self.assertEqual(report["matched_count"], 3)
-            self.assertTrue((out_dir / "uat-report.json").exists())
-            self.assertTrue((out_dir / "uat-report.md").exists())
-            self.assertTrue((out_dir / "S1_PASS_BASELINE" / "review-summary.txt").exists())
-            self.assertTrue((out_dir / "S2_NEED_HUMAN_WAF" / "review-summary.json").exists())
-            self.assertTrue((out_dir / "S3_FAIL_REVIEWER_COMPOSITION" / "endogeny-result.json").exists())
+            out = os.fspath(out_dir)
+            self.assertTrue(os.path.exists(os.path.join(out, "uat-report.json")))
+            self.assertTrue(os.path.exists(os.path.join(out, "uat-report.md")))
+            self.assertTrue(os.path.exists(os.path.join(out, "S1_PASS_BASELINE", "review-summary.txt")))
+            self.assertTrue(os.path.exists(os.path.join(out, "S2_NEED_HUMAN_WAF", "review-summary.json")))
+            self.assertTrue(os.path.exists(os.path.join(out, "S3_FAIL_REVIEWER_COMPOSITION", "endogeny-result.json")))
+
+    def test_run_uat_scenarios_process_pool_matches_sequential_run(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sequential = run_uat_scenarios(output_dir=Path(tmpdir) / "seq", base_submission=_BASE_SUBMISSION)
+            parallel = run_uat_scenarios(output_dir=Path(tmpdir) / "par", base_submission=_BASE_SUBMISSION, max_workers=3)
+            self.assertEqual(parallel["rows"], sequential["rows"])
+            self.assertTrue(os.path.exists(os.path.join(tmpdir, "par", "S1_PASS_BASELINE", "review-summary.json")))
 
 
 if __name__ == "__main__":
@@ -1,74 +1,207 @@
 from __future__ import annotations
 
+from functools import lru_cache
+import ssl
+import sys
+from textwrap import dedent
+import threading
+from types import ModuleType
+from typing import Any
 import unittest
+from urllib.error import URLError
 from unittest.mock import patch
 
+from doaj_reviewer import web
 from doaj_reviewer.web import (
     ParsedDocument,
+    _decode_chunks,
+    _is_text_content_type,
+    _is_cert_verification_error,
     detect_waf_challenge,
     fetch_parsed_document_with_fallback,
+    clear_fetch_cache,
+    fetch_url,
+    fetch_url_playwright,
     needs_js_render,
     parse_html,
 )
 
 
+_SCRIPT_HEAVY_HTML = dedent(
+    """
+    <html>
+      <head><title>App Shell</title></head>
+      <body>
+        <div id="app"></div>
+        <script src="/static/a.js"></script>
+        <script src="/static/b.js"></script>
+        <script src="/static/c.js"></script>
+        <noscript>Please enable JavaScript.</noscript>
+      </body>
+    </html>
+    """
+).strip()
+_JS_SIGNALS_HTML = dedent(
+    """
+    <html>
+      <body>
+        <div id="root"></div>
+        <script src="/static/a.js"></script>
+        <script id="__NEXT_DATA__" type="application/json">{}</script>
+      </body>
+    </html>
+    """
+).strip()
+_CITATION_META_HTML = dedent(
+    """
+    <html>
+      <head>
+        <title>Article</title>
+        <meta name="citation_title" content="Sample Article"/>
+        <meta name="citation_author" content="Jane Doe"/>
+      </head>
+      <body>
+        <h1>Sample Article</h1>
+        <p>Plain text content.</p>
+      </body>
+    </html>
+    """
+).strip()
+_CF_CHALLENGE_HTML = dedent(
+    """
+    <html>
+      <head><title>Just a moment...</title></head>
+      <body>
+        <h1>Checking your browser before accessing example.org</h1>
+        <p>Please enable JavaScript and Cookies.</p>
+        <div>Ray ID: 8abced1234</div>
+      </body>
+    </html>
+    """
+).strip()
+_OPEN_ACCESS_POLICY_HTML = dedent(
+    """
+    <html>
+      <head><title>Open Access Policy</title></head>
+      <body>
+        <h1>Open Access Policy</h1>
+        <p>All articles are available without charge and distributed under CC BY.</p>
+        <p>The policy also explains usage rights and archiving routes.</p>
+      </body>
+    </html>
+    """
+).strip()
+
+# (name, url, html, expected needs_js_render)
+_JS_RENDER_CASES = (
+    ("script-heavy shell", "https://example.org", _SCRIPT_HEAVY_HTML, True),
+    ("citation meta page", "https://example.org/article/1", _CITATION_META_HTML, False),
+)
+# (name, url, status_code, html, expected blocked, expected provider)
+_WAF_CASES = (
+    ("cloudflare challenge", "https://example.org/policy", 503, _CF_CHALLENGE_HTML, True, "cloudflare"),
+    ("normal policy page", "https://example.org/open-access", 200, _OPEN_ACCESS_POLICY_HTML, False, ""),
+)
+
+
+def _make_doc(**overrides: Any) -> ParsedDocument:
+    # Fresh defaults per call; override only the fields a test cares about.
+    fields: dict[str, Any] = {
+        "url": "https://example.org/policy",
+        "status_code": 200,
+        "content_type": "text/html",
+        "title": "",
+        "text": "",
+        "links": [],
+        "meta": {},
+        "raw_html": "",
+    }
+    fields.update(overrides)
+    return ParsedDocument(**fields)
+
+
+def _raise_static_failure(*_args: Any, **_kwargs: Any) -> ParsedDocument:
+    raise RuntimeError("static failed")
+
+
+class _FakeBrowser:
+    def __init__(self, connected: bool = True) -> None:
+        self.connected = connected
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def close(self) -> None:
+        self.connected = False
+
+
+class _FakePage:
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+    def goto(self, url: str, **_kwargs: Any) -> None:
+        raise self.error
+
+    def close(self) -> None:
+        pass
+
+
+class _FakeContext:
+    def __init__(self, page: _FakePage | None = None, error: Exception | None = None) -> None:
+        self.page = page
+        self.error = error
+
+    def new_page(self) -> _FakePage | None:
+        if self.error is not None:
+            raise self.error
+        return self.page
+
+    def close(self) -> None:
+        pass
+
+
+class _FakeHttpxClient:
+    def close(self) -> None:
+        pass
+
+
+_FAKE_SYNC_API = ModuleType("playwright.sync_api")
+_FAKE_SYNC_API.sync_playwright = None  # type: ignore[attr-defined]
+
+
+# Parsed (and WAF-checked) once per fixture and shared across tests, so tests must not mutate the results.
+@lru_cache(maxsize=None)
+def _parse(url: str, status_code: int, html: str) -> ParsedDocument:
+    return parse_html(url=url, status_code=status_code, content_type="text/html", html=html)
+
+
+@lru_cache(maxsize=None)
+def _detect(url: str, status_code: int, html: str) -> dict[str, Any]:
+    return detect_waf_challenge(_parse(url, status_code, html))
+
+
 class WebHeuristicTests(unittest.TestCase):
-    def test_needs_js_render_true_for_script_heavy_shell(self) -> None:
-        html = """
-        <html>
-          <head><title>App Shell</title></head>
-          <body>
-            <div id="app"></div>
-            <script src="/static/a.js"></script>
-            <script src="/static/b.js"></script>
-            <script src="/static/c.js"></script>
-            <noscript>Please enable JavaScript.</noscript>
-          </body>
-        </html>
-        """
-        doc = parse_html(
-            url="https://example.org",
-            status_code=200,
-            content_type="text/html",
-            html=html,
-        )
-        self.assertTrue(needs_js_render(doc))
+    def test_needs_js_render(self) -> None:
+        for name, url, html, expected in _JS_RENDER_CASES:
+            with self.subTest(name):
+                self.assertEqual(needs_js_render(_parse(url, 200, html)), expected)
 
-    def test_needs_js_render_false_for_citation_meta_page(self) -> None:
-        html = """
-        <html>
-          <head>
-            <title>Article</title>
-            <meta name="citation_title" content="Sample Article"/>
-            <meta name="citation_author" content="Jane Doe"/>
-          </head>
-          <body>
-            <h1>Sample Article</h1>
-            <p>Plain text content.</p>
-          </body>
-        </html>
-        """
-        doc = parse_html(
-            url="https://example.org/article/1",
-            status_code=200,
-            content_type="text/html",
-            html=html,
-        )
-        self.assertFalse(needs_js_render(doc))
+    def test_parse_html_records_js_render_signals(self) -> None:
+        doc = _parse("https://example.org", 200, _JS_SIGNALS_HTML)
+        self.assertEqual(doc.script_count, 2)
+        self.assertTrue(doc.has_root_mount)
+        self.assertTrue(doc.has_js_hint)
+        self.assertTrue(needs_js_render(doc))
 
     def test_auto_mode_uses_playwright_when_static_fetch_fails(self) -> None:
-        dynamic = ParsedDocument(
-            url="https://example.org/policy",
-            status_code=200,
+        dynamic = _make_doc(
             content_type="text/html; renderer=playwright",
             title="Policy",
             text="Open access policy text with license terms.",
-            links=[],
-            meta={},
             raw_html="<html></html>",
         )
-        with patch("doaj_reviewer.web.fetch_parsed_document", side_effect=RuntimeError("static failed")):
-            with patch("doaj_reviewer.web.fetch_parsed_document_playwright", return_value=dynamic):
+        with patch.object(web, "fetch_parsed_document", new=_raise_static_failure):
+            with patch.object(web, "fetch_parsed_document_playwright", new=lambda *_a, **_k: dynamic):
                 doc = fetch_parsed_document_with_fallback(
                     url="https://example.org/policy",
                     timeout_seconds=20,
@@ -78,28 +211,20 @@ class WebHeuristicTests(unittest.TestCase):
         self.assertEqual(doc.status_code, 200)
 
     def test_auto_mode_prefers_playwright_for_http_error_static_doc(self) -> None:
-        static_doc = ParsedDocument(
-            url="https://example.org/policy",
+        static_doc = _make_doc(
             status_code=403,
-            content_type="text/html",
             title="Forbidden",
             text="Access denied",
-            links=[],
-            meta={},
             raw_html="<html><body>Access denied</body></html>",
         )
-        dynamic_doc = ParsedDocument(
-            url="https://example.org/policy",
-            status_code=200,
+        dynamic_doc = _make_doc(
             content_type="text/html; renderer=playwright",
             title="Policy Page",
             text="Peer review policy and editorial process with open access license details.",
-            links=[],
-            meta={},
             raw_html="<html><body>Policy Page</body></html>",
         )
-        with patch("doaj_reviewer.web.fetch_parsed_document", return_value=static_doc):
-            with patch("doaj_reviewer.web.fetch_parsed_document_playwright", return_value=dynamic_doc):
+        with patch.object(web, "fetch_parsed_document", new=lambda *_a, **_k: static_doc):
+            with patch.object(web, "fetch_parsed_document_playwright", new=lambda *_a, **_k: dynamic_doc):
                 doc = fetch_parsed_document_with_fallback(
                     url="https://example.org/policy",
                     timeout_seconds=20,
@@ -108,46 +233,149 @@ class WebHeuristicTests(unittest.TestCase):
         self.assertEqual(doc.status_code, 200)
         self.assertEqual(doc.title, "Policy Page")
 
-    def test_detect_waf_cloudflare_challenge(self) -> None:
-        html = """
-        <html>
-          <head><title>Just a moment...</title></head>
-          <body>
-            <h1>Checking your browser before accessing example.org</h1>
-            <p>Please enable JavaScript and Cookies.</p>
-            <div>Ray ID: 8abced1234</div>
-          </body>
-        </html>
-        """
-        doc = parse_html(
-            url="https://example.org/policy",
-            status_code=503,
-            content_type="text/html",
-            html=html,
-        )
-        detection = detect_waf_challenge(doc)
-        self.assertTrue(detection["blocked"])
-        self.assertEqual(detection["provider"], "cloudflare")
-
-    def test_detect_waf_false_for_normal_policy_page(self) -> None:
-        html = """
-        <html>
-          <head><title>Open Access Policy</title></head>
-          <body>
-            <h1>Open Access Policy</h1>
-            <p>All articles are available without charge and distributed under CC BY.</p>
-            <p>The policy also explains usage rights and archiving routes.</p>
-          </body>
-        </html>
-        """
-        doc = parse_html(
-            url="https://example.org/open-access",
-            status_code=200,
-            content_type="text/html",
-            html=html,
-        )
-        detection = detect_waf_challenge(doc)
-        self.assertFalse(detection["blocked"])
+    def test_detect_waf_challenge(self) -> None:
+        for name, url, status_code, html, blocked, provider in _WAF_CASES:
+            with self.subTest(name):
+                detection = _detect(url, status_code, html)
+                self.assertEqual(detection["blocked"], blocked)
+                if provider:
+                    self.assertEqual(detection["provider"], provider)
+
+    def test_fetch_url_reuses_pooled_client_and_caps_body(self) -> None:
+        class _FakeResponse:
+            status_code = 200
+            headers = {"Content-Type": "text/html; charset=utf-8"}
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def iter_bytes(self):
+                yield b"<html>" + b"a" * 20
+                yield b"b" * 20
+
+        class _FakeClient:
+            def __init__(self) -> None:
+                self.urls: list[str] = []
+
+            def stream(self, method, url, timeout):
+                self.urls.append(url)
+                return _FakeResponse()
+
+        client = _FakeClient()
+        with patch("doaj_reviewer.web._httpx_client", return_value=client):
+            first = fetch_url("https://example.org/a", max_bytes=10)
+            second = fetch_url("https://example.org/b", max_bytes=10)
+        self.assertEqual(first, (200, "text/html; charset=utf-8", "<html>aaaa"))
+        self.assertEqual(second[0], 200)
+        self.assertEqual(client.urls, ["https://example.org/a", "https://example.org/b"])
+
+    def test_httpx_client_is_built_once_across_threads(self) -> None:
+        built: list[object] = []
+
+        class _FakeHttpx:
+            @staticmethod
+            def Limits(**_kwargs: Any) -> None:
+                return None
+
+            @staticmethod
+            def Client(**_kwargs: Any) -> object:
+                client = _FakeHttpxClient()
+                built.append(client)
+                return client
+
+        self.addCleanup(web.close_session)
+        web.close_session()
+        barrier = threading.Barrier(8)
+        clients: list[object] = []
+
+        def _get_client() -> None:
+            barrier.wait()
+            clients.append(web._httpx_client())
+
+        with patch.object(web, "_httpx_module", new=lambda: _FakeHttpx):
+            threads = [threading.Thread(target=_get_client) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(len(built), 1)
+        self.assertTrue(all(client is built[0] for client in clients))
+
+    def test_missing_httpx_is_probed_once(self) -> None:
+        web._httpx_module.cache_clear()
+        self.addCleanup(web._httpx_module.cache_clear)
+        with patch.dict(sys.modules, {"httpx": None}):
+            self.assertIsNone(web._httpx_client())
+            self.assertIsNone(web._httpx_client())
+        self.assertEqual(web._httpx_module.cache_info().misses, 1)
+
+    def test_fetch_url_cache_is_opt_in(self) -> None:
+        clear_fetch_cache()
+        self.addCleanup(clear_fetch_cache)
+        with patch(
+            "doaj_reviewer.web._fetch_url_uncached",
+            return_value=(200, "text/html", "<html></html>"),
+        ) as live_fetch:
+            with patch.dict("os.environ", {"DOAJ_REVIEWER_FETCH_CACHE": ""}):
+                fetch_url("https://example.org/policy")
+                fetch_url("https://example.org/policy")
+            self.assertEqual(live_fetch.call_count, 2)
+
+            with patch.dict("os.environ", {"DOAJ_REVIEWER_FETCH_CACHE": "1"}):
+                fetch_url("https://example.org/policy")
+                fetch_url("https://example.org/policy")
+            self.assertEqual(live_fetch.call_count, 3)
+
+    def test_decode_chunks_handles_split_multibyte_and_cap(self) -> None:
+        chunks = [b"caf\xc3", b"\xa9 ", b"ignored"]
+        self.assertEqual(_decode_chunks(chunks, "text/html; charset=utf-8", max_bytes=6), "café ")
+        self.assertEqual(_decode_chunks([b"\xe9t\xe9"], "text/html; charset=latin-1", max_bytes=100), "été")
+        self.assertEqual(_decode_chunks([b"ok"], "text/html; charset=unknown-enc", max_bytes=100), "ok")
+
+    def test_decode_chunks_sniffs_bom_and_meta_charset(self) -> None:
+        self.assertEqual(_decode_chunks([b"\xef\xbb\xbfcaf\xc3\xa9"], "text/html", max_bytes=100), "café")
+        html = b'<html><head><meta charset="iso-8859-1"></head><body>\xe9t\xe9</body></html>'
+        self.assertIn("été", _decode_chunks([html], "text/html", max_bytes=1000))
+        self.assertIn("\ufffd", _decode_chunks([html], "text/html; charset=utf-8", max_bytes=1000))
+
+    def test_is_cert_verification_error_checks_types_before_text(self) -> None:
+        self.assertTrue(_is_cert_verification_error(URLError(ssl.SSLCertVerificationError("bad cert"))))
+        self.assertTrue(_is_cert_verification_error(URLError(ssl.SSLError("[SSL: CERTIFICATE_VERIFY_FAILED]"))))
+        self.assertFalse(_is_cert_verification_error(URLError(ConnectionRefusedError("refused"))))
+        self.assertTrue(_is_cert_verification_error(RuntimeError("Certificate verify failed: self signed")))
+        self.assertFalse(_is_cert_verification_error(RuntimeError("timed out")))
+
+    def test_is_text_content_type_skips_binary_payloads(self) -> None:
+        for content_type in ("", "text/html; charset=utf-8", "application/xhtml+xml", "application/json"):
+            self.assertTrue(_is_text_content_type(content_type), content_type)
+        for content_type in ("application/pdf", "image/png", "application/zip"):
+            self.assertFalse(_is_text_content_type(content_type), content_type)
+
+
+class PlaywrightSessionTests(unittest.TestCase):
+    def _fetch_with_state(self, context: _FakeContext, browser: _FakeBrowser) -> dict[str, Any]:
+        state = {"context": context, "browser": browser}
+        with patch.dict(sys.modules, {"playwright": ModuleType("playwright"), "playwright.sync_api": _FAKE_SYNC_API}):
+            with patch.dict(web._PLAYWRIGHT_STATE, state, clear=True):
+                with self.assertRaises(Exception):
+                    fetch_url_playwright("https://example.org/policy")
+                return dict(web._PLAYWRIGHT_STATE)
+
+    def test_dead_context_is_dropped_when_new_page_fails(self) -> None:
+        context = _FakeContext(error=RuntimeError("Target page, context or browser has been closed"))
+        self.assertEqual(self._fetch_with_state(context, _FakeBrowser()), {})
+
+    def test_page_timeout_keeps_live_shared_browser(self) -> None:
+        context = _FakeContext(page=_FakePage(TimeoutError("Timeout 20000ms exceeded")))
+        remaining = self._fetch_with_state(context, _FakeBrowser())
+        self.assertIs(remaining["context"], context)
+
+    def test_disconnected_browser_is_dropped_after_goto_failure(self) -> None:
+        context = _FakeContext(page=_FakePage(RuntimeError("navigation failed")))
+        self.assertEqual(self._fetch_with_state(context, _FakeBrowser(connected=False)), {})
 
 
 if __name__ == "__main__":